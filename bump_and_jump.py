@@ -4,12 +4,62 @@
 # August 2025
 #################################################################################################
 
-import pygame, sys, time, random, math
+import time
+import_start = time.perf_counter()  # Startup timings count from here, before pygame is imported
+
+import os, sys, random, math, json, hashlib, inspect, mmap, multiprocessing
+# Importing pygame also imports its array modules, and NumPy with them (~100 ms before the title
+# screen). They are held back like pygame does without NumPy, load_numpy() imports them for real
+held_back = [name for name in ("pygame.surfarray", "pygame.sndarray") if name not in sys.modules]
+sys.modules.update(dict.fromkeys(held_back))
+import pygame
+for name in held_back:
+    del sys.modules[name]
+from collections import OrderedDict, deque
+from itertools import count
+from operator import attrgetter
 from pygame.locals import *
 
-pygame.init()
-screen = pygame.display.set_mode((600, 800))
-pygame.display.set_caption('BUMP N JUMP')
+np = None  # NumPy, optional: the batched road lookups and particles use it once load_numpy() ran
+numpy_checked = False
+
+def load_numpy():
+    """Import NumPy into np, and pygame's array modules, on first use, returns np, None when not installed"""
+    global np, numpy_checked
+    if not numpy_checked:
+        numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            return None
+        import pygame.surfarray, pygame.sndarray
+        np = numpy
+        mark_startup("numpy")
+    return np
+
+# Startup timing
+# Importing the module sets nothing up. main() opens the display on demand through get_screen(),
+# which starts only the display subsystem (not mixer, joystick etc). Fonts, sprites and atlases
+# are built the first time they are drawn, and NumPy is imported by the first road table or
+# particle system, or behind the title screen, whichever comes first. startup_marks records when each startup step finished,
+# and the report (BNJ_STARTUP_STATS=1, or --bench-startup) shows the time to the first frame.
+startup_marks = OrderedDict([("imports", time.perf_counter() - import_start)])
+
+def mark_startup(step):
+    startup_marks[step] = time.perf_counter() - import_start
+
+def mark_first_frame():
+    if "first frame" not in startup_marks:
+        mark_startup("first frame")
+
+def startup_report():
+    steps = []
+    previous = 0.0
+    for step, elapsed in startup_marks.items():
+        steps.append(f"{step} {(elapsed - previous) * 1000:.1f} ms")
+        previous = elapsed
+    total = f", {startup_marks['first frame'] * 1000:.1f} ms to first frame" if "first frame" in startup_marks else ""
+    return "startup: " + ", ".join(steps) + total
 
 # Create car icon for the window
 def create_car_icon():
@@ -44,10 +94,6 @@ def create_car_icon():
     
     return icon_surface
 
-# Set the window icon
-car_icon = create_car_icon()
-pygame.display.set_icon(car_icon)
-
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -79,178 +125,615 @@ CAR_COLORS = [
     (128, 0, 128), (0, 128, 255)
 ]
 
-screen.fill(BLACK)
+SCREEN_SIZE = (600, 800)
+screen = None  # The display surface, opened by get_screen()
+
+def get_screen(headless=False):
+    """Open the game window the first time it is needed, headless uses SDL's dummy video driver"""
+    global screen
+    if screen is None:
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        screen = pygame.display.set_mode(SCREEN_SIZE)
+        pygame.display.set_caption('BUMP N JUMP')
+        pygame.display.set_icon(create_car_icon())
+        screen.fill(BLACK)
+        mark_startup("display")
+    return screen
+
+# Font registry and rendered-text cache
+# SysFont lookups are slow, so each (face, size, bold) font is built once and shared. Rendered
+# text surfaces are kept in a bounded LRU cache so static labels are only rendered once.
+TEXT_CACHE_SIZE = 256
+
+fonts = {}
+text_cache = OrderedDict()
+text_cache_stats = {"hits": 0, "misses": 0}
+
+def get_font(size, bold=False, face="monospace"):
+    """Return the shared font for (face, size, bold), building it on first use"""
+    key = (face, size, bold)
+    font = fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(face, size, bold=bold)
+        fonts[key] = font
+    return font
+
+def render_text(text, color, size, bold=False, face="monospace"):
+    """Render text with a registry font, reusing the surface if it was rendered recently"""
+    key = (text, tuple(color), (face, size, bold))
+    surface = text_cache.get(key)
+    if surface is not None:
+        text_cache.move_to_end(key)
+        text_cache_stats["hits"] += 1
+        return surface
+
+    text_cache_stats["misses"] += 1
+    surface = get_font(size, bold, face).render(text, 1, color)
+    text_cache[key] = surface
+    if len(text_cache) > TEXT_CACHE_SIZE:
+        text_cache.popitem(last=False)  # Evict least recently used
+    return surface
+
+# Texture atlas
+# Baked sprites (cars, props, scenery, bridge pieces, HUD glyph strips) are packed into a few large
+# pages in the display's pixel format and handed out as subsurfaces, so every blit reads from a
+# converted surface. Sprites whose alpha is all-or-nothing go to colorkey pages with RLE
+# acceleration; antialiased ones go to per-pixel alpha pages. Before the display exists
+# the pages stay in their plain formats. --bench-blit compares blit speed per format.
+ATLAS_PAGE_SIZE = 1024
+ATLAS_COLORKEY = (1, 2, 3)  # Never used by the artwork, checked per sprite
+ATLAS_PADDING = 1
+
+display_alpha_format = None
+
+def get_display_alpha_format():
+    """1x1 surface in the format convert_alpha() picks for this display"""
+    global display_alpha_format
+    if display_alpha_format is None:
+        display_alpha_format = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    return display_alpha_format
+
+class AtlasPage:
+    def __init__(self, kind, width=ATLAS_PAGE_SIZE, height=ATLAS_PAGE_SIZE):
+        self.kind = kind
+        self.width = width
+        self.height = height
+        # Pages are created straight in the display's formats rather than converted, which would
+        # allocate and copy a whole page twice (pages can be made mid-game by the stage warmup)
+        display = pygame.display.get_surface()
+        if kind == "alpha":
+            if display is not None:
+                self.surface = pygame.Surface((width, height), pygame.SRCALPHA, get_display_alpha_format())
+            else:
+                self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.surface.fill((0, 0, 0, 0))
+        else:
+            if display is not None:
+                self.surface = pygame.Surface((width, height), 0, display)
+            else:
+                self.surface = pygame.Surface((width, height))
+            self.surface.fill(ATLAS_COLORKEY)
+            self.surface.set_colorkey(ATLAS_COLORKEY, pygame.RLEACCEL)
+        # Shelf packing: sprites fill rows left to right. Each sprite goes on the lowest shelf it fits
+        # on, so thin bridge strips don't end up on shelves as tall as a car
+        self.shelves = []  # [y, height, next free x]
+        self.free_y = 0  # Top of the space below the last shelf
+        self.used_area = 0
+    
+    def place(self, width, height):
+        """Reserve a width x height rect on the page, or None if it is full"""
+        if width > self.width:
+            return None
+        best = None
+        for shelf in self.shelves:
+            if shelf[1] >= height and shelf[2] + width <= self.width and (best is None or shelf[1] < best[1]):
+                best = shelf
+        if (best is None or best[1] > 2 * height) and self.free_y + height <= self.height:
+            # Nothing fits snugly, open a new shelf as tall as this sprite
+            best = [self.free_y, height, 0]
+            self.shelves.append(best)
+            self.free_y += height + ATLAS_PADDING
+        if best is None:
+            return None
+        rect = pygame.Rect(best[2], best[0], width, height)
+        best[2] += width + ATLAS_PADDING
+        self.used_area += width * height
+        return rect
+
+class TextureAtlas:
+    def __init__(self):
+        self.pages = []
+        self.regions = 0
+    
+    def add(self, surface):
+        """Copy a sprite into a page and return the subsurface that now holds it"""
+        kind = "key" if has_binary_alpha(surface) else "alpha"
+        width, height = surface.get_size()
+        rect = None
+        for page in self.pages:
+            if page.kind == kind:
+                rect = page.place(width, height)
+                if rect is not None:
+                    break
+        if rect is None:
+            # Sprites bigger than a page get a page of their own
+            page = AtlasPage(kind, max(width, ATLAS_PAGE_SIZE), max(height, ATLAS_PAGE_SIZE))
+            self.pages.append(page)
+            rect = page.place(width, height)
+        
+        if kind == "alpha":
+            # Max against the cleared page copies color and alpha exactly instead of blending
+            page.surface.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            page.surface.blit(surface, rect)
+        region = page.surface.subsurface(rect)
+        if kind == "key":
+            region.set_colorkey(ATLAS_COLORKEY, pygame.RLEACCEL)
+        self.regions += 1
+        return region
+    
+    def stats(self):
+        return {"pages": len(self.pages), "regions": self.regions,
+                "key_pages": sum(page.kind == "key" for page in self.pages),
+                "fill": round(sum(page.used_area for page in self.pages) /
+                              max(1, sum(page.width * page.height for page in self.pages)), 3)}
+
+def benchmark_blit_formats(blits=20000):
+    """Blit one car sprite in each pixel format and report blits per millisecond"""
+    screen = get_screen()
+    source = new_art_surface(72, CAR_SPRITE_HEIGHT)
+    draw_car_topdown(source, CAR_SPRITE_PAD_X, CAR_SPRITE_PAD_Y, RED, "enemy", 1.0)
+    colorkey = source.convert()
+    colorkey.fill(ATLAS_COLORKEY)
+    colorkey.blit(source, (0, 0))
+    colorkey.set_colorkey(ATLAS_COLORKEY)
+    colorkey_rle = colorkey.copy()
+    colorkey_rle.set_colorkey(ATLAS_COLORKEY, pygame.RLEACCEL)
+    formats = [
+        ("SRCALPHA, not converted", source),
+        ("convert_alpha()", source.convert_alpha()),
+        ("convert() + colorkey", colorkey),
+        ("convert() + colorkey + RLE", colorkey_rle),
+        ("atlas region", TextureAtlas().add(source)),
+    ]
+    target = pygame.Surface(screen.get_size()).convert()
+    positions = [((i * 37) % 520, (i * 53) % 720) for i in range(blits)]
+    print(f"{blits} car sprite blits per format:")
+    results = {}
+    for name, surface in formats:
+        target.blit(surface, (0, 0))  # Let RLE encode before timing
+        start = time.perf_counter()
+        for pos in positions:
+            target.blit(surface, pos)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        results[name] = blits / elapsed_ms
+        print(f"  {name:28s} {results[name]:8.1f} blits/ms")
+    return results
+
+def has_binary_alpha(surface):
+    """True if every pixel is fully opaque or fully transparent and none uses ATLAS_COLORKEY"""
+    if surface.get_flags() & pygame.SRCALPHA:
+        if pygame.mask.from_surface(surface, 0).count() != pygame.mask.from_surface(surface, 254).count():
+            return False
+    key_pixels = pygame.mask.from_threshold(surface, ATLAS_COLORKEY + (255,), (1, 1, 1, 1))
+    return key_pixels.count() == 0
+
+texture_atlas = TextureAtlas()
+
+# HUD glyph atlas
+# Score, fuel and speed change almost every frame, so the text cache misses on them and SDL_ttf
+# renders the whole string again. Each HUD font and color instead gets one strip of glyph cells,
+# pre-blended onto the HUD background so they are opaque and blit as plain copies. A field
+# already on screen is then updated by blitting only the cells whose character changed (usually
+# the last digit or two) in one Surface.blits call. A cell is its glyph's advance wide, so glyphs
+# whose ink reaches outside it (bold A, K, R, V, W, X and Y in the HUD font) are left out, and
+# text using them goes through the text cache instead.
+GLYPH_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ :+-!"
+
+glyph_atlases = {}
+
+class GlyphAtlas:
+    def __init__(self, color, size, bold=False, face="monospace", background=BLACK):
+        font = get_font(size, bold, face)
+        self.height = font.get_height()
+        self.background = background
+        self.advances = {}
+        # metrics is (min_x, max_x, min_y, max_y, advance), None for a glyph the font lacks
+        chars = [char for char, metrics in zip(GLYPH_CHARS, font.metrics(GLYPH_CHARS))
+                 if metrics is not None and metrics[0] >= 0 and metrics[1] <= metrics[4]]
+        
+        # Blended over the background exactly as font.render text is when blitted onto the HUD
+        strip = pygame.Surface((sum(font.size(char)[0] for char in chars), self.height))
+        strip.fill(background)
+        self.areas = {}  # Per glyph: its cell in the strip
+        x = 0
+        for char in chars:
+            advance = font.size(char)[0]
+            strip.blit(font.render(char, 1, color), (x, 0))
+            self.areas[char] = pygame.Rect(x, 0, advance, self.height)
+            self.advances[char] = advance
+            x += advance
+        self.surface = texture_atlas.add(strip)
+    
+    def can_draw(self, text):
+        areas = self.areas
+        return all(char in areas for char in text)
+    
+    def draw(self, target, text, pos, old_text=""):
+        """Blit the cells of text at pos, skipping those where old_text (already drawn at pos) has the
+        same glyph. Returns the rect that changed, or None"""
+        x, y = pos
+        old_x = x
+        surface = self.surface
+        areas = self.areas
+        advances = self.advances
+        blit_sequence = []
+        left = right = None
+        for i, char in enumerate(text):
+            if i >= len(old_text) or old_text[i] != char or old_x != x:
+                blit_sequence.append((surface, (x, y), areas[char]))
+                if left is None:
+                    left = x
+                right = x + advances[char]
+            if i < len(old_text):
+                old_x += advances[old_text[i]]
+            x += advances[char]
+        
+        # Clear what is left of a longer old text
+        old_end = old_x + sum(advances[char] for char in old_text[len(text):])
+        if old_end > x:
+            target.fill(self.background, (x, y, old_end - x, self.height))
+            left = x if left is None else left
+            right = old_end
+        target.blits(blit_sequence, 0)
+        return None if left is None else pygame.Rect(left, y, right - left, self.height)
+
+def get_glyph_atlas(color, size, bold=False, face="monospace"):
+    key = (tuple(color), face, size, bold)
+    atlas = glyph_atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(color, size, bold, face)
+        glyph_atlases[key] = atlas
+    return atlas
+
+def benchmark_hud_text(frames=600):
+    """Compare font.render, the text cache and the glyph atlas for the HUD number fields over an
+    autopilot run, each drawing into its own HUD layer"""
+    get_screen()  # The glyph strips are only in the display format once the display is open
+    font = get_font(14, bold=True)
+    fields = []
+    state = GameState(seed=1)
+    for frame in range(frames):
+        state.step(autopilot_inputs(state))
+        fields.append([("score", "SCORE: ", str(state.score), WHITE, (10, 10), (0, 0, 200, 30)),
+                       ("hiscore", "HI SCORE: ", str(state.hiscore), YELLOW, (200, 10), (200, 0, 200, 30)),
+                       ("fuel", "FUEL: ", str(max(0, round(state.fuel))), GREEN, (10, 35), (0, 30, 200, 25)),
+                       ("speed", "SPEED: ", str(int(state.player.speed)), WHITE, (400, 35), (400, 30, 200, 25))])
+    get_glyph_atlas(WHITE, 14, bold=True)  # Build the strips outside the timed loops
+    get_glyph_atlas(YELLOW, 14, bold=True)
+    get_glyph_atlas(GREEN, 14, bold=True)
+    
+    hud = HudLayer()
+    start = time.perf_counter()
+    for frame_fields in fields:
+        hud.begin_frame()
+        for name, label, text, color, pos, clear_rect in frame_fields:
+            if hud.field_changed(name, text, clear_rect):
+                hud.surface.blit(font.render(label + text, 1, color), pos)
+    render_ms = (time.perf_counter() - start) * 1000 / frames
+    
+    hud = HudLayer()
+    hits = text_cache_stats["hits"]
+    start = time.perf_counter()
+    for frame_fields in fields:
+        hud.begin_frame()
+        for name, label, text, color, pos, clear_rect in frame_fields:
+            if hud.field_changed(name, text, clear_rect):
+                hud.surface.blit(render_text(label + text, color, 14, bold=True), pos)
+    cache_ms = (time.perf_counter() - start) * 1000 / frames
+    hit_rate = (text_cache_stats["hits"] - hits) / max(1, hud.total_fields_rendered)
+    
+    hud = HudLayer()
+    start = time.perf_counter()
+    for frame_fields in fields:
+        hud.begin_frame()
+        for name, label, text, color, pos, clear_rect in frame_fields:
+            hud.glyph_field(name, label, text, color, pos, clear_rect)
+    glyph_ms = (time.perf_counter() - start) * 1000 / frames
+    
+    print(f"HUD number fields over {frames} frames of an autopilot run:")
+    print(f"  font.render path: {render_ms:.4f} ms/frame")
+    print(f"  text cache path:  {cache_ms:.4f} ms/frame ({hit_rate:.0%} hits, speedup {render_ms / cache_ms:.2f}x)")
+    print(f"  glyph atlas path: {glyph_ms:.4f} ms/frame (speedup {render_ms / glyph_ms:.2f}x)")
+    return render_ms, cache_ms, glyph_ms
+
+# HUD layer
+# The HUD is kept on its own 600x80 surface. Each field remembers the value it was last drawn
+# with and is only re-rendered when that value changes, then the whole layer is blitted once.
+# The areas of the fields redrawn in a frame are kept in changed for the dirty rects. The number
+# fields go through glyph_field, which redraws only the glyphs that changed.
+class HudLayer:
+    def __init__(self):
+        self.surface = pygame.Surface((600, 80))
+        self.surface.fill(BLACK)
+        self.values = {}
+        self.fields_rendered = 0  # Fields re-rendered in the most recent frame
+        self.total_fields_rendered = 0
+        self.frames = 0
+        self.changed = []  # Layer (and screen) rects of those fields
+    
+    def begin_frame(self):
+        self.frames += 1
+        self.fields_rendered = 0
+        self.changed = []
+    
+    def field_changed(self, name, value, clear_rect):
+        """Return True (and clear the field's area) if the field must be re-rendered"""
+        if name in self.values and self.values[name] == value:
+            return False
+        self.values[name] = value
+        self.surface.fill(BLACK, clear_rect)
+        self.changed.append(clear_rect)
+        self.fields_rendered += 1
+        self.total_fields_rendered += 1
+        return True
+    
+    def glyph_field(self, name, label, text, color, pos, clear_rect):
+        """Draw label + text in the HUD font, from the glyph atlas when it can
+        
+        The first draw, or a new label or color, clears the field and draws it whole. After that
+        only the glyphs of text that changed are blitted over the old ones."""
+        old = self.values.get(name)
+        if old is not None and old[:3] == (label, text, color):
+            return
+        self.fields_rendered += 1
+        self.total_fields_rendered += 1
+        atlas = get_glyph_atlas(color, 14, bold=True)
+        if old is not None and old[0] == label and old[2] == color and old[3] is not None and atlas.can_draw(text):
+            self.values[name] = (label, text, color, old[3])
+            rect = atlas.draw(self.surface, text, old[3], old[1])
+            if rect is not None:
+                self.changed.append(rect)
+            return
+        
+        self.surface.fill(BLACK, clear_rect)
+        self.changed.append(clear_rect)
+        if atlas.can_draw(text):
+            label_text = render_text(label, color, 14, bold=True)
+            self.surface.blit(label_text, pos)
+            text_pos = (pos[0] + label_text.get_width(), pos[1])
+            atlas.draw(self.surface, text, text_pos)
+        else:
+            self.surface.blit(render_text(label + text, color, 14, bold=True), pos)
+            text_pos = None  # Not made of cells, redraw whole next time
+        self.values[name] = (label, text, color, text_pos)
+
+hud_layer = None
+
+def get_hud_layer():
+    global hud_layer
+    if hud_layer is None:
+        hud_layer = HudLayer()
+    return hud_layer
 
 def print_hud(score, fuel, stage, hiscore, speed, lives, jump_cooldown=0, jump_cooldown_max=300):
-    # Clear top area
-    pygame.draw.rect(screen, BLACK, (0, 0, 600, 80))
+    hud = get_hud_layer()
+    hud.begin_frame()
+    layer = hud.surface
     
-    font = pygame.font.SysFont("monospace", 14, bold=True)
     # First row
-    scoretext = font.render("SCORE: " + str(score), 1, WHITE)
-    screen.blit(scoretext, (10, 10))
+    hud.glyph_field("score", "SCORE: ", str(score), WHITE, (10, 10), (0, 0, 200, 30))
+    hud.glyph_field("hiscore", "HI SCORE: ", str(hiscore), YELLOW, (200, 10), (200, 0, 200, 30))
     
-    hiscoretext = font.render("HI SCORE: " + str(hiscore), 1, YELLOW)
-    screen.blit(hiscoretext, (200, 10))
-    
-    stagetext = font.render("STAGE: " + str(stage), 1, CYAN)
-    screen.blit(stagetext, (400, 10))
+    if hud.field_changed("stage", stage, (400, 0, 200, 30)):
+        layer.blit(render_text("STAGE: " + str(stage), CYAN, 14, bold=True), (400, 10))
     
     # Second row
     fuel_display = max(0, round(fuel))  # Ensure fuel display matches game logic
-    fueltext = font.render("FUEL: " + str(fuel_display), 1, GREEN if fuel > 20 else RED)
-    screen.blit(fueltext, (10, 35))
+    fuel_color = GREEN if fuel > 20 else RED
+    hud.glyph_field("fuel", "FUEL: ", str(fuel_display), fuel_color, (10, 35), (0, 30, 200, 25))
     
-    livestext = font.render("LIVES: " + str(lives), 1, RED if lives <= 2 else WHITE)
-    screen.blit(livestext, (200, 35))
+    if hud.field_changed("lives", lives, (200, 30, 200, 25)):
+        layer.blit(render_text("LIVES: " + str(lives), RED if lives <= 2 else WHITE, 14, bold=True), (200, 35))
     
-    speedtext = font.render("SPEED: " + str(int(speed)), 1, WHITE)
-    screen.blit(speedtext, (400, 35))
+    hud.glyph_field("speed", "SPEED: ", str(int(speed)), WHITE, (400, 35), (400, 30, 200, 25))
     
-    # Jump countdown display
-    if jump_cooldown > 0:
-        countdown_seconds = (jump_cooldown // 60) + 1  # Convert frames to seconds, round up
+    # Jump countdown display (0 means the jump is available)
+    countdown_seconds = (jump_cooldown // 60) + 1 if jump_cooldown > 0 else 0  # Convert frames to seconds, round up
+    if hud.field_changed("jump", countdown_seconds, (0, 55, 200, 25)):
         if countdown_seconds > 1:
-            jumptext = font.render("JUMP: " + str(countdown_seconds), 1, ORANGE)
+            layer.blit(render_text("JUMP: " + str(countdown_seconds), ORANGE, 14, bold=True), (10, 60))
+        elif countdown_seconds == 1:
+            layer.blit(render_text("JUMP: READY", GREEN, 14, bold=True), (10, 60))
         else:
-            jumptext = font.render("JUMP: READY", 1, GREEN)
-        screen.blit(jumptext, (10, 60))
-    else:
-        # Draw "JUMP" with small car icon
-        jumptext = font.render("JUMP:", 1, GREEN)
-        screen.blit(jumptext, (10, 60))
-        
-        # Draw small car icon
-        car_x = 70
-        car_y = 62
-        pygame.draw.rect(screen, RED, (car_x, car_y, 12, 8))  # Car body
-        pygame.draw.circle(screen, BLACK, (car_x + 2, car_y + 8), 2)  # Left wheel
-        pygame.draw.circle(screen, BLACK, (car_x + 10, car_y + 8), 2)  # Right wheel
+            # Draw "JUMP" with small car icon
+            layer.blit(render_text("JUMP:", GREEN, 14, bold=True), (10, 60))
+            
+            # Draw small car icon
+            car_x = 70
+            car_y = 62
+            pygame.draw.rect(layer, RED, (car_x, car_y, 12, 8))  # Car body
+            pygame.draw.circle(layer, BLACK, (car_x + 2, car_y + 8), 2)  # Left wheel
+            pygame.draw.circle(layer, BLACK, (car_x + 10, car_y + 8), 2)  # Right wheel
+    
+    get_screen().blit(layer, (0, 0))
+
+STAGE_DESCRIPTIONS = ["SUBURBAN HIGHWAY", "RIVERSIDE ROAD", "INDUSTRIAL ZONE", "CANYON PASS", "DEATH VALLEY"]
+
+stage_banner = None
+
+def stage_description(stage):
+    return STAGE_DESCRIPTIONS[min(stage - 1, len(STAGE_DESCRIPTIONS) - 1)]
 
 def print_stage_message(stage):
-    # Create transparent background surface
-    banner_surface = pygame.Surface((300, 70), pygame.SRCALPHA)
-    banner_surface.fill((0, 0, 0, 128))  # Semi-transparent black
-    screen.blit(banner_surface, (150, 365))
+    """Draw the stage banner, returns the screen rect it covers"""
+    global stage_banner
+    screen = get_screen()
+    if stage_banner is None:
+        # Transparent background surface, built once in the display format
+        stage_banner = pygame.Surface((300, 70), pygame.SRCALPHA)
+        stage_banner.fill((0, 0, 0, 128))  # Semi-transparent black
+        if pygame.display.get_surface() is not None:
+            stage_banner = stage_banner.convert_alpha()
+    banner_rect = screen.blit(stage_banner, (150, 365))
     
     # Stage message with smaller font
-    font = pygame.font.SysFont("monospace", 28, bold=True)
-    stage_msg = font.render("STAGE " + str(stage), 1, YELLOW)
+    stage_msg = render_text("STAGE " + str(stage), YELLOW, 28, bold=True)
     msg_width = stage_msg.get_width()
     screen.blit(stage_msg, ((600 - msg_width) // 2, 375))
     
     # Stage description with smaller font
-    descriptions = ["SUBURBAN HIGHWAY", "RIVERSIDE ROAD", "INDUSTRIAL ZONE", "CANYON PASS", "DEATH VALLEY"]
-    desc = descriptions[min(stage - 1, len(descriptions) - 1)]
-    font = pygame.font.SysFont("monospace", 12)
-    desc_msg = font.render(desc, 1, WHITE)
+    desc_msg = render_text(stage_description(stage), WHITE, 12)
     msg_width = desc_msg.get_width()
     screen.blit(desc_msg, ((600 - msg_width) // 2, 405))
+    return banner_rect
 
-def print_pause_message():
-    # Clear center area for pause message
-    pygame.draw.rect(screen, BLACK, (150, 350, 300, 100))
+# Dirty rectangles
+# Screen changes are collected as rects and pushed with pygame.display.update(rects), so a menu or
+# the pause panel only sends its own pixels to the window. Once the dirty area passes
+# DIRTY_FULL_FLIP_FRACTION of the window one full update is cheaper than many small ones. During
+# play a frame is queued with add_frame: although the road scrolls, grass on grass and asphalt on
+# asphalt look the same, so only its edges, guardrails and center line change on screen. Add to
+# those the sprites where they are drawn now and where the last frame drew them, and the HUD
+# fields that were redrawn; that comes to about a quarter of the window on a typical frame. A stage
+# change, a new game, unpausing and the frame profiler's overlay still update the whole window.
+DIRTY_FULL_FLIP_FRACTION = 0.6
+
+class DirtyRegions:
+    def __init__(self, size):
+        self.bounds = pygame.Rect((0, 0), size)
+        self.full_update_area = self.bounds.width * self.bounds.height * DIRTY_FULL_FLIP_FRACTION
+        self.rects = []
+        self.area = 0
+        self.full = False
+        self.updates = 0
+        self.full_updates = 0
+        self.pixels = 0  # Pixels pushed to the window over all updates
+        self.sprite_rects = {}  # Where the last gameplay frame drew its sprites
     
-    # Pause message
-    font = pygame.font.SysFont("monospace", 50, bold=True)
-    pause_msg = font.render("PAUSED", 1, CYAN)
-    msg_width = pause_msg.get_width()
-    screen.blit(pause_msg, ((600 - msg_width) // 2, 380))
+    def add(self, rect):
+        if self.full:
+            return
+        rect = self.bounds.clip(rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+            self.area += rect.width * rect.height
+            self.full = self.area > self.full_update_area
     
-    # Instructions
-    font = pygame.font.SysFont("monospace", 16)
-    inst_msg = font.render("Press P to resume", 1, WHITE)
-    msg_width = inst_msg.get_width()
-    screen.blit(inst_msg, ((600 - msg_width) // 2, 420))
-
-def print_gameover(score, reason="OUT OF FUEL", is_new_hiscore=False):
-    # Clear center area for game over message
-    pygame.draw.rect(screen, BLACK, (100, 300, 400, 200))
+    def add_all(self):
+        self.full = True
     
-    font = pygame.font.SysFont("monospace", 40, bold=True)
-    textgm = font.render("GAME OVER", 1, RED)
-    msg_width = textgm.get_width()
-    screen.blit(textgm, ((600 - msg_width) // 2, 340))
+    def add_frame(self, road_rects, sprite_rects, hud_rects):
+        """Queue a gameplay frame: the road rects that changed (None when all of it did), the
+        sprites drawn this frame by what was drawn and the HUD fields that were redrawn"""
+        if road_rects is None:
+            self.add_all()
+        else:
+            for rect in road_rects:
+                self.add(rect)
+        # Each sprite covers where it is now and uncovers where the last frame drew it
+        previous = self.sprite_rects
+        for key, rect in sprite_rects.items():
+            old = previous.pop(key, None)
+            self.add(rect if old is None else rect.union(old))
+        for rect in previous.values():
+            self.add(rect)
+        for rect in hud_rects:
+            self.add(rect)
+        self.sprite_rects = sprite_rects
+    
+    def flush(self):
+        """Push the collected rects to the window, or the whole window past the threshold"""
+        if self.full:
+            pygame.display.update()
+            self.full_updates += 1
+            self.pixels += self.bounds.width * self.bounds.height
+        elif self.rects:
+            pygame.display.update(self.rects)
+            self.pixels += self.area
+        else:
+            return
+        self.updates += 1
+        self.rects = []
+        self.area = 0
+        self.full = False
     
-    font = pygame.font.SysFont("monospace", 14)
-    reason_text = font.render(reason, 1, WHITE)
-    msg_width = reason_text.get_width()
-    screen.blit(reason_text, ((600 - msg_width) // 2, 380))
+    def report(self):
+        average = self.pixels / self.updates if self.updates else 0
+        return f"display: {self.updates} updates ({self.full_updates} full), {average:.0f} pixels per update"
+
+dirty_regions = DirtyRegions(SCREEN_SIZE)
+
+# Menu screens
+# The title, pause and game over screens never animate, so each is composed once into a surface
+# and shown with a single blit and flip. The menu loops sleep in pygame.event.wait (waking every
+# MENU_WAIT_MS at most) instead of redrawing every 16 ms, and a MenuIdleMeter keeps track of the
+# wall and CPU time spent waiting there (printed on quit with BNJ_MENU_STATS=1, or --bench-menu).
+MENU_WAIT_MS = 1000
+PAUSE_PANEL_RECT = pygame.Rect(150, 350, 300, 100)
+GAMEOVER_PANEL_RECT = pygame.Rect(100, 300, 400, 200)
+
+menu_screens = {}
+
+def blit_centered(target, surface, y, left=0, width=600):
+    return target.blit(surface, (left + (width - surface.get_width()) // 2, y))
+
+def compose_pause_panel():
+    panel = pygame.Surface(PAUSE_PANEL_RECT.size)
+    panel.fill(BLACK)
+    blit_centered(panel, render_text("PAUSED", CYAN, 50, bold=True), 30, width=PAUSE_PANEL_RECT.width)
+    blit_centered(panel, render_text("Press P to resume", WHITE, 16), 70, width=PAUSE_PANEL_RECT.width)
+    return panel
+
+def compose_gameover(target, score, reason="OUT OF FUEL", is_new_hiscore=False):
+    """Draw the game over message on target, returns the rect it covers"""
+    # Clear center area for game over message
+    rects = [target.fill(BLACK, GAMEOVER_PANEL_RECT)]
+    rects.append(blit_centered(target, render_text("GAME OVER", RED, 40, bold=True), 340))
+    rects.append(blit_centered(target, render_text(reason, WHITE, 14), 380))
     
     # Show new high score message if applicable
+    y_offset = 0
     if is_new_hiscore:
-        font = pygame.font.SysFont("monospace", 18, bold=True)
-        hiscore_text = font.render("NEW HIGH SCORE!", 1, YELLOW)
-        msg_width = hiscore_text.get_width()
-        screen.blit(hiscore_text, ((600 - msg_width) // 2, 400))
+        rects.append(blit_centered(target, render_text("NEW HIGH SCORE!", YELLOW, 18, bold=True), 400))
         y_offset = 20
-    else:
-        y_offset = 0
     
-    font = pygame.font.SysFont("monospace", 16)
-    textgm = font.render("FINAL SCORE: " + str(score), 1, WHITE)
-    msg_width = textgm.get_width()
-    screen.blit(textgm, ((600 - msg_width) // 2, 420 + y_offset))
-    
-    font = pygame.font.SysFont("monospace", 14, bold=True)
-    textgm = font.render("Press SPACE to play again", 1, YELLOW)
-    msg_width = textgm.get_width()
-    screen.blit(textgm, ((600 - msg_width) // 2, 460 + y_offset))
-    
-    font = pygame.font.SysFont("monospace", 12)
-    textgm = font.render("Press ESC to quit", 1, WHITE)
-    msg_width = textgm.get_width()
-    screen.blit(textgm, ((600 - msg_width) // 2, 480 + y_offset))
+    rects.append(blit_centered(target, render_text("FINAL SCORE: " + str(score), WHITE, 16), 420 + y_offset))
+    rects.append(blit_centered(target, render_text("Press SPACE to play again", YELLOW, 14, bold=True), 460 + y_offset))
+    rects.append(blit_centered(target, render_text("Press ESC to quit", WHITE, 12), 480 + y_offset))
+    return rects[0].unionall(rects[1:])
 
-def print_startgame(hiscore=0):
-    screen.fill(BLACK)
+def compose_startgame(target, hiscore=0):
+    target.fill(BLACK)
     
     # Draw road background (50% wider)
-    pygame.draw.rect(screen, ROAD_COLOR, (150, 0, 300, 800))
+    pygame.draw.rect(target, ROAD_COLOR, (150, 0, 300, 800))
     
     # Draw road lines
     for y in range(0, 800, 40):
-        pygame.draw.rect(screen, ROAD_LINE_COLOR, (295, y, 10, 20))
+        pygame.draw.rect(target, ROAD_LINE_COLOR, (295, y, 10, 20))
     
     # Draw grass on sides
-    pygame.draw.rect(screen, GRASS_COLOR, (0, 0, 150, 800))
-    pygame.draw.rect(screen, GRASS_COLOR, (450, 0, 150, 800))
+    pygame.draw.rect(target, GRASS_COLOR, (0, 0, 150, 800))
+    pygame.draw.rect(target, GRASS_COLOR, (450, 0, 150, 800))
     
-    # Rainbow colors for title
+    # Rainbow title, one color per letter, centered on its total width
     letter_colors = [RED, ORANGE, YELLOW, GREEN, CYAN, BLUE, PURPLE, WHITE, SILVER, RED, ORANGE, YELLOW]
-    
-    font = pygame.font.SysFont("monospace", 80, bold=True)
-    title = "BUMP N JUMP"
-    
-    # Calculate total width to center the title
-    total_width = 0
-    letter_widths = []
-    for letter in title:
-        letter_surface = font.render(letter, 1, WHITE)
-        letter_width = letter_surface.get_width()
-        letter_widths.append(letter_width)
-        total_width += letter_width
-    
-    # Starting x position to center the title
-    start_x = (600 - total_width) // 2
-    current_x = start_x
-    
-    # Draw each letter in different color
-    for i, letter in enumerate(title):
-        if letter != ' ':
-            color = letter_colors[i % len(letter_colors)]
-            letter_surface = font.render(letter, 1, color)
-            screen.blit(letter_surface, (current_x, 180))
-        current_x += letter_widths[i]
+    letters = [render_text(letter, letter_colors[i % len(letter_colors)], 80, bold=True)
+               for i, letter in enumerate("BUMP N JUMP")]
+    current_x = (600 - sum(letter.get_width() for letter in letters)) // 2
+    for letter in letters:
+        target.blit(letter, (current_x, 180))
+        current_x += letter.get_width()
     
     # Subtitle
-    font_small = pygame.font.SysFont("monospace", 12)
-    subtitle = font_small.render("Modern Homage to the 1982 Arcade Classic", 1, SILVER)
-    subtitle_width = subtitle.get_width()
-    screen.blit(subtitle, ((600 - subtitle_width) // 2, 280))
+    blit_centered(target, render_text("Modern Homage to the 1982 Arcade Classic", SILVER, 12), 280)
     
     # Instructions
-    font = pygame.font.SysFont("monospace", 18)
     instructions = [
         "ARROWS: Steer and accelerate",
         "SPACE: Jump over obstacles",
@@ -260,22 +743,420 @@ def print_startgame(hiscore=0):
     
     for i, instruction in enumerate(instructions):
         color = WHITE if instruction != "Press any key to start" else YELLOW
-        text = font.render(instruction, 1, color)
-        text_width = text.get_width()
-        screen.blit(text, ((600 - text_width) // 2, 320 + i * 25))
+        blit_centered(target, render_text(instruction, color, 18), 320 + i * 25)
     
     # Display high score if it exists
     if hiscore > 0:
-        font_hiscore = pygame.font.SysFont("monospace", 18, bold=True)
-        hiscore_text = font_hiscore.render("HIGH SCORE: " + str(hiscore), 1, YELLOW)
-        msg_width = hiscore_text.get_width()
-        screen.blit(hiscore_text, ((600 - msg_width) // 2, 550))
+        blit_centered(target, render_text("HIGH SCORE: " + str(hiscore), YELLOW, 18, bold=True), 550)
+
+def get_start_screen(hiscore=0):
+    key = ("start", hiscore)
+    surface = menu_screens.get(key)
+    if surface is None:
+        # Only the latest high score's title screen is worth keeping
+        for old_key in [old_key for old_key in menu_screens if old_key[0] == "start"]:
+            del menu_screens[old_key]
+        surface = pygame.Surface(SCREEN_SIZE).convert()
+        compose_startgame(surface, hiscore)
+        menu_screens[key] = surface
+    return surface
+
+def get_pause_panel():
+    panel = menu_screens.get(("pause",))
+    if panel is None:
+        panel = menu_screens[("pause",)] = compose_pause_panel().convert()
+    return panel
+
+class MenuIdleMeter:
+    """Wall and CPU time spent sleeping in menu event waits"""
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.wakeups = 0
+        self.flips = 0
+    
+    def wait(self, timeout=MENU_WAIT_MS):
+        """pygame.event.wait with a timeout, returns NOEVENT when it times out"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        event = pygame.event.wait(timeout)
+        self.wall += time.perf_counter() - wall
+        self.cpu += time.process_time() - cpu
+        self.wakeups += 1
+        return event
+    
+    def show(self, rect):
+        """Push a changed part of the screen, the only time a menu updates the display"""
+        dirty_regions.add(rect)
+        dirty_regions.flush()
+        self.flips += 1
+    
+    def report(self):
+        usage = self.cpu / self.wall * 100 if self.wall else 0.0
+        return (f"menus: {self.wall:.1f} s waiting, {self.cpu:.3f} s CPU ({usage:.2f}%), "
+                f"{self.wakeups} wakeups, {self.flips} flips")
+
+menu_meter = MenuIdleMeter()
+
+def wait_for_key(keys=None, meter=menu_meter):
+    """Sleep until one of keys (any key if None) is pressed and return it, quitting on QUIT"""
+    while True:
+        event = meter.wait()
+        if event.type == QUIT:
+            quit_game()
+        if event.type == KEYDOWN and (keys is None or event.key in keys):
+            return event.key
+        if event.type == WINDOWEXPOSED:
+            # Window was uncovered, put the last frame back
+            dirty_regions.add_all()
+            dirty_regions.flush()
+
+def quit_game():
+    if os.environ.get("BNJ_MENU_STATS"):
+        print(menu_meter.report())
+        print(dirty_regions.report())
+    pygame.quit()
+    sys.exit()
+
+def benchmark_menu_idle(seconds=3.0):
+    """Compare CPU use of redrawing the title every 16 ms with sleeping on a composed title"""
+    screen = get_screen()
+    wall, cpu = time.perf_counter(), time.process_time()
+    redraws = 0
+    while time.perf_counter() - wall < seconds:
+        pygame.event.get()
+        compose_startgame(screen, 0)
+        pygame.display.update()
+        redraws += 1
+        time.sleep(0.016)
+    redraw_usage = (time.process_time() - cpu) / (time.perf_counter() - wall) * 100
+    
+    meter = MenuIdleMeter()
+    meter.show(screen.blit(get_start_screen(0), (0, 0)))
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        meter.wait(max(1, min(MENU_WAIT_MS, int((deadline - time.perf_counter()) * 1000))))
+    wait_usage = meter.cpu / meter.wall * 100 if meter.wall else 0.0
+    
+    print(f"Title screen idle over {seconds:.1f} s:")
+    print(f"  redraw every 16 ms: {redraw_usage:.2f}% CPU ({redraws} flips)")
+    print(f"  event wait:         {wait_usage:.2f}% CPU ({meter.flips} flips, {meter.wakeups} wakeups)")
+    return redraw_usage, wait_usage
+
+# Car sprite cache
+# Every car is baked once into an SRCALPHA surface per (color, car_type, facing, jump scale step),
+# so drawing a car is a single blit plus the shadow ellipse instead of ~30 draw calls per frame.
+CAR_SPRITE_PAD_X = 18  # Room for wheels and wings that stick out past the 36px car width
+CAR_SPRITE_PAD_Y = 4
+CAR_SPRITE_MAX_SCALE = 1.3  # Jump perspective scale tops out at 1.3 (jump_height 100)
+CAR_SPRITE_SCALE_STEPS = 24  # Quantized scale variants between 1.0 and CAR_SPRITE_MAX_SCALE
+CAR_SPRITE_HEIGHT = int(48 * CAR_SPRITE_MAX_SCALE) + 2 * CAR_SPRITE_PAD_Y
+
+car_sprite_cache = {}
+
+def draw_car_topdown(surface, x, car_y, color, car_type, scale_factor):
+    """Draw the F1 car facing down the road (oncoming traffic)"""
+    center_x = x + 18
+    
+    # Modern F1 car design - aerodynamic and iconic
+    
+    # Front wheels (large, exposed, positioned outside main body)
+    wheel_width = int(10 * scale_factor)
+    wheel_height = int(14 * scale_factor)
+    wheel_offset = int(4 * scale_factor)
+    wheel_y_offset = int(8 * scale_factor)
+    pygame.draw.rect(surface, BLACK, (center_x - 18 - wheel_offset, car_y + wheel_y_offset, wheel_width, wheel_height))
+    pygame.draw.rect(surface, BLACK, (center_x + 12 + wheel_offset, car_y + wheel_y_offset, wheel_width, wheel_height))
+    
+    # Front wing (wide, multi-element aerodynamic wing)
+    wing_width = int(40 * scale_factor)
+    wing_height = int(3 * scale_factor)
+    wing_y_offset = int(2 * scale_factor)
+    pygame.draw.rect(surface, DARK_GRAY, (center_x - wing_width//2 - 2, car_y + wing_y_offset, wing_width, wing_height))
+    pygame.draw.rect(surface, SILVER, (center_x - int(36 * scale_factor)//2, car_y + int(5 * scale_factor), int(36 * scale_factor), int(2 * scale_factor)))
+    
+    # Nose cone (sharp, aerodynamic point)
+    nose_color = (min(255, color[0] + 30), min(255, color[1] + 30), min(255, color[2] + 30))
+    nose_width = int(6 * scale_factor)
+    nose_y_offset = int(7 * scale_factor)
+    nose_height = int(5 * scale_factor)
+    pygame.draw.polygon(surface, nose_color, [
+        (center_x, car_y + nose_y_offset),
+        (center_x - nose_width, car_y + nose_y_offset + nose_height),
+        (center_x + nose_width, car_y + nose_y_offset + nose_height)
+    ])
     
-    pygame.display.update()
+    # Main monocoque (narrow central survival cell)
+    mono_width = int(8 * scale_factor)
+    mono_height = int(18 * scale_factor)
+    mono_y_offset = int(12 * scale_factor)
+    pygame.draw.rect(surface, color, (center_x - mono_width//2, car_y + mono_y_offset, mono_width, mono_height))
+    
+    # Side pods (large aerodynamic air intakes)
+    pod_offset = int(12 * scale_factor)
+    pod_width = int(6 * scale_factor)
+    pygame.draw.polygon(surface, color, [
+        (center_x - pod_offset - pod_width, car_y + int(14 * scale_factor)),
+        (center_x - pod_width, car_y + int(12 * scale_factor)),
+        (center_x - pod_width, car_y + int(26 * scale_factor)),
+        (center_x - pod_offset - int(4 * scale_factor), car_y + int(30 * scale_factor))
+    ])
+    pygame.draw.polygon(surface, color, [
+        (center_x + pod_offset + pod_width, car_y + int(14 * scale_factor)),
+        (center_x + pod_width, car_y + int(12 * scale_factor)),
+        (center_x + pod_width, car_y + int(26 * scale_factor)),
+        (center_x + pod_offset + int(4 * scale_factor), car_y + int(30 * scale_factor))
+    ])
+    
+    # Cockpit opening (driver area)
+    cockpit_color = BLACK
+    cockpit_width = int(6 * scale_factor)
+    cockpit_height = int(8 * scale_factor)
+    pygame.draw.rect(surface, cockpit_color, (center_x - cockpit_width//2, car_y + int(14 * scale_factor), cockpit_width, cockpit_height))
+    
+    # Driver helmet (visible in cockpit)
+    helmet_radius = int(2 * scale_factor)
+    if car_type == "player":
+        pygame.draw.circle(surface, WHITE, (center_x, car_y + int(18 * scale_factor)), helmet_radius)
+    else:
+        pygame.draw.circle(surface, YELLOW, (center_x, car_y + int(18 * scale_factor)), helmet_radius)
+    
+    # Rear wheels (large, exposed)
+    rear_wheel_y = int(26 * scale_factor)
+    pygame.draw.rect(surface, BLACK, (center_x - 18 - wheel_offset, car_y + rear_wheel_y, wheel_width, wheel_height))
+    pygame.draw.rect(surface, BLACK, (center_x + 12 + wheel_offset, car_y + rear_wheel_y, wheel_width, wheel_height))
+    
+    # Engine cover (tapered, aerodynamic rear)
+    engine_width = int(8 * scale_factor)
+    engine_taper = int(4 * scale_factor)
+    pygame.draw.polygon(surface, color, [
+        (center_x - engine_width//2, car_y + int(30 * scale_factor)),
+        (center_x + engine_width//2, car_y + int(30 * scale_factor)),
+        (center_x + engine_taper//2, car_y + int(38 * scale_factor)),
+        (center_x - engine_taper//2, car_y + int(38 * scale_factor))
+    ])
+    
+    # Large rear wing (most prominent F1 feature)
+    wing_main_width = int(32 * scale_factor)
+    wing_main_height = int(3 * scale_factor)
+    wing_sub_width = int(28 * scale_factor)
+    wing_sub_height = int(2 * scale_factor)
+    pygame.draw.rect(surface, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(40 * scale_factor), wing_main_width, wing_main_height))
+    pygame.draw.rect(surface, SILVER, (center_x - wing_sub_width//2, car_y + int(43 * scale_factor), wing_sub_width, wing_sub_height))
+    # Wing endplates
+    endplate_width = int(3 * scale_factor)
+    endplate_height = int(7 * scale_factor)
+    pygame.draw.rect(surface, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(38 * scale_factor), endplate_width, endplate_height))
+    pygame.draw.rect(surface, DARK_GRAY, (center_x + wing_main_width//2 - endplate_width, car_y + int(38 * scale_factor), endplate_width, endplate_height))
+    # Wing supports
+    support_width = int(2 * scale_factor)
+    support_height = int(5 * scale_factor)
+    pygame.draw.rect(surface, DARK_GRAY, (center_x - support_width, car_y + int(38 * scale_factor), support_width, support_height))
+    pygame.draw.rect(surface, DARK_GRAY, (center_x, car_y + int(38 * scale_factor), support_width, support_height))
+    
+    # Air intakes (prominent on side pods)
+    intake_width = int(3 * scale_factor)
+    intake_height = int(6 * scale_factor)
+    intake_offset = int(10 * scale_factor)
+    pygame.draw.rect(surface, BLACK, (center_x - intake_offset, car_y + int(16 * scale_factor), intake_width, intake_height))
+    pygame.draw.rect(surface, BLACK, (center_x + intake_offset - intake_width, car_y + int(16 * scale_factor), intake_width, intake_height))
+    
+    # Racing number for player car
+    if car_type == "player":
+        stripe_color = WHITE if sum(color) < 400 else BLACK
+        stripe_width = int(2 * scale_factor)
+        stripe_height = int(12 * scale_factor)
+        pygame.draw.rect(surface, stripe_color, (center_x - stripe_width//2, car_y + int(14 * scale_factor), stripe_width, stripe_height))
+
+def draw_car_forward(surface, x, car_y, color, car_type, scale_factor):
+    """Draw the F1 car facing up the road (player view, rotated 180 degrees)"""
+    center_x = x + 18
+    
+    # Modern F1 car design - rotated 180 degrees for player (facing forward)
+    
+    # Large rear wing (now at front - most prominent F1 feature)
+    wing_main_width = int(32 * scale_factor)
+    wing_main_height = int(3 * scale_factor)
+    wing_sub_width = int(28 * scale_factor)
+    wing_sub_height = int(2 * scale_factor)
+    pygame.draw.rect(surface, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(2 * scale_factor), wing_main_width, wing_main_height))
+    pygame.draw.rect(surface, SILVER, (center_x - wing_sub_width//2, car_y + int(-1 * scale_factor), wing_sub_width, wing_sub_height))
+    # Wing endplates
+    endplate_width = int(3 * scale_factor)
+    endplate_height = int(7 * scale_factor)
+    pygame.draw.rect(surface, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(2 * scale_factor), endplate_width, endplate_height))
+    pygame.draw.rect(surface, DARK_GRAY, (center_x + wing_main_width//2 - endplate_width, car_y + int(2 * scale_factor), endplate_width, endplate_height))
+    # Wing supports
+    support_width = int(2 * scale_factor)
+    support_height = int(5 * scale_factor)
+    pygame.draw.rect(surface, DARK_GRAY, (center_x - support_width, car_y + int(2 * scale_factor), support_width, support_height))
+    pygame.draw.rect(surface, DARK_GRAY, (center_x, car_y + int(2 * scale_factor), support_width, support_height))
+    
+    # Engine cover (now at front, tapered aerodynamic front)
+    engine_width = int(4 * scale_factor)
+    engine_taper = int(8 * scale_factor)
+    pygame.draw.polygon(surface, color, [
+        (center_x - engine_width//2, car_y + int(4 * scale_factor)),
+        (center_x + engine_width//2, car_y + int(4 * scale_factor)),
+        (center_x + engine_taper//2, car_y + int(12 * scale_factor)),
+        (center_x - engine_taper//2, car_y + int(12 * scale_factor))
+    ])
+    
+    # Front wheels (now rear wheels after rotation - large, exposed, positioned outside main body)
+    wheel_width = int(10 * scale_factor)
+    wheel_height = int(14 * scale_factor)
+    wheel_offset = int(4 * scale_factor)
+    pygame.draw.rect(surface, BLACK, (center_x - 18 - wheel_offset, car_y + int(5 * scale_factor), wheel_width, wheel_height))
+    pygame.draw.rect(surface, BLACK, (center_x + 12 + wheel_offset, car_y + int(5 * scale_factor), wheel_width, wheel_height))
+    
+    # Side pods (large aerodynamic air intakes) - rotated
+    pod_offset = int(12 * scale_factor)
+    pod_width = int(6 * scale_factor)
+    pygame.draw.polygon(surface, color, [
+        (center_x - pod_offset - int(4 * scale_factor), car_y + int(12 * scale_factor)),
+        (center_x - pod_width, car_y + int(16 * scale_factor)),
+        (center_x - pod_width, car_y + int(30 * scale_factor)),
+        (center_x - pod_offset - pod_width, car_y + int(28 * scale_factor))
+    ])
+    pygame.draw.polygon(surface, color, [
+        (center_x + pod_offset + int(4 * scale_factor), car_y + int(12 * scale_factor)),
+        (center_x + pod_width, car_y + int(16 * scale_factor)),
+        (center_x + pod_width, car_y + int(30 * scale_factor)),
+        (center_x + pod_offset + pod_width, car_y + int(28 * scale_factor))
+    ])
+    
+    # Main monocoque (narrow central survival cell)
+    mono_width = int(8 * scale_factor)
+    mono_height = int(18 * scale_factor)
+    pygame.draw.rect(surface, color, (center_x - mono_width//2, car_y + int(12 * scale_factor), mono_width, mono_height))
+    
+    # Air intakes (prominent on side pods)
+    intake_width = int(3 * scale_factor)
+    intake_height = int(6 * scale_factor)
+    intake_offset = int(10 * scale_factor)
+    pygame.draw.rect(surface, BLACK, (center_x - intake_offset, car_y + int(20 * scale_factor), intake_width, intake_height))
+    pygame.draw.rect(surface, BLACK, (center_x + intake_offset - intake_width, car_y + int(20 * scale_factor), intake_width, intake_height))
+    
+    # Cockpit opening (driver area)
+    cockpit_color = BLACK
+    cockpit_width = int(6 * scale_factor)
+    cockpit_height = int(8 * scale_factor)
+    pygame.draw.rect(surface, cockpit_color, (center_x - cockpit_width//2, car_y + int(20 * scale_factor), cockpit_width, cockpit_height))
+    
+    # Driver helmet (visible in cockpit)
+    helmet_radius = int(2 * scale_factor)
+    if car_type == "player":
+        pygame.draw.circle(surface, WHITE, (center_x, car_y + int(24 * scale_factor)), helmet_radius)
+    else:
+        pygame.draw.circle(surface, YELLOW, (center_x, car_y + int(24 * scale_factor)), helmet_radius)
+    
+    # Rear wheels (now front wheels after rotation - large, exposed)
+    pygame.draw.rect(surface, BLACK, (center_x - 18 - wheel_offset, car_y + int(23 * scale_factor), wheel_width, wheel_height))
+    pygame.draw.rect(surface, BLACK, (center_x + 12 + wheel_offset, car_y + int(23 * scale_factor), wheel_width, wheel_height))
+    
+    # Nose cone (sharp, aerodynamic point - now pointing down/forward)
+    nose_color = (min(255, color[0] + 30), min(255, color[1] + 30), min(255, color[2] + 30))
+    nose_width = int(6 * scale_factor)
+    pygame.draw.polygon(surface, nose_color, [
+        (center_x, car_y + int(35 * scale_factor)),
+        (center_x - nose_width, car_y + int(30 * scale_factor)),
+        (center_x + nose_width, car_y + int(30 * scale_factor))
+    ])
+    
+    # Front wing (now rear wing - wide, multi-element aerodynamic wing)
+    pygame.draw.rect(surface, SILVER, (x, car_y + 37, 36, 2))
+    pygame.draw.rect(surface, DARK_GRAY, (x - 2, car_y + 39, 40, 3))
+    
+    # Racing number for player car
+    if car_type == "player":
+        stripe_color = WHITE if sum(color) < 400 else BLACK
+        pygame.draw.rect(surface, stripe_color, (center_x - 1, car_y + 20, 2, 12))
+
+def car_scale_step(jump_height):
+    """Quantize the jump perspective scale factor to one of the cached sprite steps"""
+    scale_factor = 1.0 + (jump_height / 100.0) * 0.3
+    step = round((scale_factor - 1.0) / (CAR_SPRITE_MAX_SCALE - 1.0) * CAR_SPRITE_SCALE_STEPS)
+    return max(0, min(step, CAR_SPRITE_SCALE_STEPS))
+
+def draw_car_sprite(color, car_type, facing, step):
+    """Draw one car sprite variant into a new surface"""
+    scale_factor = 1.0 + step * (CAR_SPRITE_MAX_SCALE - 1.0) / CAR_SPRITE_SCALE_STEPS
+    width = 36 + 2 * CAR_SPRITE_PAD_X
+    sprite = pygame.Surface((width, CAR_SPRITE_HEIGHT), pygame.SRCALPHA)
+    sprite.fill((0, 0, 0, 0))
+    if facing == "down":
+        draw_car_topdown(sprite, CAR_SPRITE_PAD_X, CAR_SPRITE_PAD_Y, color, car_type, scale_factor)
+    else:
+        draw_car_forward(sprite, CAR_SPRITE_PAD_X, CAR_SPRITE_PAD_Y, color, car_type, scale_factor)
+    return sprite
+
+def get_car_sprite(color, car_type, facing, jump_height):
+    """Return the baked sprite for a car, rendering it on first use"""
+    step = car_scale_step(jump_height)
+    key = (tuple(color), car_type, facing, step)
+    sprite = car_sprite_cache.get(key)
+    if sprite is None:
+        sprite = car_sprite_cache[key] = texture_atlas.add(draw_car_sprite(color, car_type, facing, step))
+    return sprite
+
+# Prop sprites
+# Obstacles, fuel cans and fuel pumps always look the same, so each is baked once into the texture
+# atlas and drawn with one blit (the pump's antialiased label is a second, per-pixel alpha region).
+prop_sprites = {}
+
+def draw_prop(name):
+    """Draw one prop into a new surface"""
+    if name == "barrel":
+        sprite = new_art_surface(40, 20)
+        pygame.draw.ellipse(sprite, BROWN, (0, 0, 40, 20))
+        pygame.draw.ellipse(sprite, DARK_GRAY, (5, 5, 30, 10))
+    elif name == "water":
+        sprite = new_art_surface(120, 20)  # Puddles are three obstacle widths across
+        sprite.fill(WATER_COLOR)
+    elif name == "fuel_can":
+        # Make fuel pickups more visible with a gas can design
+        sprite = new_art_surface(20, 20)
+        sprite.fill(RED)
+        pygame.draw.rect(sprite, WHITE, (3, 3, 14, 14))
+        pygame.draw.rect(sprite, RED, (6, 6, 8, 8))
+        # Add "F" for fuel
+        pygame.draw.rect(sprite, WHITE, (8, 8, 2, 6))
+        pygame.draw.rect(sprite, WHITE, (8, 8, 4, 2))
+        pygame.draw.rect(sprite, WHITE, (8, 11, 3, 2))
+    elif name == "fuel_pump":
+        sprite = new_art_surface(28, 40)
+        # Fuel pump base (gray)
+        pygame.draw.rect(sprite, GRAY, (0, 20, 25, 20))
+        # Fuel pump top (red)
+        pygame.draw.rect(sprite, RED, (3, 10, 19, 15))
+        # Pump handle (black)
+        pygame.draw.rect(sprite, BLACK, (20, 15, 8, 3))
+        # Display screen (green)
+        pygame.draw.rect(sprite, GREEN, (6, 12, 8, 6))
+        # Fuel nozzle (silver)
+        pygame.draw.rect(sprite, SILVER, (22, 18, 6, 2))
+        # Base details
+        pygame.draw.rect(sprite, DARK_GRAY, (2, 35, 21, 3))
+    else:  # fuel_pump_label
+        sprite = render_text("FUEL", WHITE, 8, bold=True)
+    return sprite
+
+def get_prop_sprite(name):
+    sprite = prop_sprites.get(name)
+    if sprite is None:
+        sprite = prop_sprites[name] = texture_atlas.add(draw_prop(name))
+    return sprite
 
 # Game entity classes
+entity_sequence = count()  # Spawn order of every entity, collision checks use it to keep list order
+
 class Car:
+    __slots__ = ("seq", "alive", "x", "y", "prev_y", "color", "width", "height", "speed", "max_speed", "acceleration",
+                 "deceleration", "turn_speed", "max_turn_speed", "car_type", "jumping", "jump_height", "jump_velocity", "shadow_y")
+    # Sprite extent relative to y, room above for the 40px peak of a jump
+    view_top, view_bottom = -CAR_SPRITE_PAD_Y - 40, CAR_SPRITE_HEIGHT - CAR_SPRITE_PAD_Y
+    
     def __init__(self, x, y, color, car_type="player"):
+        self.seq = next(entity_sequence)
         self.x = x
         self.y = y
         self.color = color
@@ -322,250 +1203,42 @@ class Car:
             self.jump_height = 0
     
     def draw(self, screen, camera_y):
+        """Draw the car, returns the screen rect it covers"""
         draw_y = self.y - camera_y
         
         # Draw shadow when jumping
         if self.jumping:
             shadow_y = self.shadow_y - camera_y
-            pygame.draw.ellipse(screen, (50, 50, 50), (self.x + 5, shadow_y + 34, 26, 10))
+            shadow = pygame.draw.ellipse(screen, (50, 50, 50), (self.x + 5, shadow_y + 34, 26, 10))
         
-        # Draw car (elevated when jumping)
+        # Draw car (elevated when jumping) from the sprite cache
         car_y = draw_y - self.jump_height
-        center_x = self.x + self.width // 2
-        
-        # Calculate scale factor based on jump height for perspective effect
-        # Scale increases as car jumps higher (1.0 to 1.3)
-        scale_factor = 1.0 + (self.jump_height / 100.0) * 0.3
-        
-        # Modern F1 car design - aerodynamic and iconic
-        
-        # Front wheels (large, exposed, positioned outside main body)
-        wheel_width = int(10 * scale_factor)
-        wheel_height = int(14 * scale_factor)
-        wheel_offset = int(4 * scale_factor)
-        wheel_y_offset = int(8 * scale_factor)
-        pygame.draw.rect(screen, BLACK, (center_x - 18 - wheel_offset, car_y + wheel_y_offset, wheel_width, wheel_height))
-        pygame.draw.rect(screen, BLACK, (center_x + 12 + wheel_offset, car_y + wheel_y_offset, wheel_width, wheel_height))
-        
-        # Front wing (wide, multi-element aerodynamic wing)
-        wing_width = int(40 * scale_factor)
-        wing_height = int(3 * scale_factor)
-        wing_y_offset = int(2 * scale_factor)
-        pygame.draw.rect(screen, DARK_GRAY, (center_x - wing_width//2 - 2, car_y + wing_y_offset, wing_width, wing_height))
-        pygame.draw.rect(screen, SILVER, (center_x - int(36 * scale_factor)//2, car_y + int(5 * scale_factor), int(36 * scale_factor), int(2 * scale_factor)))
-        
-        # Nose cone (sharp, aerodynamic point)
-        nose_color = (min(255, self.color[0] + 30), min(255, self.color[1] + 30), min(255, self.color[2] + 30))
-        nose_width = int(6 * scale_factor)
-        nose_y_offset = int(7 * scale_factor)
-        nose_height = int(5 * scale_factor)
-        pygame.draw.polygon(screen, nose_color, [
-            (center_x, car_y + nose_y_offset),
-            (center_x - nose_width, car_y + nose_y_offset + nose_height),
-            (center_x + nose_width, car_y + nose_y_offset + nose_height)
-        ])
-        
-        # Main monocoque (narrow central survival cell)
-        mono_width = int(8 * scale_factor)
-        mono_height = int(18 * scale_factor)
-        mono_y_offset = int(12 * scale_factor)
-        pygame.draw.rect(screen, self.color, (center_x - mono_width//2, car_y + mono_y_offset, mono_width, mono_height))
-        
-        # Side pods (large aerodynamic air intakes)
-        pod_offset = int(12 * scale_factor)
-        pod_width = int(6 * scale_factor)
-        pygame.draw.polygon(screen, self.color, [
-            (center_x - pod_offset - pod_width, car_y + int(14 * scale_factor)),
-            (center_x - pod_width, car_y + int(12 * scale_factor)),
-            (center_x - pod_width, car_y + int(26 * scale_factor)),
-            (center_x - pod_offset - int(4 * scale_factor), car_y + int(30 * scale_factor))
-        ])
-        pygame.draw.polygon(screen, self.color, [
-            (center_x + pod_offset + pod_width, car_y + int(14 * scale_factor)),
-            (center_x + pod_width, car_y + int(12 * scale_factor)),
-            (center_x + pod_width, car_y + int(26 * scale_factor)),
-            (center_x + pod_offset + int(4 * scale_factor), car_y + int(30 * scale_factor))
-        ])
-        
-        # Cockpit opening (driver area)
-        cockpit_color = BLACK
-        cockpit_width = int(6 * scale_factor)
-        cockpit_height = int(8 * scale_factor)
-        pygame.draw.rect(screen, cockpit_color, (center_x - cockpit_width//2, car_y + int(14 * scale_factor), cockpit_width, cockpit_height))
-        
-        # Driver helmet (visible in cockpit)
-        helmet_radius = int(2 * scale_factor)
-        if self.car_type == "player":
-            pygame.draw.circle(screen, WHITE, (center_x, car_y + int(18 * scale_factor)), helmet_radius)
-        else:
-            pygame.draw.circle(screen, YELLOW, (center_x, car_y + int(18 * scale_factor)), helmet_radius)
-        
-        # Rear wheels (large, exposed)
-        rear_wheel_y = int(26 * scale_factor)
-        pygame.draw.rect(screen, BLACK, (center_x - 18 - wheel_offset, car_y + rear_wheel_y, wheel_width, wheel_height))
-        pygame.draw.rect(screen, BLACK, (center_x + 12 + wheel_offset, car_y + rear_wheel_y, wheel_width, wheel_height))
-        
-        # Engine cover (tapered, aerodynamic rear)
-        engine_width = int(8 * scale_factor)
-        engine_taper = int(4 * scale_factor)
-        pygame.draw.polygon(screen, self.color, [
-            (center_x - engine_width//2, car_y + int(30 * scale_factor)),
-            (center_x + engine_width//2, car_y + int(30 * scale_factor)),
-            (center_x + engine_taper//2, car_y + int(38 * scale_factor)),
-            (center_x - engine_taper//2, car_y + int(38 * scale_factor))
-        ])
-        
-        # Large rear wing (most prominent F1 feature)
-        wing_main_width = int(32 * scale_factor)
-        wing_main_height = int(3 * scale_factor)
-        wing_sub_width = int(28 * scale_factor)
-        wing_sub_height = int(2 * scale_factor)
-        pygame.draw.rect(screen, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(40 * scale_factor), wing_main_width, wing_main_height))
-        pygame.draw.rect(screen, SILVER, (center_x - wing_sub_width//2, car_y + int(43 * scale_factor), wing_sub_width, wing_sub_height))
-        # Wing endplates
-        endplate_width = int(3 * scale_factor)
-        endplate_height = int(7 * scale_factor)
-        pygame.draw.rect(screen, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(38 * scale_factor), endplate_width, endplate_height))
-        pygame.draw.rect(screen, DARK_GRAY, (center_x + wing_main_width//2 - endplate_width, car_y + int(38 * scale_factor), endplate_width, endplate_height))
-        # Wing supports
-        support_width = int(2 * scale_factor)
-        support_height = int(5 * scale_factor)
-        pygame.draw.rect(screen, DARK_GRAY, (center_x - support_width, car_y + int(38 * scale_factor), support_width, support_height))
-        pygame.draw.rect(screen, DARK_GRAY, (center_x, car_y + int(38 * scale_factor), support_width, support_height))
-        
-        # Air intakes (prominent on side pods)
-        intake_width = int(3 * scale_factor)
-        intake_height = int(6 * scale_factor)
-        intake_offset = int(10 * scale_factor)
-        pygame.draw.rect(screen, BLACK, (center_x - intake_offset, car_y + int(16 * scale_factor), intake_width, intake_height))
-        pygame.draw.rect(screen, BLACK, (center_x + intake_offset - intake_width, car_y + int(16 * scale_factor), intake_width, intake_height))
-        
-        # Racing number for player car
-        if self.car_type == "player":
-            stripe_color = WHITE if sum(self.color) < 400 else BLACK
-            stripe_width = int(2 * scale_factor)
-            stripe_height = int(12 * scale_factor)
-            pygame.draw.rect(screen, stripe_color, (center_x - stripe_width//2, car_y + int(14 * scale_factor), stripe_width, stripe_height))
-    
-    def draw_at_screen_position(self, screen, screen_y):
-        # Draw player car at fixed screen position (not affected by camera)
+        sprite = get_car_sprite(self.color, self.car_type, "down", self.jump_height)
+        rect = screen.blit(sprite, (self.x - CAR_SPRITE_PAD_X, car_y - CAR_SPRITE_PAD_Y))
+        return rect.union(shadow) if self.jumping else rect
+    
+    def draw_at_screen_position(self, screen, screen_y, x=None):
+        """Draw the player car at a fixed screen position (not affected by camera), returns its rect"""
+        if x is None:
+            x = self.x
         
         # Draw shadow when jumping
         if self.jumping:
-            pygame.draw.ellipse(screen, (50, 50, 50), (self.x + 5, screen_y + 34, 26, 10))
+            shadow = pygame.draw.ellipse(screen, (50, 50, 50), (x + 5, screen_y + 34, 26, 10))
         
-        # Draw car (elevated when jumping)
+        # Draw car (elevated when jumping) from the sprite cache
         car_y = screen_y - self.jump_height
-        center_x = self.x + self.width // 2
-        
-        # Calculate scale factor based on jump height for perspective effect
-        # Scale increases as car jumps higher (1.0 to 1.3)
-        scale_factor = 1.0 + (self.jump_height / 100.0) * 0.3
-        
-        # Modern F1 car design - rotated 180 degrees for player (facing forward)
-        
-        # Large rear wing (now at front - most prominent F1 feature)
-        wing_main_width = int(32 * scale_factor)
-        wing_main_height = int(3 * scale_factor)
-        wing_sub_width = int(28 * scale_factor)
-        wing_sub_height = int(2 * scale_factor)
-        pygame.draw.rect(screen, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(2 * scale_factor), wing_main_width, wing_main_height))
-        pygame.draw.rect(screen, SILVER, (center_x - wing_sub_width//2, car_y + int(-1 * scale_factor), wing_sub_width, wing_sub_height))
-        # Wing endplates
-        endplate_width = int(3 * scale_factor)
-        endplate_height = int(7 * scale_factor)
-        pygame.draw.rect(screen, DARK_GRAY, (center_x - wing_main_width//2, car_y + int(2 * scale_factor), endplate_width, endplate_height))
-        pygame.draw.rect(screen, DARK_GRAY, (center_x + wing_main_width//2 - endplate_width, car_y + int(2 * scale_factor), endplate_width, endplate_height))
-        # Wing supports
-        support_width = int(2 * scale_factor)
-        support_height = int(5 * scale_factor)
-        pygame.draw.rect(screen, DARK_GRAY, (center_x - support_width, car_y + int(2 * scale_factor), support_width, support_height))
-        pygame.draw.rect(screen, DARK_GRAY, (center_x, car_y + int(2 * scale_factor), support_width, support_height))
-        
-        # Engine cover (now at front, tapered aerodynamic front)
-        engine_width = int(4 * scale_factor)
-        engine_taper = int(8 * scale_factor)
-        pygame.draw.polygon(screen, self.color, [
-            (center_x - engine_width//2, car_y + int(4 * scale_factor)),
-            (center_x + engine_width//2, car_y + int(4 * scale_factor)),
-            (center_x + engine_taper//2, car_y + int(12 * scale_factor)),
-            (center_x - engine_taper//2, car_y + int(12 * scale_factor))
-        ])
-        
-        # Front wheels (now rear wheels after rotation - large, exposed, positioned outside main body)
-        wheel_width = int(10 * scale_factor)
-        wheel_height = int(14 * scale_factor)
-        wheel_offset = int(4 * scale_factor)
-        pygame.draw.rect(screen, BLACK, (center_x - 18 - wheel_offset, car_y + int(5 * scale_factor), wheel_width, wheel_height))
-        pygame.draw.rect(screen, BLACK, (center_x + 12 + wheel_offset, car_y + int(5 * scale_factor), wheel_width, wheel_height))
-        
-        # Side pods (large aerodynamic air intakes) - rotated
-        pod_offset = int(12 * scale_factor)
-        pod_width = int(6 * scale_factor)
-        pygame.draw.polygon(screen, self.color, [
-            (center_x - pod_offset - int(4 * scale_factor), car_y + int(12 * scale_factor)),
-            (center_x - pod_width, car_y + int(16 * scale_factor)),
-            (center_x - pod_width, car_y + int(30 * scale_factor)),
-            (center_x - pod_offset - pod_width, car_y + int(28 * scale_factor))
-        ])
-        pygame.draw.polygon(screen, self.color, [
-            (center_x + pod_offset + int(4 * scale_factor), car_y + int(12 * scale_factor)),
-            (center_x + pod_width, car_y + int(16 * scale_factor)),
-            (center_x + pod_width, car_y + int(30 * scale_factor)),
-            (center_x + pod_offset + pod_width, car_y + int(28 * scale_factor))
-        ])
-        
-        # Main monocoque (narrow central survival cell)
-        mono_width = int(8 * scale_factor)
-        mono_height = int(18 * scale_factor)
-        pygame.draw.rect(screen, self.color, (center_x - mono_width//2, car_y + int(12 * scale_factor), mono_width, mono_height))
-        
-        # Air intakes (prominent on side pods)
-        intake_width = int(3 * scale_factor)
-        intake_height = int(6 * scale_factor)
-        intake_offset = int(10 * scale_factor)
-        pygame.draw.rect(screen, BLACK, (center_x - intake_offset, car_y + int(20 * scale_factor), intake_width, intake_height))
-        pygame.draw.rect(screen, BLACK, (center_x + intake_offset - intake_width, car_y + int(20 * scale_factor), intake_width, intake_height))
-        
-        # Cockpit opening (driver area)
-        cockpit_color = BLACK
-        cockpit_width = int(6 * scale_factor)
-        cockpit_height = int(8 * scale_factor)
-        pygame.draw.rect(screen, cockpit_color, (center_x - cockpit_width//2, car_y + int(20 * scale_factor), cockpit_width, cockpit_height))
-        
-        # Driver helmet (visible in cockpit)
-        helmet_radius = int(2 * scale_factor)
-        if self.car_type == "player":
-            pygame.draw.circle(screen, WHITE, (center_x, car_y + int(24 * scale_factor)), helmet_radius)
-        else:
-            pygame.draw.circle(screen, YELLOW, (center_x, car_y + int(24 * scale_factor)), helmet_radius)
-        
-        # Rear wheels (now front wheels after rotation - large, exposed)
-        pygame.draw.rect(screen, BLACK, (center_x - 18 - wheel_offset, car_y + int(23 * scale_factor), wheel_width, wheel_height))
-        pygame.draw.rect(screen, BLACK, (center_x + 12 + wheel_offset, car_y + int(23 * scale_factor), wheel_width, wheel_height))
-        
-        # Nose cone (sharp, aerodynamic point - now pointing down/forward)
-        nose_color = (min(255, self.color[0] + 30), min(255, self.color[1] + 30), min(255, self.color[2] + 30))
-        nose_width = int(6 * scale_factor)
-        pygame.draw.polygon(screen, nose_color, [
-            (center_x, car_y + int(35 * scale_factor)),
-            (center_x - nose_width, car_y + int(30 * scale_factor)),
-            (center_x + nose_width, car_y + int(30 * scale_factor))
-        ])
-        
-        # Front wing (now rear wing - wide, multi-element aerodynamic wing)
-        pygame.draw.rect(screen, SILVER, (self.x, car_y + 37, 36, 2))
-        pygame.draw.rect(screen, DARK_GRAY, (self.x - 2, car_y + 39, 40, 3))
-        
-        # Racing number for player car
-        if self.car_type == "player":
-            stripe_color = WHITE if sum(self.color) < 400 else BLACK
-            pygame.draw.rect(screen, stripe_color, (center_x - 1, car_y + 20, 2, 12))
-    
+        sprite = get_car_sprite(self.color, self.car_type, "up", self.jump_height)
+        rect = screen.blit(sprite, (x - CAR_SPRITE_PAD_X, car_y - CAR_SPRITE_PAD_Y))
+        return rect.union(shadow) if self.jumping else rect
 
         
 class Obstacle:
+    __slots__ = ("seq", "alive", "x", "y", "prev_y", "type", "width", "height")
+    view_top, view_bottom = 0, 20
+    
     def __init__(self, x, y, obstacle_type):
+        self.seq = next(entity_sequence)
         self.x = x
         self.y = y
         self.type = obstacle_type
@@ -573,424 +1246,400 @@ class Obstacle:
         self.height = 20
         
     def draw(self, screen, camera_y):
-        draw_y = self.y - camera_y
-        if self.type == "barrel":
-            pygame.draw.ellipse(screen, BROWN, (self.x, draw_y, self.width, self.height))
-            pygame.draw.ellipse(screen, DARK_GRAY, (self.x + 5, draw_y + 5, 30, 10))
-        elif self.type == "water":
-            pygame.draw.rect(screen, WATER_COLOR, (self.x, draw_y, self.width * 3, self.height))
+        if self.type == "barrel" or self.type == "water":
+            return screen.blit(get_prop_sprite(self.type), (self.x, self.y - camera_y))
+        return None
+
+# Bridge artwork cache
+# Apart from their x position, the pieces of a bridge (towers, deck strips, arch, parapet, warning
+# sign) only depend on the bridge type and the stage's road width. They are baked once per
+# (type, road width) and a bridge on screen is drawn as a handful of blits, one deck strip per
+# road segment so the bridge still follows the curve. The pieces are blitted in the same order
+# the primitives used to be drawn in, so overlapping parts come out the same.
+BRIDGE_HEIGHT = 40
+BRIDGE_SEGMENTS = 8
+
+bridge_art_cache = {}
+
+class BridgeArt:
+    """Pre-rendered pieces of one bridge type at one road width"""
+    def __init__(self, bridge_type, road_width):
+        self.bridge_type = bridge_type
+        self.road_width = road_width
+        self.segment_strips = []  # One deck strip per segment (brick patterns differ per row)
+        self.truss_surfaces = {}  # Steel truss, keyed by the distance between the towers
+        if bridge_type == "roman":
+            bake_roman_bridge(self)
+        elif bridge_type == "steel":
+            bake_steel_bridge(self)
+        else:
+            bake_medieval_bridge(self)
+        
+        # Move the baked pieces into the texture atlas
+        for name, value in list(vars(self).items()):
+            if isinstance(value, pygame.Surface):
+                setattr(self, name, texture_atlas.add(value))
+        self.segment_strips = [texture_atlas.add(strip) for strip in self.segment_strips]
+
+def get_bridge_art(bridge_type, road_width):
+    key = (bridge_type, road_width)
+    art = bridge_art_cache.get(key)
+    if art is None:
+        art = BridgeArt(bridge_type, road_width)
+        bridge_art_cache[key] = art
+    return art
+
+def new_art_surface(width, height):
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+    return surface
+
+def bake_warning_sign(post_color, sign_color, symbol):
+    """Warning sign with its post, drawn relative to the sign's top-left corner"""
+    sign = new_art_surface(31, 46)
+    
+    # Sign post
+    pygame.draw.rect(sign, post_color, (13, 20, 4, 25))
+    
+    # Warning sign - diamond shape
+    diamond = [(15, 0), (30, 10), (15, 20), (0, 10)]  # top, right, bottom, left
+    pygame.draw.polygon(sign, sign_color, diamond)
+    pygame.draw.polygon(sign, BLACK, diamond, 2)
+    
+    if symbol == "roman":
+        # Roman arch symbol
+        pygame.draw.arc(sign, BLACK, (8, 8, 14, 8), 0, 3.14159, 2)
+        pygame.draw.rect(sign, BLACK, (7, 12, 2, 4))
+        pygame.draw.rect(sign, BLACK, (21, 12, 2, 4))
+    elif symbol == "steel":
+        # Steel truss symbol
+        pygame.draw.line(sign, BLACK, (8, 8), (22, 16), 2)
+        pygame.draw.line(sign, BLACK, (22, 8), (8, 16), 2)
+        pygame.draw.rect(sign, BLACK, (7, 12, 2, 4))
+        pygame.draw.rect(sign, BLACK, (21, 12, 2, 4))
+    else:
+        # Medieval castle symbol
+        pygame.draw.rect(sign, BLACK, (8, 12, 14, 6))
+        # Battlements
+        for i in range(0, 14, 4):
+            if i % 8 < 4:
+                pygame.draw.rect(sign, BLACK, (8 + i, 10, 4, 2))
+    return sign
+
+def bake_roman_bridge(art):
+    """Roman-style stone bridge with arches"""
+    # Roman bridge colors
+    stone_color = (180, 160, 140)
+    stone_dark = (140, 120, 100)
+    mortar_color = (220, 220, 200)
+    block_width = 12
+    block_height = 8
+    segment_height = BRIDGE_HEIGHT // BRIDGE_SEGMENTS
+    
+    # Stone pillar (the last row of blocks hangs below the pillar rect)
+    pillar_width = 25
+    pillar_height = BRIDGE_HEIGHT + 25
+    art.pillar = new_art_surface(pillar_width, pillar_height + block_height)
+    pygame.draw.rect(art.pillar, stone_color, (0, 0, pillar_width, pillar_height))
+    for row in range(0, pillar_height, block_height):
+        # Alternate block offset for realistic pattern
+        offset = (block_width // 2) if (row // block_height) % 2 else 0
+        for col in range(-offset, pillar_width + offset, block_width):
+            if col + block_width <= pillar_width and col >= 0:
+                # Individual stone block with shadow for depth
+                pygame.draw.rect(art.pillar, stone_color, (col, row, block_width - 1, block_height - 1))
+                pygame.draw.rect(art.pillar, stone_dark, (col + block_width - 2, row, 2, block_height - 1))
+                # Mortar lines
+                pygame.draw.rect(art.pillar, mortar_color, (col + block_width - 1, row, 1, block_height))
+                pygame.draw.rect(art.pillar, mortar_color, (col, row + block_height - 1, block_width, 1))
+    
+    # Arch deck strips, spanning the road width plus an adaptive extension on each side
+    extension = min(15, art.road_width * 0.1)  # Smaller extension for narrow roads
+    bridge_width = int(art.road_width + (2 * extension))
+    for i in range(BRIDGE_SEGMENTS):
+        segment_y_offset = i * segment_height
+        strip = new_art_surface(bridge_width, max(segment_height, block_height))
+        pygame.draw.rect(strip, stone_color, (0, 0, bridge_width, segment_height))
+        for row in range(0, segment_height, block_height):
+            offset = (block_width // 2) if ((segment_y_offset + row) // block_height) % 2 else 0
+            for col in range(-offset, bridge_width + offset, block_width):
+                if col + block_width <= bridge_width and col >= 0:
+                    # Stone block with shadow
+                    pygame.draw.rect(strip, stone_color, (col, row, block_width - 1, block_height - 1))
+                    pygame.draw.rect(strip, stone_dark, (col + block_width - 2, row, 2, block_height - 1))
+                    # Mortar lines
+                    pygame.draw.rect(strip, mortar_color, (col + block_width - 1, row, 1, block_height))
+                    pygame.draw.rect(strip, mortar_color, (col, row + block_height - 1, block_width, 1))
+        art.segment_strips.append(strip)
+    
+    # Decorative arch opening
+    art.arch = new_art_surface(30, 16)
+    pygame.draw.ellipse(art.arch, (50, 50, 50), (0, 0, 30, 16))
+    pygame.draw.ellipse(art.arch, stone_dark, (2, 2, 26, 12))
+    
+    art.extension = extension
+    art.top_color = mortar_color
+    art.shadow_color = (30, 30, 30)
+    art.sign = bake_warning_sign(BROWN, YELLOW, "roman")
+
+def bake_steel_bridge(art):
+    """Modern steel truss bridge"""
+    # Steel bridge colors
+    steel_color = (120, 120, 140)
+    steel_dark = (80, 80, 100)
+    steel_light = (160, 160, 180)
+    segment_height = BRIDGE_HEIGHT // BRIDGE_SEGMENTS
+    
+    # Steel support tower with highlight
+    tower_width = 8
+    tower_height = BRIDGE_HEIGHT + 30
+    art.tower = new_art_surface(tower_width, tower_height)
+    pygame.draw.rect(art.tower, steel_color, (0, 0, tower_width, tower_height))
+    pygame.draw.rect(art.tower, steel_light, (0, 0, 2, tower_height))
+    
+    # Steel deck strips (beams can poke 1px past the right edge)
+    extension = min(8, art.road_width * 0.08)  # Smaller extension for steel bridges
+    bridge_width = int(art.road_width + (2 * extension))
+    beam_spacing = 15
+    for i in range(BRIDGE_SEGMENTS):
+        segment_y_offset = i * segment_height
+        strip = new_art_surface(bridge_width + 2, segment_height)
+        pygame.draw.rect(strip, steel_color, (0, 0, bridge_width, segment_height))
+        for beam_x in range(0, bridge_width, beam_spacing):
+            # Vertical beams
+            pygame.draw.rect(strip, steel_dark, (beam_x, 0, 2, segment_height))
+            # Horizontal reinforcement
+            if segment_y_offset % 10 == 0:
+                pygame.draw.rect(strip, steel_light, (0, segment_height // 2, bridge_width, 1))
+        art.segment_strips.append(strip)
+    
+    art.extension = extension
+    art.steel_color = steel_color
+    art.shadow_color = (20, 20, 20)
+    art.sign = bake_warning_sign(steel_color, ORANGE, "steel")
+
+def get_steel_truss(art, truss_width):
+    """Truss and chords between the towers, baked per tower distance. The surface origin is
+    2px left of the left tower and 7px above the deck to leave room for the 3px lines"""
+    truss = art.truss_surfaces.get(truss_width)
+    if truss is None:
+        truss = new_art_surface(truss_width + 6, BRIDGE_HEIGHT // 2 + 12)
+        truss_segments = 6
+        truss_segment_width = truss_width // truss_segments
+        truss_y_top = 2
+        truss_y_bottom = 7 + BRIDGE_HEIGHT // 2
+        for i in range(truss_segments):
+            truss_x = 2 + (i * truss_segment_width)
+            # Diagonal truss members
+            pygame.draw.line(truss, art.steel_color, (truss_x, truss_y_top), (truss_x + truss_segment_width, truss_y_bottom), 3)
+            pygame.draw.line(truss, art.steel_color, (truss_x + truss_segment_width, truss_y_top), (truss_x, truss_y_bottom), 3)
+        # Top and bottom chords
+        pygame.draw.rect(truss, art.steel_color, (2, truss_y_top, truss_width, 3))
+        pygame.draw.rect(truss, art.steel_color, (2, truss_y_bottom, truss_width, 3))
+        truss = art.truss_surfaces[truss_width] = texture_atlas.add(truss)
+    return truss
+
+def bake_medieval_bridge(art):
+    """Medieval brick bridge with battlements"""
+    # Medieval bridge colors
+    brick_red = (160, 80, 60)
+    brick_dark = (120, 60, 40)
+    mortar_color = (200, 190, 170)
+    battlement_color = (140, 70, 50)
+    brick_width = 10
+    brick_height = 6
+    segment_height = BRIDGE_HEIGHT // BRIDGE_SEGMENTS
+    
+    # Tower with battlements and brick pattern (the last brick row hangs below the tower rect)
+    tower_width = 30
+    tower_height = BRIDGE_HEIGHT + 35
+    art.tower = new_art_surface(tower_width, tower_height + brick_height)
+    pygame.draw.rect(art.tower, brick_red, (0, 0, tower_width, tower_height))
+    for i in range(0, tower_width, 8):
+        if i % 16 < 8:  # Alternating pattern
+            pygame.draw.rect(art.tower, battlement_color, (i, 0, 8, 8))
+    for row in range(0, tower_height, brick_height):
+        # Alternate brick offset for realistic pattern
+        offset = (brick_width // 2) if (row // brick_height) % 2 else 0
+        for col in range(-offset, tower_width + offset, brick_width):
+            if col + brick_width <= tower_width and col >= 0:
+                # Individual brick with variation in color
+                pygame.draw.rect(art.tower, brick_red, (col, row, brick_width - 1, brick_height - 1))
+                if (col + row) % 4 == 0:
+                    pygame.draw.rect(art.tower, brick_dark, (col, row, brick_width - 1, brick_height - 1))
+                # Mortar lines
+                pygame.draw.rect(art.tower, mortar_color, (col + brick_width - 1, row, 1, brick_height))
+                pygame.draw.rect(art.tower, mortar_color, (col, row + brick_height - 1, brick_width, 1))
+    
+    # Bridge deck strips with moderate extensions
+    extension = min(12, art.road_width * 0.09)
+    bridge_width = int(art.road_width + (2 * extension))
+    for i in range(BRIDGE_SEGMENTS):
+        segment_y_offset = i * segment_height
+        strip = new_art_surface(bridge_width, max(segment_height, brick_height))
+        pygame.draw.rect(strip, brick_red, (0, 0, bridge_width, segment_height))
+        for row in range(0, segment_height, brick_height):
+            offset = (brick_width // 2) if ((segment_y_offset + row) // brick_height) % 2 else 0
+            for col in range(-offset, bridge_width + offset, brick_width):
+                if col + brick_width <= bridge_width and col >= 0:
+                    # Brick with variation
+                    pygame.draw.rect(strip, brick_red, (col, row, brick_width - 1, brick_height - 1))
+                    if (col + row + i) % 5 == 0:
+                        pygame.draw.rect(strip, brick_dark, (col, row, brick_width - 1, brick_height - 1))
+                    # Mortar lines
+                    pygame.draw.rect(strip, mortar_color, (col + brick_width - 1, row, 1, brick_height))
+                    pygame.draw.rect(strip, mortar_color, (col, row + brick_height - 1, brick_width, 1))
+        art.segment_strips.append(strip)
+    
+    # Pointed gothic arch
+    art.arch = new_art_surface(25, 15)
+    pygame.draw.polygon(art.arch, (40, 40, 40), [(0, 14), (12, 0), (24, 14)])
+    pygame.draw.polygon(art.arch, brick_dark, [(2, 12), (12, 2), (22, 12)])
+    
+    # Crenellated parapet (crenellations sit 3px above the 5px base)
+    art.parapet = new_art_surface(bridge_width + 12, 8)
+    pygame.draw.rect(art.parapet, battlement_color, (0, 3, bridge_width, 5))
+    for i in range(0, bridge_width, 12):
+        if i % 24 < 12:  # Alternating pattern
+            pygame.draw.rect(art.parapet, battlement_color, (i, 0, 12, 3))
+    
+    art.extension = extension
+    art.shadow_color = (25, 25, 25)
+    art.sign = bake_warning_sign(battlement_color, (200, 50, 50), "medieval")
 
 class Bridge:
-    def __init__(self, y, stage):
+    __slots__ = ("seq", "alive", "y", "prev_y", "stage", "height", "bridge_clearance", "bridge_type")
+    view_top, view_bottom = -20, 96  # Towers stick out above the deck, the warning sign hangs below
+    
+    def __init__(self, y, stage, rng=random):
+        self.seq = next(entity_sequence)
         self.y = y
         self.stage = stage
-        self.height = 40  # Bridge height
+        self.height = BRIDGE_HEIGHT  # Bridge height
         self.bridge_clearance = 25  # Height cars need to jump to clear
         # Randomly choose bridge type
-        import random
-        self.bridge_type = random.choice(["roman", "steel", "medieval"])
+        self.bridge_type = rng.choice(["roman", "steel", "medieval"])
         # Note: x and width are calculated dynamically in draw() and check_collision() 
         # to follow road curves properly
         
     def draw(self, screen, camera_y):
         draw_y = self.y - camera_y
         
-        # Draw bridge if it's anywhere near the screen (expanded range)
-        if draw_y > -100 and draw_y < 900:
-            
-            # Draw bridge in segments to follow road curves
-            # Bridge spans from self.y to self.y + self.height
-            bridge_segments = 8  # Number of segments to draw
-            segment_height = self.height // bridge_segments
-            
-            # Store road bounds for each segment
-            segment_bounds = []
-            for i in range(bridge_segments + 1):
-                segment_y = self.y + (i * segment_height)
-                road_left, road_right, road_width = get_road_bounds(segment_y, self.stage)
-                segment_bounds.append((road_left, road_right, road_width))
-            
-            # Draw bridge based on type
-            if self.bridge_type == "roman":
-                self.draw_roman_bridge(screen, draw_y, segment_bounds, bridge_segments, segment_height)
-            elif self.bridge_type == "steel":
-                self.draw_steel_bridge(screen, draw_y, segment_bounds, bridge_segments, segment_height)
-            else:  # medieval bridge
-                self.draw_medieval_bridge(screen, draw_y, segment_bounds, bridge_segments, segment_height)
-
+        # Draw bridge in segments to follow road curves
+        # Bridge spans from self.y to self.y + self.height
+        segment_height = self.height // BRIDGE_SEGMENTS
+        
+        # Store road bounds for each segment
+        segment_bounds = []
+        for i in range(BRIDGE_SEGMENTS + 1):
+            segment_y = self.y + (i * segment_height)
+            road_left, road_right, road_width = get_road_bounds(segment_y, self.stage)
+            segment_bounds.append((road_left, road_right, road_width))
+        
+        # Draw bridge based on type from its baked pieces
+        art = get_bridge_art(self.bridge_type, segment_bounds[0][2])
+        if self.bridge_type == "roman":
+            self.draw_roman_bridge(screen, draw_y, segment_bounds, art)
+        elif self.bridge_type == "steel":
+            self.draw_steel_bridge(screen, draw_y, segment_bounds, art)
+        else:  # medieval bridge
+            self.draw_medieval_bridge(screen, draw_y, segment_bounds, art)
+        
+        # Towers and parapets stick out up to 30px past the road on either side
+        left = min(bounds[0] for bounds in segment_bounds) - 30
+        right = max(bounds[1] for bounds in segment_bounds) + 30
+        return pygame.Rect(left, draw_y + self.view_top, right - left, self.view_bottom - self.view_top)
     
-    def draw_roman_bridge(self, screen, draw_y, segment_bounds, bridge_segments, segment_height):
-        """Draw a Roman-style stone bridge with arches"""
-        # Roman bridge colors
-        stone_color = (180, 160, 140)
-        stone_dark = (140, 120, 100)
-        mortar_color = (220, 220, 200)
+    def draw_deck(self, screen, draw_y, segment_bounds, art):
+        """Blit one deck strip per segment, each shifted to that segment's road position"""
+        segment_height = self.height // BRIDGE_SEGMENTS
+        screen.blits([(art.segment_strips[i], (segment_bounds[i][0] - art.extension, draw_y + i * segment_height))
+                      for i in range(BRIDGE_SEGMENTS)], 0)
+    
+    def draw_shadow_and_sign(self, screen, draw_y, art):
+        # Bridge shadow
+        shadow_road_left, shadow_road_right, shadow_road_width = get_road_bounds(self.y + 18, self.stage)
+        pygame.draw.rect(screen, art.shadow_color, (shadow_road_left + 8, draw_y + 18, shadow_road_width - 16, 25))
         
-        # Draw bridge pillars at the start and end positions
+        # Warning signs
+        if draw_y > 60 and draw_y < 150:
+            sign_road_left, sign_road_right, sign_road_width = get_road_bounds(self.y + 50, self.stage)
+            sign_x = sign_road_left + sign_road_width // 2 - 15
+            screen.blit(art.sign, (sign_x, draw_y + 50))
+    
+    def draw_roman_bridge(self, screen, draw_y, segment_bounds, art):
+        """Draw a Roman-style stone bridge with arches"""
         start_road_left, start_road_right, start_road_width = segment_bounds[0]
         end_road_left, end_road_right, end_road_width = segment_bounds[-1]
         
-        pillar_width = 25
-        pillar_height = self.height + 25
-        
-        # Left pillar - positioned at average of start and end positions
-        avg_left = (start_road_left + end_road_left) // 2
-        left_pillar_x = avg_left - 20
-        pygame.draw.rect(screen, stone_color, (left_pillar_x, draw_y - 15, pillar_width, pillar_height))
-        
-        # Right pillar - positioned at average of start and end positions  
-        avg_right = (start_road_right + end_road_right) // 2
-        right_pillar_x = avg_right - 5
-        pygame.draw.rect(screen, stone_color, (right_pillar_x, draw_y - 15, pillar_width, pillar_height))
-        
-        # Draw stone block pattern on pillars
-        block_width = 12
-        block_height = 8
-        for pillar_x in [left_pillar_x, right_pillar_x]:
-            for row in range(0, pillar_height, block_height):
-                y_pos = draw_y - 15 + row
-                # Alternate block offset for realistic pattern
-                offset = (block_width // 2) if (row // block_height) % 2 else 0
-                for col in range(-offset, pillar_width + offset, block_width):
-                    if col + block_width <= pillar_width and col >= 0:
-                        # Individual stone block
-                        pygame.draw.rect(screen, stone_color, (pillar_x + col, y_pos, block_width - 1, block_height - 1))
-                        # Add shadow for depth
-                        pygame.draw.rect(screen, stone_dark, (pillar_x + col + block_width - 2, y_pos, 2, block_height - 1))
-                        # Mortar lines
-                        pygame.draw.rect(screen, mortar_color, (pillar_x + col + block_width - 1, y_pos, 1, block_height))
-                        pygame.draw.rect(screen, mortar_color, (pillar_x + col, y_pos + block_height - 1, block_width, 1))
-        
-        # Draw Roman arch segments
-        for i in range(bridge_segments):
-            segment_y_offset = i * segment_height
-            road_left, road_right, road_width = segment_bounds[i]
-            
-            # Roman bridge spans road width with adaptive extensions based on road width
-            extension = min(15, road_width * 0.1)  # Smaller extension for narrow roads
-            bridge_left = road_left - extension
-            bridge_width = road_width + (2 * extension)
-            
-            # Draw main arch structure
-            pygame.draw.rect(screen, stone_color, (bridge_left, draw_y + segment_y_offset, bridge_width, segment_height))
-            
-            # Add stone block pattern
-            for row in range(0, segment_height, block_height):
-                y_pos = draw_y + segment_y_offset + row
-                offset = (block_width // 2) if ((segment_y_offset + row) // block_height) % 2 else 0
-                for col in range(-offset, bridge_width + offset, block_width):
-                    if col + block_width <= bridge_width and col >= 0:
-                        # Stone block with shadow
-                        pygame.draw.rect(screen, stone_color, (bridge_left + col, y_pos, block_width - 1, block_height - 1))
-                        pygame.draw.rect(screen, stone_dark, (bridge_left + col + block_width - 2, y_pos, 2, block_height - 1))
-                        # Mortar lines
-                        pygame.draw.rect(screen, mortar_color, (bridge_left + col + block_width - 1, y_pos, 1, block_height))
-                        pygame.draw.rect(screen, mortar_color, (bridge_left + col, y_pos + block_height - 1, block_width, 1))
-        
-        # Roman arch decoration at the center
-        center_road_left, center_road_right, center_road_width = segment_bounds[bridge_segments // 2]
-        arch_center_x = center_road_left + center_road_width // 2
-        arch_y = draw_y + self.height // 2
+        # Bridge pillars, positioned at average of start and end positions
+        left_pillar_x = (start_road_left + end_road_left) // 2 - 20
+        right_pillar_x = (start_road_right + end_road_right) // 2 - 5
+        screen.blit(art.pillar, (left_pillar_x, draw_y - 15))
+        screen.blit(art.pillar, (right_pillar_x, draw_y - 15))
         
-        # Draw decorative arch opening
-        pygame.draw.ellipse(screen, (50, 50, 50), (arch_center_x - 15, arch_y - 8, 30, 16))
-        pygame.draw.ellipse(screen, stone_dark, (arch_center_x - 13, arch_y - 6, 26, 12))
+        # Roman arch segments
+        self.draw_deck(screen, draw_y, segment_bounds, art)
         
-        # Stone capstone on top
-        top_road_left, top_road_right, top_road_width = segment_bounds[0]
-        extension = min(15, top_road_width * 0.1)
-        capstone_left = top_road_left - extension
-        capstone_width = top_road_width + (2 * extension)
-        pygame.draw.rect(screen, mortar_color, (capstone_left, draw_y - 3, capstone_width, 3))
+        # Decorative arch opening at the center
+        center_road_left, center_road_right, center_road_width = segment_bounds[BRIDGE_SEGMENTS // 2]
+        arch_center_x = center_road_left + center_road_width // 2
+        screen.blit(art.arch, (arch_center_x - 15, draw_y + self.height // 2 - 8))
         
-        # Bridge shadow
-        shadow_road_left, shadow_road_right, shadow_road_width = get_road_bounds(self.y + 18, self.stage)
-        shadow_left = shadow_road_left + 8
-        shadow_width = shadow_road_width - 16
-        pygame.draw.rect(screen, (30, 30, 30), (shadow_left, draw_y + 18, shadow_width, 25))
+        # Stone capstone on top
+        capstone_width = start_road_width + (2 * art.extension)
+        pygame.draw.rect(screen, art.top_color, (start_road_left - art.extension, draw_y - 3, capstone_width, 3))
         
-        # Warning signs
-        if draw_y > 60 and draw_y < 150:
-            sign_road_left, sign_road_right, sign_road_width = get_road_bounds(self.y + 50, self.stage)
-            sign_x = sign_road_left + sign_road_width // 2 - 15
-            sign_y = draw_y + 50
-            
-            # Sign post
-            pygame.draw.rect(screen, BROWN, (sign_x + 13, sign_y + 20, 4, 25))
-            
-            # Warning sign - diamond shape
-            pygame.draw.polygon(screen, YELLOW, [
-                (sign_x + 15, sign_y),      # top
-                (sign_x + 30, sign_y + 10), # right  
-                (sign_x + 15, sign_y + 20), # bottom
-                (sign_x, sign_y + 10)       # left
-            ])
-            pygame.draw.polygon(screen, BLACK, [
-                (sign_x + 15, sign_y),
-                (sign_x + 30, sign_y + 10),
-                (sign_x + 15, sign_y + 20),
-                (sign_x, sign_y + 10)
-            ], 2)
-            
-            # Roman arch symbol
-            pygame.draw.arc(screen, BLACK, (sign_x + 8, sign_y + 8, 14, 8), 0, 3.14159, 2)
-            pygame.draw.rect(screen, BLACK, (sign_x + 7, sign_y + 12, 2, 4))
-            pygame.draw.rect(screen, BLACK, (sign_x + 21, sign_y + 12, 2, 4))
+        self.draw_shadow_and_sign(screen, draw_y, art)
     
-    def draw_steel_bridge(self, screen, draw_y, segment_bounds, bridge_segments, segment_height):
+    def draw_steel_bridge(self, screen, draw_y, segment_bounds, art):
         """Draw a modern steel truss bridge"""
-        # Steel bridge colors
-        steel_color = (120, 120, 140)
-        steel_dark = (80, 80, 100)
-        steel_light = (160, 160, 180)
-        
-        # Draw steel support towers
         start_road_left, start_road_right, start_road_width = segment_bounds[0]
         end_road_left, end_road_right, end_road_width = segment_bounds[-1]
         
-        tower_width = 8
-        tower_height = self.height + 30
-        
-        # Left tower
-        avg_left = (start_road_left + end_road_left) // 2
-        left_tower_x = avg_left - 15
-        pygame.draw.rect(screen, steel_color, (left_tower_x, draw_y - 20, tower_width, tower_height))
-        pygame.draw.rect(screen, steel_light, (left_tower_x, draw_y - 20, 2, tower_height))  # Highlight
-        
-        # Right tower
-        avg_right = (start_road_right + end_road_right) // 2
-        right_tower_x = avg_right + 7
-        pygame.draw.rect(screen, steel_color, (right_tower_x, draw_y - 20, tower_width, tower_height))
-        pygame.draw.rect(screen, steel_light, (right_tower_x, draw_y - 20, 2, tower_height))  # Highlight
-        
-        # Draw steel deck segments
-        for i in range(bridge_segments):
-            segment_y_offset = i * segment_height
-            road_left, road_right, road_width = segment_bounds[i]
-            
-            # Steel bridge spans road width with adaptive extensions
-            extension = min(8, road_width * 0.08)  # Smaller extension for steel bridges
-            bridge_left = road_left - extension
-            bridge_width = road_width + (2 * extension)
-            
-            # Main steel deck
-            pygame.draw.rect(screen, steel_color, (bridge_left, draw_y + segment_y_offset, bridge_width, segment_height))
-            
-            # Steel beam pattern
-            beam_spacing = 15
-            for beam_x in range(bridge_left, bridge_left + bridge_width, beam_spacing):
-                # Vertical beams
-                pygame.draw.rect(screen, steel_dark, (beam_x, draw_y + segment_y_offset, 2, segment_height))
-                # Horizontal reinforcement
-                if segment_y_offset % 10 == 0:
-                    pygame.draw.rect(screen, steel_light, (bridge_left, draw_y + segment_y_offset + segment_height // 2, bridge_width, 1))
-        
-        # Draw truss structure
-        truss_segments = 6
-        truss_width = abs(right_tower_x - left_tower_x)
-        truss_segment_width = truss_width // truss_segments
-        
-        for i in range(truss_segments):
-            truss_x = left_tower_x + (i * truss_segment_width)
-            truss_y_top = draw_y - 5
-            truss_y_bottom = draw_y + self.height // 2
-            
-            # Diagonal truss members
-            pygame.draw.line(screen, steel_color, 
-                           (truss_x, truss_y_top), 
-                           (truss_x + truss_segment_width, truss_y_bottom), 3)
-            pygame.draw.line(screen, steel_color, 
-                           (truss_x + truss_segment_width, truss_y_top), 
-                           (truss_x, truss_y_bottom), 3)
+        # Steel support towers
+        left_tower_x = (start_road_left + end_road_left) // 2 - 15
+        right_tower_x = (start_road_right + end_road_right) // 2 + 7
+        screen.blit(art.tower, (left_tower_x, draw_y - 20))
+        screen.blit(art.tower, (right_tower_x, draw_y - 20))
         
-        # Top and bottom chords
-        pygame.draw.rect(screen, steel_color, (left_tower_x, draw_y - 5, truss_width, 3))
-        pygame.draw.rect(screen, steel_color, (left_tower_x, draw_y + self.height // 2, truss_width, 3))
+        # Steel deck segments
+        self.draw_deck(screen, draw_y, segment_bounds, art)
         
-        # Steel bridge shadow
-        shadow_road_left, shadow_road_right, shadow_road_width = get_road_bounds(self.y + 18, self.stage)
-        shadow_left = shadow_road_left + 8
-        shadow_width = shadow_road_width - 16
-        pygame.draw.rect(screen, (20, 20, 20), (shadow_left, draw_y + 18, shadow_width, 25))
+        # Truss structure with top and bottom chords
+        truss = get_steel_truss(art, abs(right_tower_x - left_tower_x))
+        screen.blit(truss, (left_tower_x - 2, draw_y - 7))
         
-        # Warning signs for steel bridge
-        if draw_y > 60 and draw_y < 150:
-            sign_road_left, sign_road_right, sign_road_width = get_road_bounds(self.y + 50, self.stage)
-            sign_x = sign_road_left + sign_road_width // 2 - 15
-            sign_y = draw_y + 50
-            
-            # Sign post
-            pygame.draw.rect(screen, steel_color, (sign_x + 13, sign_y + 20, 4, 25))
-            
-            # Warning sign - diamond shape
-            pygame.draw.polygon(screen, ORANGE, [
-                (sign_x + 15, sign_y),      # top
-                (sign_x + 30, sign_y + 10), # right  
-                (sign_x + 15, sign_y + 20), # bottom
-                (sign_x, sign_y + 10)       # left
-            ])
-            pygame.draw.polygon(screen, BLACK, [
-                (sign_x + 15, sign_y),
-                (sign_x + 30, sign_y + 10),
-                (sign_x + 15, sign_y + 20),
-                (sign_x, sign_y + 10)
-            ], 2)
-            
-            # Steel truss symbol
-            pygame.draw.line(screen, BLACK, (sign_x + 8, sign_y + 8), (sign_x + 22, sign_y + 16), 2)
-            pygame.draw.line(screen, BLACK, (sign_x + 22, sign_y + 8), (sign_x + 8, sign_y + 16), 2)
-            pygame.draw.rect(screen, BLACK, (sign_x + 7, sign_y + 12, 2, 4))
-            pygame.draw.rect(screen, BLACK, (sign_x + 21, sign_y + 12, 2, 4))
-
-    def draw_medieval_bridge(self, screen, draw_y, segment_bounds, bridge_segments, segment_height):
+        self.draw_shadow_and_sign(screen, draw_y, art)
+    
+    def draw_medieval_bridge(self, screen, draw_y, segment_bounds, art):
         """Draw a medieval brick bridge with battlements"""
-        # Medieval bridge colors
-        brick_red = (160, 80, 60)
-        brick_dark = (120, 60, 40)
-        mortar_color = (200, 190, 170)
-        battlement_color = (140, 70, 50)
-        
-        # Draw medieval towers at the start and end positions
         start_road_left, start_road_right, start_road_width = segment_bounds[0]
         end_road_left, end_road_right, end_road_width = segment_bounds[-1]
         
-        tower_width = 30
-        tower_height = self.height + 35
-        
-        # Left tower with battlements
-        avg_left = (start_road_left + end_road_left) // 2
-        left_tower_x = avg_left - 25
-        pygame.draw.rect(screen, brick_red, (left_tower_x, draw_y - 20, tower_width, tower_height))
-        
-        # Right tower with battlements
-        avg_right = (start_road_right + end_road_right) // 2
-        right_tower_x = avg_right - 5
-        pygame.draw.rect(screen, brick_red, (right_tower_x, draw_y - 20, tower_width, tower_height))
-        
-        # Draw battlements on towers
-        for tower_x in [left_tower_x, right_tower_x]:
-            battlement_y = draw_y - 20
-            for i in range(0, tower_width, 8):
-                if i % 16 < 8:  # Alternating pattern
-                    pygame.draw.rect(screen, battlement_color, (tower_x + i, battlement_y, 8, 8))
-        
-        # Draw brick pattern on towers
-        brick_width = 10
-        brick_height = 6
-        for tower_x in [left_tower_x, right_tower_x]:
-            for row in range(0, tower_height, brick_height):
-                y_pos = draw_y - 20 + row
-                # Alternate brick offset for realistic pattern
-                offset = (brick_width // 2) if (row // brick_height) % 2 else 0
-                for col in range(-offset, tower_width + offset, brick_width):
-                    if col + brick_width <= tower_width and col >= 0:
-                        # Individual brick
-                        pygame.draw.rect(screen, brick_red, (tower_x + col, y_pos, brick_width - 1, brick_height - 1))
-                        # Add variation in brick color
-                        if (col + row) % 4 == 0:
-                            pygame.draw.rect(screen, brick_dark, (tower_x + col, y_pos, brick_width - 1, brick_height - 1))
-                        # Mortar lines
-                        pygame.draw.rect(screen, mortar_color, (tower_x + col + brick_width - 1, y_pos, 1, brick_height))
-                        pygame.draw.rect(screen, mortar_color, (tower_x + col, y_pos + brick_height - 1, brick_width, 1))
-        
-        # Draw medieval bridge arch segments
-        for i in range(bridge_segments):
-            segment_y_offset = i * segment_height
-            road_left, road_right, road_width = segment_bounds[i]
-            
-            # Medieval bridge spans road width with moderate extensions
-            extension = min(12, road_width * 0.09)
-            bridge_left = road_left - extension
-            bridge_width = road_width + (2 * extension)
-            
-            # Draw main bridge structure
-            pygame.draw.rect(screen, brick_red, (bridge_left, draw_y + segment_y_offset, bridge_width, segment_height))
-            
-            # Add brick pattern to bridge
-            for row in range(0, segment_height, brick_height):
-                y_pos = draw_y + segment_y_offset + row
-                offset = (brick_width // 2) if ((segment_y_offset + row) // brick_height) % 2 else 0
-                for col in range(-offset, bridge_width + offset, brick_width):
-                    if col + brick_width <= bridge_width and col >= 0:
-                        # Brick with variation
-                        pygame.draw.rect(screen, brick_red, (bridge_left + col, y_pos, brick_width - 1, brick_height - 1))
-                        if (col + row + i) % 5 == 0:
-                            pygame.draw.rect(screen, brick_dark, (bridge_left + col, y_pos, brick_width - 1, brick_height - 1))
-                        # Mortar lines
-                        pygame.draw.rect(screen, mortar_color, (bridge_left + col + brick_width - 1, y_pos, 1, brick_height))
-                        pygame.draw.rect(screen, mortar_color, (bridge_left + col, y_pos + brick_height - 1, brick_width, 1))
-        
-        # Medieval arch decoration
-        center_road_left, center_road_right, center_road_width = segment_bounds[bridge_segments // 2]
-        arch_center_x = center_road_left + center_road_width // 2
-        arch_y = draw_y + self.height // 2
+        # Medieval towers with battlements, positioned at average of start and end positions
+        left_tower_x = (start_road_left + end_road_left) // 2 - 25
+        right_tower_x = (start_road_right + end_road_right) // 2 - 5
+        screen.blit(art.tower, (left_tower_x, draw_y - 20))
+        screen.blit(art.tower, (right_tower_x, draw_y - 20))
         
-        # Draw pointed gothic arch
-        pygame.draw.polygon(screen, (40, 40, 40), [
-            (arch_center_x - 12, arch_y + 6),
-            (arch_center_x, arch_y - 8),
-            (arch_center_x + 12, arch_y + 6)
-        ])
-        pygame.draw.polygon(screen, brick_dark, [
-            (arch_center_x - 10, arch_y + 4),
-            (arch_center_x, arch_y - 6),
-            (arch_center_x + 10, arch_y + 4)
-        ])
+        # Medieval bridge arch segments
+        self.draw_deck(screen, draw_y, segment_bounds, art)
         
-        # Crenellated parapet on top
-        top_road_left, top_road_right, top_road_width = segment_bounds[0]
-        extension = min(12, top_road_width * 0.09)
-        parapet_left = top_road_left - extension
-        parapet_width = top_road_width + (2 * extension)
+        # Pointed gothic arch at the center
+        center_road_left, center_road_right, center_road_width = segment_bounds[BRIDGE_SEGMENTS // 2]
+        arch_center_x = center_road_left + center_road_width // 2
+        screen.blit(art.arch, (arch_center_x - 12, draw_y + self.height // 2 - 8))
         
-        # Base parapet
-        pygame.draw.rect(screen, battlement_color, (parapet_left, draw_y - 5, parapet_width, 5))
+        # Crenellated parapet on top
+        screen.blit(art.parapet, (start_road_left - art.extension, draw_y - 8))
         
-        # Crenellations (battlements)
-        for i in range(0, parapet_width, 12):
-            if i % 24 < 12:  # Alternating pattern
-                pygame.draw.rect(screen, battlement_color, (parapet_left + i, draw_y - 8, 12, 3))
-        
-        # Bridge shadow
-        shadow_road_left, shadow_road_right, shadow_road_width = get_road_bounds(self.y + 18, self.stage)
-        shadow_left = shadow_road_left + 8
-        shadow_width = shadow_road_width - 16
-        pygame.draw.rect(screen, (25, 25, 25), (shadow_left, draw_y + 18, shadow_width, 25))
-        
-        # Warning signs for medieval bridge
-        if draw_y > 60 and draw_y < 150:
-            sign_road_left, sign_road_right, sign_road_width = get_road_bounds(self.y + 50, self.stage)
-            sign_x = sign_road_left + sign_road_width // 2 - 15
-            sign_y = draw_y + 50
-            
-            # Sign post
-            pygame.draw.rect(screen, battlement_color, (sign_x + 13, sign_y + 20, 4, 25))
-            
-            # Warning sign - diamond shape
-            pygame.draw.polygon(screen, (200, 50, 50), [  # Dark red for medieval
-                (sign_x + 15, sign_y),      # top
-                (sign_x + 30, sign_y + 10), # right  
-                (sign_x + 15, sign_y + 20), # bottom
-                (sign_x, sign_y + 10)       # left
-            ])
-            pygame.draw.polygon(screen, BLACK, [
-                (sign_x + 15, sign_y),
-                (sign_x + 30, sign_y + 10),
-                (sign_x + 15, sign_y + 20),
-                (sign_x, sign_y + 10)
-            ], 2)
-            
-            # Medieval castle symbol
-            pygame.draw.rect(screen, BLACK, (sign_x + 8, sign_y + 12, 14, 6))
-            # Battlements
-            for i in range(0, 14, 4):
-                if i % 8 < 4:
-                    pygame.draw.rect(screen, BLACK, (sign_x + 8 + i, sign_y + 10, 4, 2))
-
-    def check_collision(self, car):
-        """Check if car collides with bridge (fails to jump over it)"""
-        # Get current road bounds to follow road curves
-        bridge_left, bridge_right, bridge_width = get_road_bounds(self.y, self.stage)
+        self.draw_shadow_and_sign(screen, draw_y, art)
+
+    def check_collision(self, car):
+        """Check if car collides with bridge (fails to jump over it)"""
+        # Get current road bounds to follow road curves
+        bridge_left, bridge_right, bridge_width = get_road_bounds(self.y, self.stage)
         
         # Check if car is in bridge area
         car_left = car.x
@@ -1012,7 +1661,11 @@ class Bridge:
         return False
 
 class Pickup:
+    __slots__ = ("seq", "alive", "x", "y", "prev_y", "type", "width", "height")
+    view_top, view_bottom = 0, 20
+    
     def __init__(self, x, y, pickup_type):
+        self.seq = next(entity_sequence)
         self.x = x
         self.y = y
         self.type = pickup_type
@@ -1020,75 +1673,149 @@ class Pickup:
         self.height = 20
         
     def draw(self, screen, camera_y):
-        draw_y = self.y - camera_y
         if self.type == "fuel":
-            # Make fuel pickups more visible with a gas can design
-            pygame.draw.rect(screen, RED, (self.x, draw_y, self.width, self.height))
-            pygame.draw.rect(screen, WHITE, (self.x + 3, draw_y + 3, 14, 14))
-            pygame.draw.rect(screen, RED, (self.x + 6, draw_y + 6, 8, 8))
-            # Add "F" for fuel
-            pygame.draw.rect(screen, WHITE, (self.x + 8, draw_y + 8, 2, 6))
-            pygame.draw.rect(screen, WHITE, (self.x + 8, draw_y + 8, 4, 2))
-            pygame.draw.rect(screen, WHITE, (self.x + 8, draw_y + 11, 3, 2))
+            return screen.blit(get_prop_sprite("fuel_can"), (self.x, self.y - camera_y))
+        return None
+
+# Scenery atlas
+# Each stage theme's scenery types are baked into the texture atlas, SCENERY_VARIANTS cells per
+# type, and a piece of scenery is drawn as a single blit of its cell. Variant 0 is the original
+# artwork; the others shift sizes and shades a little, seeded by type and variant number so every
+# run bakes the same atlas. Spawns pick a variant from the effects RNG, which leaves the gameplay
+# RNG sequence untouched.
+SCENERY_THEMES = {
+    1: ["tree", "tree", "house"],  # Green/suburban theme - more trees than houses
+    2: ["water_feature", "water_feature", "water_feature"],  # Water theme - only water-related scenery
+    3: ["tree", "water_feature", "house"],  # Industrial/water theme - trees and water features
+}
+DESERT_SCENERY = ["cactus", "cactus", "rock"]  # Desert theme for higher stages - more cacti than rocks
+SCENERY_VARIANTS = 4
+SCENERY_ORIGIN_X = 9  # Roofs and rocks reach 9px left of the scenery x
+SCENERY_ORIGIN_Y = 7  # Roofs peak 7px above the scenery y
+SCENERY_CELL_WIDTH = 44
+SCENERY_CELL_HEIGHT = 48
+
+scenery_atlases = {}
+scenery_cells = {}  # (type, variant) -> atlas region, shared by every theme with that type
+
+def scenery_theme(stage):
+    return SCENERY_THEMES.get(stage, DESERT_SCENERY)
+
+def shade(color, amount):
+    return tuple(max(0, min(255, channel + amount)) for channel in color)
+
+def draw_scenery_art(surface, x, y, scenery_type, variant):
+    """Draw one scenery variant with its scenery position at (x, y)"""
+    rng = random.Random("%s-%d" % (scenery_type, variant))
+    jitter = (lambda low, high: rng.randint(low, high)) if variant else (lambda low, high: 0)
+    
+    if scenery_type == "tree":
+        # Tree trunk (50% bigger)
+        pygame.draw.rect(surface, shade(BROWN, jitter(-20, 20)), (x + 7, y + 18, 12, 22))
+        # Tree foliage (green circle) - 50% bigger
+        pygame.draw.circle(surface, shade(DARK_GREEN, jitter(-20, 30)), (x + 13, y + 15), 18 + jitter(-4, 0))
+        # Tree highlights - 50% bigger
+        pygame.draw.circle(surface, GREEN, (x + 8 + jitter(-2, 3), y + 10 + jitter(0, 3)), 6 + jitter(-2, 0))
+        
+    elif scenery_type == "house":
+        # House base (50% bigger)
+        pygame.draw.rect(surface, shade(BROWN, jitter(-25, 25)), (x - 6, y + 8, 38, 30))
+        # Roof (50% bigger)
+        roof_color = RED if not variant else rng.choice([RED, (170, 40, 40), (90, 60, 50), (110, 110, 125)])
+        pygame.draw.polygon(surface, roof_color, [
+            (x - 9, y + 8),
+            (x + 12, y - 7),
+            (x + 33, y + 8)
+        ])
+        # Door (50% bigger)
+        pygame.draw.rect(surface, DARK_GRAY, (x + 6 + jitter(-4, 0), y + 23, 9, 15))
+        # Window (50% bigger), lit or dark
+        window_color = YELLOW if not variant or rng.random() < 0.6 else (60, 70, 90)
+        pygame.draw.rect(surface, window_color, (x + 18, y + 15, 8, 8))
+        
+    elif scenery_type == "water_feature":
+        # Water lily pad or small pond (50% bigger)
+        pond_width = 30 + jitter(-6, 0)
+        pygame.draw.ellipse(surface, shade(WATER_COLOR, jitter(-20, 20)), (x - 5, y + 15, pond_width, 22))
+        pygame.draw.ellipse(surface, DARK_GREEN, (x + 3 + jitter(-3, 4), y + 18 + jitter(0, 6), 12, 9))
+        
+    elif scenery_type == "cactus":
+        # Desert cactus (50% bigger), shorter variants keep their base on the ground
+        color = shade(DARK_GREEN, jitter(-10, 30))
+        trunk_top = 2 + jitter(0, 8)
+        pygame.draw.rect(surface, color, (x + 9, y + trunk_top, 9, 40 - trunk_top))
+        # Cactus arms (50% bigger)
+        pygame.draw.rect(surface, color, (x + 1, y + 10 + jitter(0, 8), 12, 6))
+        pygame.draw.rect(surface, color, (x + 18, y + 17 + jitter(-5, 6), 12, 6))
+        # Cactus spines (50% bigger spacing)
+        for i in range(3):
+            pygame.draw.circle(surface, WHITE, (x + 13, y + 10 + i * 12), 1)
+            
+    elif scenery_type == "rock":
+        # Desert rock formation (50% bigger)
+        pygame.draw.ellipse(surface, shade(GRAY, jitter(-25, 15)), (x - 6, y + 18, 38 + jitter(-8, 0), 18))
+        pygame.draw.ellipse(surface, shade(LIGHT_GRAY, jitter(-30, 10)), (x - 1 + jitter(-3, 3), y + 10 + jitter(0, 4), 22, 15))
+
+class SceneryAtlas:
+    """Every variant of a theme's scenery types, as regions of the texture atlas. Cells are baked
+    one at a time by bake_next(), so the stage warmup can spread a theme over several frames"""
+    def __init__(self, types):
+        self.types = types
+        self.cells = {}
+        self.pending = [(scenery_type, variant) for scenery_type in types for variant in range(SCENERY_VARIANTS)]
+    
+    def bake_next(self):
+        key = self.pending.pop(0)
+        self.cells[key] = get_scenery_cell(*key)
+
+def draw_scenery_cell(scenery_type, variant):
+    """Draw one scenery variant into a new atlas cell sized surface"""
+    cell = new_art_surface(SCENERY_CELL_WIDTH, SCENERY_CELL_HEIGHT)
+    draw_scenery_art(cell, SCENERY_ORIGIN_X, SCENERY_ORIGIN_Y, scenery_type, variant)
+    return cell
+
+def get_scenery_cell(scenery_type, variant):
+    cell = scenery_cells.get((scenery_type, variant))
+    if cell is None:
+        cell = scenery_cells[scenery_type, variant] = texture_atlas.add(draw_scenery_cell(scenery_type, variant))
+    return cell
+
+def get_scenery_atlas(stage, complete=True):
+    """Return the atlas for a stage's scenery theme, baking whatever is left of it unless complete is False"""
+    types = tuple(sorted(set(scenery_theme(stage))))
+    atlas = scenery_atlases.get(types)
+    if atlas is None:
+        atlas = scenery_atlases[types] = SceneryAtlas(types)
+    while complete and atlas.pending:
+        atlas.bake_next()
+    return atlas
 
 class Scenery:
-    def __init__(self, x, y, scenery_type, stage):
+    __slots__ = ("alive", "x", "y", "prev_y", "type", "stage", "variant", "width", "height", "cell")
+    view_top, view_bottom = -7, 40  # House roofs peak 7px above y
+    
+    def __init__(self, x, y, scenery_type, stage, variant=0):
         self.x = x
         self.y = y
         self.type = scenery_type
         self.stage = stage
+        self.variant = variant
         self.width = 30
         self.height = 40
+        self.cell = None  # Atlas cell, looked up on the first draw so headless runs never bake art
         
     def draw(self, screen, camera_y):
-        draw_y = self.y - camera_y
-        
-        # Only draw if on screen
-        if draw_y > -60 and draw_y < 860:
-            if self.type == "tree":
-                # Tree trunk (50% bigger)
-                pygame.draw.rect(screen, BROWN, (self.x + 7, draw_y + 18, 12, 22))
-                # Tree foliage (green circle) - 50% bigger
-                pygame.draw.circle(screen, DARK_GREEN, (self.x + 13, draw_y + 15), 18)
-                # Tree highlights - 50% bigger
-                pygame.draw.circle(screen, GREEN, (self.x + 8, draw_y + 10), 6)
-                
-            elif self.type == "house":
-                # House base (50% bigger)
-                pygame.draw.rect(screen, BROWN, (self.x - 6, draw_y + 8, 38, 30))
-                # Roof (50% bigger)
-                pygame.draw.polygon(screen, RED, [
-                    (self.x - 9, draw_y + 8),
-                    (self.x + 12, draw_y - 7),
-                    (self.x + 33, draw_y + 8)
-                ])
-                # Door (50% bigger)
-                pygame.draw.rect(screen, DARK_GRAY, (self.x + 6, draw_y + 23, 9, 15))
-                # Window (50% bigger)
-                pygame.draw.rect(screen, YELLOW, (self.x + 18, draw_y + 15, 8, 8))
-                
-            elif self.type == "water_feature":
-                # Water lily pad or small pond (50% bigger)
-                pygame.draw.ellipse(screen, WATER_COLOR, (self.x - 5, draw_y + 15, 30, 22))
-                pygame.draw.ellipse(screen, DARK_GREEN, (self.x + 3, draw_y + 18, 12, 9))
-                
-            elif self.type == "cactus":
-                # Desert cactus (50% bigger)
-                pygame.draw.rect(screen, DARK_GREEN, (self.x + 9, draw_y + 2, 9, 38))
-                # Cactus arms (50% bigger)
-                pygame.draw.rect(screen, DARK_GREEN, (self.x + 1, draw_y + 10, 12, 6))
-                pygame.draw.rect(screen, DARK_GREEN, (self.x + 18, draw_y + 17, 12, 6))
-                # Cactus spines (50% bigger spacing)
-                for i in range(3):
-                    pygame.draw.circle(screen, WHITE, (self.x + 13, draw_y + 10 + i * 12), 1)
-                    
-            elif self.type == "rock":
-                # Desert rock formation (50% bigger)
-                pygame.draw.ellipse(screen, GRAY, (self.x - 6, draw_y + 18, 38, 18))
-                pygame.draw.ellipse(screen, LIGHT_GRAY, (self.x - 1, draw_y + 10, 22, 15))
+        cell = self.cell
+        if cell is None:
+            cell = self.cell = get_scenery_cell(self.type, self.variant)
+        return screen.blit(cell, (self.x - SCENERY_ORIGIN_X, self.y - camera_y - SCENERY_ORIGIN_Y))
 
 class FuelPump:
+    __slots__ = ("seq", "alive", "x", "y", "prev_y", "width", "height")
+    view_top, view_bottom = 0, 40
+    
     def __init__(self, x, y):
+        self.seq = next(entity_sequence)
         self.x = x
         self.y = y
         self.width = 25
@@ -1096,55 +1823,242 @@ class FuelPump:
         
     def draw(self, screen, camera_y):
         draw_y = self.y - camera_y
-        
-        # Only draw if on screen
-        if draw_y > -50 and draw_y < 850:
-            # Fuel pump base (gray)
-            pygame.draw.rect(screen, GRAY, (self.x, draw_y + 20, self.width, 20))
-        
-        # Fuel pump top (red)
-        pygame.draw.rect(screen, RED, (self.x + 3, draw_y + 10, 19, 15))
-        
-        # Pump handle (black)
-        pygame.draw.rect(screen, BLACK, (self.x + 20, draw_y + 15, 8, 3))
-        
-        # Display screen (green)
-        pygame.draw.rect(screen, GREEN, (self.x + 6, draw_y + 12, 8, 6))
-        
-        # Fuel nozzle (silver)
-        pygame.draw.rect(screen, SILVER, (self.x + 22, draw_y + 18, 6, 2))
-        
-        # Base details
-        pygame.draw.rect(screen, DARK_GRAY, (self.x + 2, draw_y + 35, 21, 3))
+        rect = screen.blit(get_prop_sprite("fuel_pump"), (self.x, draw_y))
         
         # "FUEL" text
-        font = pygame.font.SysFont("monospace", 8, bold=True)
-        fuel_text = font.render("FUEL", 1, WHITE)
-        screen.blit(fuel_text, (self.x + 4, draw_y + 2))
+        return rect.union(screen.blit(get_prop_sprite("fuel_pump_label"), (self.x + 4, draw_y + 2)))
 
-def get_road_curve(y, stage):
-    """Calculate road curve offset based on y position and stage"""
+# Sprite bake cache
+# Every car, scenery and prop sprite is baked while the title screen is up instead of on first use.
+# With BNJ_BAKE_JOBS above 1 the jobs are split over a process pool that sends back raw RGBA
+# buffers, which the parent wraps into surfaces. They are packed into atlas pages of their own,
+# and those pages are written to one file in SPRITE_CACHE_DIR (BNJ_SPRITE_CACHE, 0 turns it off)
+# named by a hash of the drawing code, every helper and constant it uses, and the job list, so a
+# warm start maps that file and rebuilds the pages with one blit each. Writing a new cache file
+# only removes files of the same format version, never anything else in the directory. Bridges
+# and text still bake on demand, they depend on road widths and system fonts. --bench-startup
+# reports the bake time.
+SPRITE_CACHE_VERSION = 1  # Bump when the file layout changes, or art changes in a way the hash can't see
+SPRITE_CACHE_PREFIX = f"sprites-v{SPRITE_CACHE_VERSION}-"
+SPRITE_CACHE_DIR = os.environ.get("BNJ_SPRITE_CACHE", os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "bump_and_jump"))
+SPRITE_BAKE_JOBS = int(os.environ.get("BNJ_BAKE_JOBS", 1))  # Worker processes for a cold bake
+CACHED_PROPS = ["barrel", "water", "fuel_can", "fuel_pump"]  # The pump label is text
+
+sprite_bake_stats = {}
+
+def sprite_bake_jobs():
+    """Every sprite the game can draw outside bridges and text, as ("car", color, car_type, facing,
+    step), ("scenery", type, variant) or ("prop", name) tuples"""
+    steps = range(CAR_SPRITE_SCALE_STEPS + 1)
+    jobs = [("car", tuple(color), "enemy", "down", step) for color in CAR_COLORS for step in steps]
+    jobs += [("car", RED, "player", "up", step) for step in steps]
+    scenery_types = sorted(set(DESERT_SCENERY).union(*SCENERY_THEMES.values()))
+    jobs += [("scenery", scenery_type, variant) for scenery_type in scenery_types for variant in range(SCENERY_VARIANTS)]
+    jobs += [("prop", name) for name in CACHED_PROPS]
+    return jobs
+
+def rasterize_sprite(job):
+    if job[0] == "car":
+        return draw_car_sprite(*job[1:])
+    if job[0] == "scenery":
+        return draw_scenery_cell(*job[1:])
+    return draw_prop(job[1])
+
+def rasterize_sprite_batch(jobs):
+    """Pool worker: draw a batch of jobs and return ((width, height), RGBA bytes) for each"""
+    return [(sprite.get_size(), pygame.image.tobytes(sprite, "RGBA")) for sprite in map(rasterize_sprite, jobs)]
+
+def bake_sprite_buffers(jobs, workers):
+    if workers <= 1:
+        return rasterize_sprite_batch(jobs)
+    size = -(-len(jobs) // workers)
+    batches = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+    with multiprocessing.Pool(len(batches)) as pool:
+        return [result for batch in pool.map(rasterize_sprite_batch, batches) for result in batch]
+
+def code_fingerprint(code):
+    """Bytecode, names and constants of a function, without the line numbers so unrelated edits
+    elsewhere in the file keep the cache"""
+    parts = [code.co_code, repr(code.co_names).encode()]
+    for const in code.co_consts:
+        parts.append(code_fingerprint(const) if inspect.iscode(const) else repr(const).encode())
+    return b"".join(parts)
+
+def code_names(code):
+    """Every global name a function or the functions nested in it refer to"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= code_names(const)
+    return names
+
+def sprite_code_digest(roots):
+    """Fingerprints of the roots and of every function of this module they call, directly or not,
+    plus the values of the upper case constants any of them read"""
+    module_globals = globals()
+    seen = set()
+    pending = list(roots)
+    parts = []
+    while pending:
+        function = pending.pop()
+        if function.__name__ in seen:
+            continue
+        seen.add(function.__name__)
+        parts.append((function.__name__, code_fingerprint(function.__code__)))
+        for name in sorted(code_names(function.__code__)):
+            value = module_globals.get(name)
+            if inspect.isfunction(value) and value.__globals__ is module_globals:
+                pending.append(value)
+            elif name.isupper() and name not in seen:
+                seen.add(name)
+                parts.append((name, repr(value).encode()))
+    return b"".join(name.encode() + part for name, part in sorted(parts))
+
+def sprite_cache_path(jobs, cache_dir=SPRITE_CACHE_DIR):
+    digest = hashlib.sha256()
+    # Colors and the sprite and atlas layout constants, on top of those the drawing code reads
+    constants = [(name, value) for name, value in sorted(globals().items()) if name.isupper() and
+                 (type(value) is tuple or name.startswith(("CAR_SPRITE_", "SCENERY_", "ATLAS_")))]
+    digest.update(repr((SPRITE_CACHE_VERSION, sys.version, pygame.version.ver, constants, jobs)).encode())
+    digest.update(sprite_code_digest([rasterize_sprite, new_art_surface]))
+    return os.path.join(cache_dir, SPRITE_CACHE_PREFIX + digest.hexdigest()[:16] + ".bin")
+
+def write_sprite_cache(path, jobs, atlas, regions):
+    """Save the atlas pages the jobs were packed into as a JSON header line followed by the raw
+    page pixels, replacing caches this format version wrote for older drawing code"""
+    page_surfaces = [page.surface for page in atlas.pages]
+    header = {
+        "version": SPRITE_CACHE_VERSION,
+        "jobs": jobs,
+        "pages": [[page.kind, page.width, page.height, page.shelves, page.free_y, page.used_area] for page in atlas.pages],
+        "regions": [[page_surfaces.index(region.get_parent())] + list(region.get_offset()) + list(region.get_size())
+                    for region in regions],
+    }
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        f.write(json.dumps(header).encode() + b"\n")
+        for page in atlas.pages:
+            f.write(pygame.image.tobytes(page.surface, "RGBA"))
+    os.replace(path + ".tmp", path)
+    for name in os.listdir(cache_dir):
+        if name.startswith(SPRITE_CACHE_PREFIX) and name.endswith(".bin") and name != os.path.basename(path):
+            os.remove(os.path.join(cache_dir, name))
+
+def read_sprite_cache(path, jobs):
+    """Map a cache file and rebuild its pages, returns (atlas, regions) or None if it is missing or stale"""
+    try:
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    with data:
+        end = data.find(b"\n")
+        try:
+            header = json.loads(data[:end])
+        except ValueError:
+            return None
+        if header.get("version") != SPRITE_CACHE_VERSION or json.loads(json.dumps(jobs)) != header.get("jobs"):
+            return None
+        if len(data) != end + 1 + sum(4 * width * height for _, width, height, *_ in header["pages"]):
+            return None
+        
+        atlas = TextureAtlas()
+        offset = end + 1
+        pixels = memoryview(data)
+        for kind, width, height, shelves, free_y, used_area in header["pages"]:
+            page = AtlasPage(kind, width, height)
+            image = pygame.image.frombuffer(pixels[offset:offset + 4 * width * height], (width, height), "RGBA")
+            page.surface.blit(image, (0, 0), special_flags=pygame.BLEND_RGBA_MAX if kind == "alpha" else 0)
+            del image
+            page.shelves, page.free_y, page.used_area = shelves, free_y, used_area
+            atlas.pages.append(page)
+            offset += 4 * width * height
+        pixels.release()
+    
+    regions = []
+    for index, x, y, width, height in header["regions"]:
+        page = atlas.pages[index]
+        region = page.surface.subsurface((x, y, width, height))
+        if page.kind == "key":
+            region.set_colorkey(ATLAS_COLORKEY, pygame.RLEACCEL)
+        regions.append(region)
+    atlas.regions = len(regions)
+    return atlas, regions
+
+def prebake_sprites(workers=None, cache_dir=None):
+    """Put every car, scenery and prop sprite in the texture atlas, from the disk cache when it is warm"""
+    if sprite_bake_stats:
+        return sprite_bake_stats
+    start = time.perf_counter()
+    cache_dir = SPRITE_CACHE_DIR if cache_dir is None else cache_dir
+    jobs = sprite_bake_jobs()
+    path = sprite_cache_path(jobs, cache_dir) if cache_dir not in ("", "0") else None
+    cached = read_sprite_cache(path, jobs) if path else None
+    if cached is not None:
+        atlas, regions = cached
+        sprite_bake_stats["source"] = "cache"
+    else:
+        # The jobs get pages of their own, which are what the cache saves
+        workers = workers or SPRITE_BAKE_JOBS
+        atlas = TextureAtlas()
+        regions = [atlas.add(pygame.image.frombuffer(pixels, size, "RGBA"))
+                   for size, pixels in bake_sprite_buffers(jobs, workers)]
+        sprite_bake_stats["source"] = f"baked by {workers} worker{'s' if workers > 1 else ''}"
+        if path:
+            try:
+                write_sprite_cache(path, jobs, atlas, regions)
+            except OSError:
+                path = None  # Read-only or full disk, bake again next time
+    texture_atlas.pages.extend(atlas.pages)
+    texture_atlas.regions += atlas.regions
+    
+    for job, sprite in zip(jobs, regions):
+        if job[0] == "car":
+            car_sprite_cache[job[1:]] = sprite
+        elif job[0] == "scenery":
+            scenery_cells[job[1:]] = sprite
+        else:
+            prop_sprites[job[1]] = sprite
+    
+    sprite_bake_stats["sprites"] = len(jobs)
+    sprite_bake_stats["cache"] = path
+    sprite_bake_stats["ms"] = round((time.perf_counter() - start) * 1000, 1)
+    mark_startup("sprites")
+    return sprite_bake_stats
+
+def road_curve_params(stage):
+    """Return (frequency, amplitude) of the sine road curve for a stage"""
     # Gentle curves for all stages - gradual progression
     if stage == 1:
         # Gentle S-curves
-        return math.sin(y * 0.003) * 30
+        return 0.003, 30
     elif stage == 2:
         # Slightly more curves but still gentle
-        return math.sin(y * 0.0032) * 35
+        return 0.0032, 35
     elif stage == 3:
         # Moderate curves
-        return math.sin(y * 0.0035) * 40
+        return 0.0035, 40
     elif stage == 4:
         # More winding curves
-        return math.sin(y * 0.004) * 45
+        return 0.004, 45
     else:
         # Challenging curves for high stages
-        return math.sin(y * 0.004) * 50
+        return 0.004, 50
 
-def get_road_bounds(y, stage):
-    """Get the left and right boundaries of the road at a given y position"""
+def get_road_curve(y, stage):
+    """Calculate road curve offset based on y position and stage"""
+    frequency, amplitude = road_curve_params(stage)
+    return math.sin(y * frequency) * amplitude
+
+def get_road_width(stage):
     base_road_width = 300  # 50% wider than original 200px
-    road_width = max(base_road_width - (stage - 1) * 20, 180)  # Minimum 180px width
+    return max(base_road_width - (stage - 1) * 20, 180)  # Minimum 180px width
+
+def compute_road_bounds(y, stage):
+    """Get the left and right boundaries of the road at a given y position, straight from the curve"""
+    road_width = get_road_width(stage)
     
     curve_offset = get_road_curve(y, stage)
     road_center = 300 + curve_offset  # Screen center (600/2) + curve
@@ -1162,175 +2076,1154 @@ def get_road_bounds(y, stage):
     
     return int(road_left), int(road_right), int(road_width)
 
-def draw_road(screen, camera_y, stage):
-    # Draw themed background based on stage - alternating green and sandy yellow
-    if stage % 2 == 1:
-        # Odd stages (1, 3, 5, etc.) - Green theme
-        screen.fill(GRASS_COLOR)  # Green background
-    else:
-        # Even stages (2, 4, 6, etc.) - Sandy yellow theme
-        screen.fill((200, 180, 100))  # Sandy yellow background
+# Road geometry tables
+# The road curve is a pure periodic function of (y, stage), so each stage gets a table of the
+# road center sampled at every pixel over one period. Lookups interpolate linearly between
+# samples. The interpolation error is far below ROAD_TABLE_EPSILON, so whenever a center lands
+# that close to a pixel boundary the exact curve is used instead, and lookups return exactly
+# the same ints as compute_road_bounds.
+ROAD_TABLE_EPSILON = 1e-3
+
+road_tables = {}
+
+class RoadTable:
+    def __init__(self, stage):
+        self.stage = stage
+        self.frequency, self.amplitude = road_curve_params(stage)
+        self.period = 2 * math.pi / self.frequency
+        self.road_width = get_road_width(stage)
+        self.half_width = self.road_width // 2
+        # Whether the curve can ever push the road past the screen margins
+        self.may_clamp = 300 - self.amplitude - self.half_width < 50 or 300 + self.amplitude + self.half_width > 550
+        
+        # One sample per pixel over a full period, plus one so every interval has an end point
+        samples = int(math.ceil(self.period)) + 2
+        if load_numpy() is not None:
+            self.centers_array = 300 + np.sin(np.arange(samples) * self.frequency) * self.amplitude
+            self.centers = self.centers_array.tolist()
+        else:
+            self.centers_array = None
+            self.centers = [300 + get_road_curve(i, stage) for i in range(samples)]
     
-    # Draw road segments with curves
-    for y in range(0, 800, 10):  # Draw in 10px segments for smooth curves
-        world_y = camera_y + y
-        road_left, road_right, road_width = get_road_bounds(world_y, stage)
-        
+    def bounds(self, y):
+        """Scalar lookup, returns (left, right, width) like compute_road_bounds"""
+        t = y % self.period
+        i = int(t)
+        center = self.centers[i]
+        center += (t - i) * (self.centers[i + 1] - center)
+        fraction = center - int(center)
+        if fraction < ROAD_TABLE_EPSILON or fraction > 1 - ROAD_TABLE_EPSILON:
+            return compute_road_bounds(y, self.stage)
+        
+        road_left = center - self.half_width
+        road_right = center + self.half_width
+        
+        # Shifting the road back on screen cancels out the curve, so use the exact path for it
+        if road_left < 50 or road_right > 550:
+            return compute_road_bounds(y, self.stage)
+        return int(road_left), int(road_right), self.road_width
+    
+    def bounds_batch(self, ys):
+        """Vectorized lookup for a sequence of y positions, returns (lefts, rights, widths) int arrays"""
+        if np is None:
+            lefts, rights, widths = [], [], []
+            for y in ys:
+                road_left, road_right, road_width = self.bounds(y)
+                lefts.append(road_left)
+                rights.append(road_right)
+                widths.append(road_width)
+            return lefts, rights, widths
+        
+        ys = np.asarray(ys, dtype=np.float64)
+        t = np.mod(ys, self.period)
+        i = t.astype(np.intp)
+        center = self.centers_array[i]
+        center += (t - i) * (self.centers_array[i + 1] - center)
+        
+        road_left = (center - self.half_width).astype(np.int64)
+        road_right = (center + self.half_width).astype(np.int64)
+        
+        # Use the exact path next to pixel boundaries and wherever the road is kept on screen
+        fraction = center - np.floor(center)
+        exact = (fraction < ROAD_TABLE_EPSILON) | (fraction > 1 - ROAD_TABLE_EPSILON)
+        if self.may_clamp:
+            exact |= (center - self.half_width < 50) | (center + self.half_width > 550)
+        for k in np.flatnonzero(exact):
+            road_left[k], road_right[k], _ = compute_road_bounds(float(ys[k]), self.stage)
+        
+        widths = np.full(len(ys), self.road_width, dtype=np.int64)
+        return road_left, road_right, widths
 
+def get_road_table(stage):
+    table = road_tables.get(stage)
+    if table is None:
+        table = RoadTable(stage)
+        road_tables[stage] = table
+    return table
+
+def get_road_bounds(y, stage):
+    """Get the left and right boundaries of the road at a given y position"""
+    return get_road_table(stage).bounds(y)
+
+def get_road_bounds_batch(ys, stage):
+    """Get the road boundaries for many y positions at once, as (lefts, rights, widths)"""
+    return get_road_table(stage).bounds_batch(ys)
+
+def benchmark_road_bounds(calls=200000):
+    """Compare calls per second of the direct road curve against the road tables"""
+    rng = random.Random(6)
+    ys = [rng.uniform(-1000, 40000) for _ in range(calls)]
+    stage = 5
+    
+    start = time.perf_counter()
+    expected = [compute_road_bounds(y, stage) for y in ys]
+    direct_time = time.perf_counter() - start
+    
+    get_road_table(stage)  # Build the table outside the timed loops
+    start = time.perf_counter()
+    scalar = [get_road_bounds(y, stage) for y in ys]
+    scalar_time = time.perf_counter() - start
+    
+    print(f"Road bounds over {calls} lookups (stage {stage}):")
+    print(f"  direct curve:  {calls / direct_time / 1e6:.2f} M calls/s")
+    print(f"  table scalar:  {calls / scalar_time / 1e6:.2f} M calls/s")
+    mismatches = sum(1 for a, b in zip(expected, scalar) if a != b)
+    
+    if np is not None:
+        # draw_road looks up about 100 rows per frame, so batch in frame-sized chunks
+        chunks = [ys[i:i + 100] for i in range(0, calls, 100)]
+        start = time.perf_counter()
+        batches = [get_road_bounds_batch(chunk, stage) for chunk in chunks]
+        batch_time = time.perf_counter() - start
+        print(f"  table batch:   {calls / batch_time / 1e6:.2f} M lookups/s (100 per call)")
+        
+        batched = []
+        for lefts, rights, widths in batches:
+            batched.extend(zip(lefts.tolist(), rights.tolist(), widths.tolist()))
+        mismatches += sum(1 for a, b in zip(expected, batched) if a != b)
+    print(f"  mismatches against the direct curve: {mismatches}")
+
+# Scrolling road background
+# The road is rendered in world space into a tall off-screen ring buffer, in 40-row blocks (every
+# road segment, guardrail and center line fits inside one block). Each frame only the blocks the
+# camera has newly exposed are rendered, and the visible window is blitted with wraparound. The
+# screen rects that scrolling changed are kept in changed for the dirty rects.
+ROAD_BLOCK_HEIGHT = 40
+ROAD_BUFFER_HEIGHT = 1040  # Screen height plus room for a block on each end, multiple of the block height
+ROAD_DIRTY_BAND = 80  # Screen rows per band when working out which parts of the road changed
+
+class ScrollingRoad:
+    def __init__(self):
+        self.surface = pygame.Surface((600, ROAD_BUFFER_HEIGHT))
+        self.stage = None
+        self.first_block = 0  # Range of world blocks currently in the buffer
+        self.end_block = 0
+        self.rows_rendered = 0  # Rows rendered in the most recent frame
+        self.top = None  # World row at the top of the last view
+        self.changed = None  # Screen rects that changed in the last draw, None for all of them
+    
+    def render_blocks(self, first, end):
+        """Render world blocks [first, end) into their ring buffer rows"""
+        stage = self.stage
+        if stage % 2 == 1:
+            # Odd stages (1, 3, 5, etc.) - Green theme
+            background = GRASS_COLOR
+        else:
+            # Even stages (2, 4, 6, etc.) - Sandy yellow theme
+            background = (200, 180, 100)
+        
+        # Look up the bounds of every 10px road segment in one batch
+        segments_per_block = ROAD_BLOCK_HEIGHT // 10
+        world_ys = [block * ROAD_BLOCK_HEIGHT + i * 10 for block in range(first, end) for i in range(segments_per_block)]
+        lefts, rights, widths = get_road_bounds_batch(world_ys, stage)
+        lefts, rights, widths = list(lefts), list(rights), list(widths)
+        
+        for n, block in enumerate(range(first, end)):
+            buffer_y = (block * ROAD_BLOCK_HEIGHT) % ROAD_BUFFER_HEIGHT
+            self.surface.fill(background, (0, buffer_y, 600, ROAD_BLOCK_HEIGHT))
+            
+            for i in range(segments_per_block):
+                k = n * segments_per_block + i
+                y = buffer_y + i * 10
+                
+                # Draw road segment
+                self.surface.fill(ROAD_COLOR, (lefts[k], y, widths[k], 10))
+                
+                # Draw guardrails for later stages
+                if stage >= 3 and i % 2 == 0:  # Every 20 pixels
+                    self.surface.fill(GUARDRAIL_COLOR, (lefts[k] - 10, y, 5, 15))
+                    self.surface.fill(GUARDRAIL_COLOR, (rights[k] + 5, y, 5, 15))
+            
+            # Draw road center line at the top of every block
+            k = n * segments_per_block
+            road_center = lefts[k] + widths[k] // 2
+            self.surface.fill(ROAD_LINE_COLOR, (road_center - 5, buffer_y, 10, 20))
         
-        # Draw road segment
-        pygame.draw.rect(screen, ROAD_COLOR, (road_left, y, road_width, 10))
-        
-        # Draw guardrails for later stages
-        if stage >= 3:
-            if y % 20 == 0:  # Every 20 pixels
-                pygame.draw.rect(screen, GUARDRAIL_COLOR, (road_left - 10, y, 5, 15))
-                pygame.draw.rect(screen, GUARDRAIL_COLOR, (road_right + 5, y, 5, 15))
+        self.rows_rendered += (end - first) * ROAD_BLOCK_HEIGHT
     
-    # Draw road center lines
-    line_y_offset = int(camera_y) % 40
-    for y in range(-line_y_offset, 800, 40):
-        world_y = camera_y + y
-        road_left, road_right, road_width = get_road_bounds(world_y, stage)
-        road_center = road_left + road_width // 2
-        pygame.draw.rect(screen, ROAD_LINE_COLOR, (road_center - 5, y, 10, 20))
-        road_center = road_left + road_width // 2
-        pygame.draw.rect(screen, ROAD_LINE_COLOR, (road_center - 5, y, 10, 20))
+    def changed_rects(self, previous, top):
+        """Screen rects that differ between the view from world row previous and the one from top
+        
+        Scrolling only shows at the road's edges, guardrails and center line. For each band of
+        ROAD_DIRTY_BAND screen rows this takes the spread of those over every road segment the
+        band showed in either view. None if the views share no rows."""
+        low, high = min(previous, top), max(previous, top)
+        if high - low >= 800:
+            return None
+        first = low // 10 - 2  # Segment of the first row looked up, guardrails reach into the next one
+        world_ys = [segment * 10 for segment in range(first, (high + 800) // 10 + 1)]
+        lefts, rights, widths = get_road_bounds_batch(world_ys, self.stage)
+        if np is not None:
+            lefts, rights, widths = lefts.tolist(), rights.tolist(), widths.tolist()
+        guardrail = 10 if self.stage >= 3 else 0
+        # The road fill ends at left + width, which can be a pixel short of right
+        ends = [min(left + width, right) for left, right, width in zip(lefts, rights, widths)]
+        rights = [max(left + width, right) + guardrail for left, right, width in zip(lefts, rights, widths)]
+        centers = [left + width // 2 for left, width in zip(lefts, widths)]
+        rects = []
+        for band_y in range(0, 800, ROAD_DIRTY_BAND):
+            start = (low + band_y) // 10 - first - 1
+            end = (high + band_y + ROAD_DIRTY_BAND - 1) // 10 - first + 1
+            left_low, left_high = min(lefts[start:end]) - guardrail, max(lefts[start:end])
+            right_low, right_high = min(ends[start:end]), max(rights[start:end])
+            center_low, center_high = min(centers[start:end]), max(centers[start:end])
+            if left_high > left_low:
+                rects.append((left_low, band_y, left_high - left_low, ROAD_DIRTY_BAND))
+            if right_high > right_low:
+                rects.append((right_low, band_y, right_high - right_low, ROAD_DIRTY_BAND))
+            rects.append((center_low - 5, band_y, center_high - center_low + 10, ROAD_DIRTY_BAND))
+        return rects
+    
+    def draw(self, screen, camera_y, stage):
+        self.rows_rendered = 0
+        top = int(math.floor(camera_y))
+        first = top // ROAD_BLOCK_HEIGHT
+        end = (top + 800) // ROAD_BLOCK_HEIGHT + 1
+        
+        if stage != self.stage or end <= self.first_block or first >= self.end_block:
+            # New stage or a jump past the buffer, render the whole view
+            self.stage = stage
+            self.render_blocks(first, end)
+            self.changed = None
+        else:
+            # Render only the blocks that scrolled into view
+            if first < self.first_block:
+                self.render_blocks(first, self.first_block)
+            if end > self.end_block:
+                self.render_blocks(self.end_block, end)
+            self.changed = self.changed_rects(self.top, top) if top != self.top else []
+        self.first_block = first
+        self.end_block = end
+        self.top = top
+        
+        # Blit the visible window, wrapping around the end of the buffer
+        buffer_y = top % ROAD_BUFFER_HEIGHT
+        first_part = min(800, ROAD_BUFFER_HEIGHT - buffer_y)
+        screen.blit(self.surface, (0, 0), (0, buffer_y, 600, first_part))
+        if first_part < 800:
+            screen.blit(self.surface, (0, first_part), (0, 0, 600, 800 - first_part))
 
-def main_game(hiscore_in):
-    # Game variables
-    player = Car(300, 500, RED, "player")
+road_background = None
+
+def draw_road(screen, camera_y, stage):
+    global road_background
+    if road_background is None:
+        road_background = ScrollingRoad()
+    road_background.draw(screen, camera_y, stage)
+
+# Stage warmup
+# Everything a stage draws is baked on first use: its road table, scenery theme, the bridge art at
+# its road width and its banner and HUD texts. Left alone those bakes land on the first frames of
+# the stage, or mid-stage when its first bridge shows up. While the "STAGE N" banner is up, the
+# main loop has the warmup bake them ahead of time, for this stage and the next one, one piece at
+# a time between the simulation and drawing. A piece is only started if the longest time seen for
+# its kind fits in what is left of the frame's WARMUP_BUDGET_MS, so the budget is only overrun by
+# a single piece that is slower than the whole budget. The frame that changes stage bakes nothing.
+WARMUP_BUDGET_MS = float(os.environ.get("BNJ_WARMUP_MS", 2))  # 0 turns the warmup off
+
+def stage_warmup_tasks(stage):
+    """Bake a stage's assets, yielding the kind of each piece before baking it"""
+    yield "road"
+    get_road_table(stage)
+    atlas = get_scenery_atlas(stage, complete=False)
+    while atlas.pending:
+        yield "scenery"
+        if atlas.pending:  # Scenery drawn meanwhile may have finished the atlas
+            atlas.bake_next()
+    road_width = get_road_width(stage)
+    for bridge_type in ("roman", "steel", "medieval"):
+        yield "bridge"
+        get_bridge_art(bridge_type, road_width)
+    # The steel towers always stand the road width plus 22px apart
+    yield "truss"
+    get_steel_truss(get_bridge_art("steel", road_width), road_width + 22)
+    yield "text"
+    render_text("STAGE " + str(stage), YELLOW, 28, bold=True)
+    yield "text"
+    render_text(stage_description(stage), WHITE, 12)
+    yield "text"
+    render_text("STAGE: " + str(stage), CYAN, 14, bold=True)
+
+class StageWarmup:
+    def __init__(self):
+        self.stage = None
+        self.tasks = None
+        self.next_kind = None  # Kind of the piece the tasks will bake next
+        self.costs = {}  # Longest time seen per kind of piece, in ms
+        self.deferred = 0  # Pieces put off to the next frame because they didn't fit
+        self.frames = 0  # Frames that ran warmup tasks
+        self.steps = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0  # Longest warmup slice in one frame
+    
+    def run(self, stage, budget_ms=None):
+        """Continue warming up stage and the one after it, starting pieces only while they fit in budget_ms
+        
+        The first piece of a frame always runs, otherwise a piece costing more than the whole
+        budget would never be baked ahead of time."""
+        budget_ms = WARMUP_BUDGET_MS if budget_ms is None else budget_ms
+        if budget_ms <= 0:
+            return
+        if stage != self.stage:
+            # The frame that changes stage already redraws the whole road, start on the next one
+            self.stage = stage
+            self.tasks = self.stage_tasks(stage)
+            self.next_kind = next(self.tasks)
+            return
+        if self.tasks is None:
+            return
+        
+        clock = time.perf_counter
+        start = clock()
+        elapsed = 0.0
+        while True:
+            kind = self.next_kind
+            # Kinds not seen yet are assumed to take the whole budget
+            if elapsed and elapsed + self.costs.get(kind, budget_ms) > budget_ms:
+                self.deferred += 1
+                break
+            piece_start = clock()
+            try:
+                self.next_kind = next(self.tasks)
+            except StopIteration:
+                self.tasks = None
+            now = clock()
+            self.costs[kind] = max(self.costs.get(kind, 0.0), (now - piece_start) * 1000)
+            elapsed = (now - start) * 1000
+            self.steps += 1
+            if self.tasks is None:
+                break
+        self.frames += 1
+        self.total_ms += elapsed
+        self.max_ms = max(self.max_ms, elapsed)
+    
+    def stage_tasks(self, stage):
+        yield from stage_warmup_tasks(stage)
+        yield from stage_warmup_tasks(stage + 1)
+    
+    def stats(self):
+        return {"frames": self.frames, "steps": self.steps, "deferred": self.deferred,
+                "total_ms": round(self.total_ms, 3), "max_ms": round(self.max_ms, 3), "budget_ms": WARMUP_BUDGET_MS,
+                "piece_ms": {kind: round(cost, 3) for kind, cost in self.costs.items()}}
+
+stage_warmup = StageWarmup()
+
+# Particle effects
+# Particles (crash debris, crushed cars, landing dust) live in screen space. With NumPy their
+# position, velocity, size and color index are arrays that are integrated, shrunk and culled as
+# a whole; without it the same rules run over plain lists. Each particle is drawn as a blit of a
+# stamp, a circle pre-rendered once per (color, radius) with an RLE colorkey, all in one blits call.
+PARTICLE_GRAVITY = 0.3
+PARTICLE_SHRINK = 0.1  # Radius lost per frame, particles die once they are down to 1
+
+particle_stamps = {}
+
+def get_particle_stamp(color, radius):
+    key = (color, radius)
+    stamp = particle_stamps.get(key)
+    if stamp is None:
+        colorkey = (255, 0, 255) if tuple(color) != (255, 0, 255) else (0, 0, 0)
+        stamp = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        stamp.fill(colorkey)
+        pygame.draw.circle(stamp, color, (radius, radius), radius)
+        stamp.set_colorkey(colorkey, RLEACCEL)
+        particle_stamps[key] = stamp
+    return stamp
+
+class ParticleSystem:
+    def __init__(self, capacity=256):
+        self.palette = []  # Particle colors by index
+        self.color_indices = {}
+        self.stamps = []  # stamps[color index][radius]
+        self.max_radius = 0
+        self.count = 0
+        if load_numpy() is not None:
+            self.x = np.zeros(capacity)
+            self.y = np.zeros(capacity)
+            self.vel_x = np.zeros(capacity)
+            self.vel_y = np.zeros(capacity)
+            self.size = np.zeros(capacity)
+            self.color = np.zeros(capacity, np.intp)
+        else:
+            self.particles = []  # [x, y, vel_x, vel_y, color index, size]
+    
+    def __len__(self):
+        return self.count
+    
+    def color_index(self, color):
+        index = self.color_indices.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.color_indices[color] = index
+            self.stamps.append([None] + [get_particle_stamp(color, radius) for radius in range(1, self.max_radius + 1)])
+        return index
+    
+    def reserve_radius(self, radius):
+        """Make sure every color has stamps up to this radius"""
+        for color, row in zip(self.palette, self.stamps):
+            row.extend(get_particle_stamp(color, r) for r in range(len(row), radius + 1))
+        self.max_radius = max(self.max_radius, radius)
+    
+    def emit(self, x, y, colors, count, rng, spread_x=20, spread_y=15, speed=8, min_size=2, max_size=6):
+        """Add a burst of particles around (x, y), drawing every random value from rng"""
+        if max_size > self.max_radius:
+            self.reserve_radius(max_size)
+        color_indices = [self.color_index(tuple(color)) for color in colors]
+        rows = []
+        for i in range(count):
+            particle_x = x + rng.randint(-spread_x, spread_x)
+            particle_y = y + rng.randint(-spread_y, spread_y)
+            vel_x = rng.randint(-speed, speed)
+            vel_y = rng.randint(-speed, speed)
+            color = rng.choice(color_indices)
+            size = rng.randint(min_size, max_size)
+            rows.append([particle_x, particle_y, vel_x, vel_y, color, size])
+        
+        if np is None:
+            self.particles.extend(rows)
+            self.count = len(self.particles)
+            return
+        start, end = self.count, self.count + count
+        if end > len(self.x):
+            capacity = max(end, len(self.x) * 2)
+            for name in ("x", "y", "vel_x", "vel_y", "size", "color"):
+                column = getattr(self, name)
+                grown = np.zeros(capacity, column.dtype)
+                grown[:start] = column[:start]
+                setattr(self, name, grown)
+        columns = list(zip(*rows))
+        self.x[start:end] = columns[0]
+        self.y[start:end] = columns[1]
+        self.vel_x[start:end] = columns[2]
+        self.vel_y[start:end] = columns[3]
+        self.color[start:end] = columns[4]
+        self.size[start:end] = columns[5]
+        self.count = end
+    
+    def update(self, tick_scale=1.0):
+        """Move, fall and shrink every particle, then drop the ones that are gone"""
+        if not self.count:
+            return
+        if np is None:
+            for particle in self.particles:
+                particle[0] += particle[2] * tick_scale  # x += vel_x
+                particle[1] += particle[3] * tick_scale  # y += vel_y
+                particle[3] += PARTICLE_GRAVITY * tick_scale  # Add gravity to vel_y
+                particle[5] = max(1, particle[5] - PARTICLE_SHRINK * tick_scale)  # Shrink particle size
+            
+            # Remove particles that are too small or off screen
+            self.particles = [p for p in self.particles if p[5] > 1 and p[1] < 750 and p[0] > 0 and p[0] < 800]
+            self.count = len(self.particles)
+            return
+        
+        count = self.count
+        x, y, size = self.x[:count], self.y[:count], self.size[:count]
+        vel_y = self.vel_y[:count]
+        x += self.vel_x[:count] * tick_scale
+        y += vel_y * tick_scale
+        vel_y += PARTICLE_GRAVITY * tick_scale
+        size -= PARTICLE_SHRINK * tick_scale
+        np.maximum(size, 1, out=size)
+        
+        # Remove particles that are too small or off screen
+        keep = (size > 1) & (y < 750) & (x > 0) & (x < 800)
+        kept = int(keep.sum())
+        if kept < count:
+            for column in (self.x, self.y, self.vel_x, self.vel_y, self.size, self.color):
+                column[:kept] = column[:count][keep]
+            self.count = kept
+    
+    def draw(self, screen):
+        """Blit every particle, returns the rect around them (None when there are none)"""
+        if not self.count:
+            return None
+        stamps = self.stamps
+        if np is None:
+            sequence = [(stamps[p[4]][int(p[5])], (int(p[0]) - int(p[5]), int(p[1]) - int(p[5]))) for p in self.particles]
+        else:
+            # Stamps are centered on their middle pixel, so offset each blit by the radius
+            count = self.count
+            radii = self.size[:count].astype(np.intp)
+            xs = (self.x[:count].astype(np.intp) - radii).tolist()
+            ys = (self.y[:count].astype(np.intp) - radii).tolist()
+            sequence = [(stamps[color][radius], (x, y))
+                        for x, y, color, radius in zip(xs, ys, self.color[:count].tolist(), radii.tolist())]
+        rects = screen.blits(sequence)
+        return rects[0].unionall(rects)
+
+# Entity pools
+# Each kind of entity lives in an EntityPool: the live entities in spawn order plus a free list
+# of dead ones. Spawning reuses a dead instance when there is one, and removing an entity only
+# marks it dead (a tombstone) so loops over the pool can carry on; compact() then drops all the
+# tombstones in one in-place pass, keeping spawn order, which the collision rules rely on.
+# Alongside spawn order each pool keeps its live entities sorted by y in by_y for the collision
+# broadphase: spawning inserts and killing removes at the bisected position, and moving every
+# entity by the same amount keeps the order. Anything that moves entities by different amounts
+# calls sort_by_y() afterwards, which only sorts when the order actually broke.
+class EntityPool:
+    vectorized = False
+    
+    def __init__(self, entity_class):
+        self.entity_class = entity_class
+        self.live = []
+        self.by_y = []
+        self.free = []
+        self.allocated = 0  # Instances ever created
+        self.tombstones = 0
+    
+    def __iter__(self):
+        return iter(self.live)
+    
+    def __len__(self):
+        return len(self.live)
+    
+    def spawn(self, *args):
+        """Add a live entity, recycling a dead instance if one is free"""
+        if self.free:
+            entity = self.free.pop()
+            entity.__init__(*args)  # Re-run the constructor on the recycled instance
+        else:
+            entity = self.entity_class(*args)
+            self.allocated += 1
+        entity.alive = True
+        entity.prev_y = entity.y
+        self.live.append(entity)
+        self.by_y.insert(bisect_y(self.by_y, entity.y), entity)
+        return entity
+    
+    def kill(self, entity):
+        if entity.alive:
+            entity.alive = False
+            self.tombstones += 1
+            by_y = self.by_y
+            i = bisect_y(by_y, entity.y)
+            while by_y[i] is not entity:  # Step over entities at the same y
+                i += 1
+            del by_y[i]
+    
+    def sort_by_y(self):
+        """Restore the y order after entities moved by different amounts, if they broke it"""
+        by_y = self.by_y
+        for i in range(1, len(by_y)):
+            if by_y[i - 1].y > by_y[i].y:
+                by_y.sort(key=Y_KEY)
+                return
+    
+    def compact(self):
+        """Drop killed entities from the live list, keeping the order of the rest"""
+        if not self.tombstones:
+            return
+        live = self.live
+        keep = 0
+        for entity in live:
+            if entity.alive:
+                live[keep] = entity
+                keep += 1
+            else:
+                self.free.append(entity)
+        del live[keep:]
+        self.tombstones = 0
+    
+    def advance(self, dy):
+        """Move every entity down the world by dy"""
+        for entity in self.live:
+            entity.y += dy
+    
+    def snapshot(self):
+        """Remember where every entity is, for interpolating the next tick"""
+        for entity in self.live:
+            entity.prev_y = entity.y
+    
+    def despawn_beyond(self, limit, inclusive=False):
+        """Remove every entity whose y is past limit (or at it, if inclusive)"""
+        for entity in self.live:
+            if entity.y >= limit if inclusive else entity.y > limit:
+                self.kill(entity)
+        self.compact()
+    
+    def stats(self):
+        return {"live": len(self.live), "pooled": len(self.free), "allocated": self.allocated}
+
+# Struct-of-arrays entity store
+# With NumPy available and BNJ_ARRAYS=1 (or GameState(arrays=True)), pools keep the per-frame
+# fields of their entities in NumPy columns instead of on the objects. The entities handed out
+# are views: subclasses of the normal entity classes whose column fields are properties reading
+# and writing the entity's row, so the rest of the game uses them unchanged. Movement, enemy road
+# clamping (one batched road-bounds lookup) and despawn culling then run as array operations.
+# It stays opt-in: per-call NumPy overhead makes it slower at the few dozen entities real games
+# and the bench scenarios have alive, it only wins with hundreds of enemy cars on the road.
+CAR_COLUMNS = [("x", "f8"), ("y", "f8"), ("prev_y", "f8"), ("speed", "f8"), ("turn_speed", "f8"),
+               ("jump_height", "f8"), ("jump_velocity", "f8"), ("jumping", "?")]
+MOVER_COLUMNS = [("y", "f8"), ("prev_y", "f8")]
+
+array_view_classes = {}
+
+def column_property(name, convert):
+    def get(entity):
+        return convert(entity.pool.arrays[name][entity.index])
+    def set(entity, value):
+        entity.pool.arrays[name][entity.index] = value
+    return property(get, set)
+
+def get_array_view_class(entity_class, columns):
+    """Subclass of entity_class that keeps the given columns in its pool's arrays"""
+    view_class = array_view_classes.get(entity_class)
+    if view_class is None:
+        namespace = {"__slots__": ("pool", "index")}
+        for name, dtype in columns:
+            namespace[name] = column_property(name, bool if dtype == "?" else float)
+        view_class = type(entity_class.__name__ + "View", (entity_class,), namespace)
+        array_view_classes[entity_class] = view_class
+    return view_class
+
+class ArrayEntityPool(EntityPool):
+    vectorized = True
+    
+    def __init__(self, entity_class, columns, capacity=32):
+        EntityPool.__init__(self, get_array_view_class(entity_class, columns))
+        self.arrays = {name: np.zeros(capacity, dtype) for name, dtype in columns}
+    
+    def spawn(self, *args):
+        if self.free:
+            entity = self.free.pop()
+        else:
+            entity = object.__new__(self.entity_class)
+            entity.pool = self
+            self.allocated += 1
+        index = len(self.live)
+        capacity = len(self.arrays["y"])
+        if index == capacity:
+            for name, column in self.arrays.items():
+                grown = np.zeros(capacity * 2, column.dtype)
+                grown[:capacity] = column
+                self.arrays[name] = grown
+        entity.index = index
+        entity.__init__(*args)
+        entity.alive = True
+        entity.prev_y = entity.y
+        self.live.append(entity)
+        self.by_y.insert(bisect_y(self.by_y, entity.y), entity)
+        return entity
+    
+    def compact(self):
+        if not self.tombstones:
+            return
+        live = self.live
+        count = len(live)
+        keep = np.fromiter((entity.alive for entity in live), bool, count)
+        kept = int(keep.sum())
+        for column in self.arrays.values():
+            column[:kept] = column[:count][keep]
+        index = 0
+        for entity in live:
+            if entity.alive:
+                entity.index = index
+                live[index] = entity
+                index += 1
+            else:
+                self.free.append(entity)
+        del live[kept:]
+        self.tombstones = 0
+    
+    def advance(self, dy):
+        self.arrays["y"][:len(self.live)] += dy
+    
+    def snapshot(self):
+        count = len(self.live)
+        self.arrays["prev_y"][:count] = self.arrays["y"][:count]
+    
+    def sort_by_y(self):
+        # Same check and stable order as EntityPool.sort_by_y, on the y column instead of the views
+        by_y = self.by_y
+        ys = self.arrays["y"][np.fromiter((entity.index for entity in by_y), np.intp, len(by_y))]
+        if (ys[1:] < ys[:-1]).any():
+            by_y[:] = [by_y[i] for i in np.argsort(ys, kind="stable")]
+    
+    def despawn_beyond(self, limit, inclusive=False):
+        ys = self.arrays["y"][:len(self.live)]
+        gone = ys >= limit if inclusive else ys > limit
+        if gone.any():
+            for i in np.flatnonzero(gone):
+                self.kill(self.live[i])
+            self.compact()
+    
+    def drive_cars(self, player_speed, stage, tick_scale=1.0):
+        """Enemy car movement, jump physics and road clamping for the whole pool"""
+        count = len(self.live)
+        if not count:
+            return
+        columns = self.arrays
+        x = columns["x"][:count]
+        y = columns["y"][:count]
+        turn_speed = columns["turn_speed"][:count]
+        
+        # Move enemy cars relative to player speed
+        y += (player_speed + columns["speed"][:count]) * tick_scale
+        x += turn_speed * tick_scale
+        
+        # Handle enemy jumping physics
+        jumping = columns["jumping"][:count]
+        if jumping.any():
+            jump_height = columns["jump_height"][:count]
+            jump_velocity = columns["jump_velocity"][:count]
+            jump_velocity[jumping] += 0.5 * tick_scale
+            jump_height[jumping] += jump_velocity[jumping] * tick_scale
+            landed = jumping & (jump_height <= 0)
+            jump_height[landed] = 0
+            jumping[landed] = False
+            jump_velocity[landed] = 0
+        
+        # Keep enemy cars within road boundaries, bouncing off the edges
+        road_left, road_right, _ = get_road_bounds_batch(y, stage)
+        left = x < road_left + 10
+        right = ~left & (x > road_right - 36)
+        x[left] = road_left[left] + 10
+        turn_speed[left] = np.abs(turn_speed[left])
+        x[right] = road_right[right] - 36
+        turn_speed[right] = -np.abs(turn_speed[right])
+
+def new_entity_pool(entity_class, columns, arrays):
+    if arrays and load_numpy() is not None:
+        return ArrayEntityPool(entity_class, columns)
+    return EntityPool(entity_class)
+
+def use_entity_arrays():
+    """Whether new games default to the NumPy struct-of-arrays entity store"""
+    return os.environ.get("BNJ_ARRAYS", "") not in ("", "0") and load_numpy() is not None
+
+# Collision broadphase
+# The player always sits on the same screen rows, so only entities whose collision box starts a
+# little above those rows can touch it. For each pool the index binary searches the pool's y
+# order (by_y, kept up to date by the pool) for that band and tests just those, each with a Rect
+# reused from frame to frame, in one collidelistall call, so a query costs the same however many
+# entities are alive. Hits come back in spawn (list) order, so the rules apply to them exactly as
+# a brute-force loop over the whole list would. --bench-collisions times it against that loop.
+COLLISION_MAX_HEIGHT = 64  # Taller than any collision box (enemy cars are 42)
+
+Y_KEY = attrgetter("y")
+SEQ_KEY = attrgetter("seq")
+
+def bisect_y(entities, y):
+    """Index of the first entity in a y-sorted list whose y is not below the given y"""
+    lo, hi = 0, len(entities)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if entities[mid].y < y:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def entity_box(entity, camera_y):
+    return entity.x, entity.y - camera_y, entity.width, entity.height
+
+def bridge_box(bridge, camera_y):
+    # Bridges span the road, so their box follows the road bounds at the bridge
+    bridge_left, bridge_right, bridge_width = get_road_bounds(bridge.y, bridge.stage)
+    return bridge_left, bridge.y - camera_y, bridge_width, bridge.bridge_clearance
+
+class CollisionIndex:
+    def __init__(self):
+        self.rects = []
+        self.tested = 0  # Narrowphase tests in the last frame
+    
+    def begin_frame(self):
+        self.tested = 0
+    
+    def query(self, pool, player_rect, camera_y, box=entity_box):
+        """Return the entities of a pool whose collision box overlaps player_rect, in list order"""
+        return self.query_sorted(pool.by_y, player_rect, camera_y, box)
+    
+    def query_sorted(self, ordered, player_rect, camera_y, box=entity_box):
+        """query() over a list of entities already sorted by y"""
+        if not ordered:
+            return []
+        
+        # Boxes have to start within COLLISION_MAX_HEIGHT above the player to reach it
+        top = camera_y + player_rect.top - COLLISION_MAX_HEIGHT
+        bottom = camera_y + player_rect.bottom + 1
+        candidates = ordered[bisect_y(ordered, top):bisect_y(ordered, bottom)]
+        if not candidates:
+            return []
+        candidates.sort(key=SEQ_KEY)
+        
+        rects = self.rects
+        while len(rects) < len(candidates):
+            rects.append(pygame.Rect(0, 0, 0, 0))
+        for entity, rect in zip(candidates, rects):
+            rect.update(box(entity, camera_y))
+        self.tested += len(candidates)
+        hits = player_rect.collidelistall(rects[:len(candidates)])
+        return [candidates[i] for i in hits]
+
+def benchmark_collisions(counts=(30, 300, 3000), queries=2000):
+    """Time one pool's collision query at growing entity counts, against testing every entity
+    and against sorting a copy of the pool on every query"""
+    player_rect = pygame.Rect(300, 600, 36, 42)
     camera_y = 0
-    player_screen_y = 600  # Fixed screen position for player car
-    
-    enemy_cars = []
-    obstacles = []
-    pickups = []
-    fuel_pumps = []
-    bridges = []
-    scenery = []
-    
-    score = 0
-    fuel = 100
-    lives = 5
-    gameover = False
-    gameover_reason = "OUT OF FUEL"
-    hiscore = hiscore_in
-    
-    # Stage system variables
-    current_stage = 1
-    stage_message_active = True
-    stage_message_timer = 0
-    stage_message_duration = 120  # 2 seconds at 60 FPS
-    distance_traveled = 0
-    stage_distance = 2000  # Distance to complete each stage
-    
-    # Explosion effect variables
-    explosion_active = False
-    explosion_particles = []
-    explosion_timer = 0
-    
-    # Pause system variables
-    paused = False
-    
-    # Collision animation variables
-    collision_active = False
-    collision_particles = []
-    collision_timer = 0
-    player_invulnerable = False
-    invulnerable_timer = 0
-    
-    # Jump system variables
-    jump_cooldown = 0  # Frames until next jump is available
-    jump_cooldown_max = 300  # 5 seconds at 60 FPS
-    jump_duration = 180  # 3 seconds at 60 FPS
-    jump_timer = 0
-    
-    # Score display for crushed cars
-    score_displays = []  # List of [x, y, score, timer] for floating score text
-    
-    # High score tracking
-    hiscore_beaten_this_game = False
-    
-    # Spawn timers
-    enemy_spawn_timer = 0
-    obstacle_spawn_timer = 0
-    pickup_spawn_timer = 0
-    fuel_pump_spawn_timer = 0
-    bridge_spawn_timer = 0
-    scenery_spawn_timer = 0
-    
-    # Spawn delays (decrease with stage)
-    enemy_spawn_delay = max(60 - (current_stage - 1) * 10, 20)
-    obstacle_spawn_delay = max(120 - (current_stage - 1) * 15, 40)
-    pickup_spawn_delay = 120  # Reduced to 120 (2 seconds)
-    fuel_pump_spawn_delay = 300  # Fuel pumps spawn every 5 seconds (balanced for new fuel system)
-    bridge_spawn_delay = 480  # Bridges spawn every 8 seconds (480 frames at 60 FPS) - allows 3 seconds buffer after 5-second jump cooldown
-    scenery_spawn_delay = 90   # Scenery spawns every 1.5 seconds (more frequent)
-    
-    # Create initial enemy cars
-    for i in range(3):
-        enemy_y = random.randint(100, 300)
-        road_left, road_right, _ = get_road_bounds(enemy_y, current_stage)
-        enemy_x = random.randint(road_left + 10, road_right - 40)
-        enemy_color = random.choice(CAR_COLORS)
-        enemy_speed = random.uniform(1, 3)
-        enemy = Car(enemy_x, enemy_y, enemy_color, "enemy")
-        enemy.speed = enemy_speed
-        enemy_cars.append(enemy)
-    
-    # Create initial bridge for testing
-    initial_bridge = Bridge(200, current_stage)
-    bridges.append(initial_bridge)
+    print(f"Collision query, {queries} queries per count (ms per query):")
+    print(f"  {'entities':>8} {'brute force':>12} {'sort per query':>15} {'y order':>8} {'tested':>7}")
+    for entity_count in counts:
+        # Same density at every count, the road ahead just gets longer
+        rng = random.Random(4)
+        pool = EntityPool(Obstacle)
+        for _ in range(entity_count):
+            pool.spawn(rng.randint(150, 410), rng.uniform(camera_y + 800 - entity_count * 40, camera_y + 800), "barrel")
+        
+        start = time.perf_counter()
+        for _ in range(queries):
+            expected = [entity for entity in pool if player_rect.colliderect(entity_box(entity, camera_y))]
+        brute_ms = (time.perf_counter() - start) * 1000 / queries
+        
+        index = CollisionIndex()
+        start = time.perf_counter()
+        for _ in range(queries):
+            index.query_sorted(sorted(pool, key=Y_KEY), player_rect, camera_y)
+        sort_ms = (time.perf_counter() - start) * 1000 / queries
+        
+        start = time.perf_counter()
+        for _ in range(queries):
+            index.begin_frame()
+            hits = index.query(pool, player_rect, camera_y)
+        index_ms = (time.perf_counter() - start) * 1000 / queries
+        assert hits == expected
+        print(f"  {entity_count:>8} {brute_ms:>12.4f} {sort_ms:>15.4f} {index_ms:>8.4f} {index.tested:>7}")
+
+# Headless game simulation
+# GameState holds everything about one run and advances it a frame at a time with step(), which
+# only takes that frame's inputs and never draws or touches the display. draw_game() renders a
+# state, so the same simulation drives the window, headless runs and benchmarks.
+class FrameInputs:
+    """Player controls for one simulation step"""
+    def __init__(self, left=False, right=False, up=False, down=False, jump=False, pause=False):
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.jump = jump  # SPACE pressed this frame
+        self.pause = pause  # P pressed this frame (toggles pause)
+        self.profile = False  # F3 pressed this frame (toggles the frame profiler)
     
-    #################################################################################################
-    # Main game loop
-    #################################################################################################
-    clock = pygame.time.Clock()
+    def clear_presses(self):
+        """Forget key presses once a tick has acted on them, held keys stay"""
+        self.jump = False
+        self.pause = False
+
+def read_frame_inputs(inputs=None):
+    """Turn this frame's pygame events and held keys into FrameInputs
     
-    while True:
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == KEYDOWN:
-                if event.key == K_p:
-                    paused = not paused
-                elif event.key == K_SPACE and not paused and jump_cooldown <= 0:
-                    player.jump()
-                    jump_timer = jump_duration
-        
-        # Game over check moved to end of loop after all collision detection
-        
-        # If paused, show pause message and skip game logic
-        if paused:
-            print_pause_message()
-            pygame.display.update()
-            clock.tick(60)
-            continue
+    Presses are merged into inputs when it is given, so a press on a frame that runs no
+    simulation tick is still seen by the next tick."""
+    if inputs is None:
+        inputs = FrameInputs()
+    for event in pygame.event.get():
+        if event.type == QUIT:
+            quit_game()
+        if event.type == KEYDOWN:
+            if event.key == K_p:
+                inputs.pause = not inputs.pause
+            elif event.key == K_SPACE:
+                inputs.jump = True
+            elif event.key == K_F3:
+                inputs.profile = not inputs.profile
+    keys = pygame.key.get_pressed()
+    inputs.left = keys[K_LEFT]
+    inputs.right = keys[K_RIGHT]
+    inputs.up = keys[K_UP]
+    inputs.down = keys[K_DOWN]
+    return inputs
+
+# View culling
+# Every world draw path asks the viewport first: an entity is drawn only if the vertical extent of
+# its sprite (view_top/view_bottom, relative to its y) overlaps the screen, so anything off screen
+# costs no draw calls. Each frame counts drawn and skipped entities, and keeps the screen rect each
+# draw returned, keyed by what was drawn, for the dirty rects. Entities are despawned once they are
+# VIEW_DESPAWN_MARGIN past the bottom of the view, the same line for every kind.
+VIEW_DESPAWN_MARGIN = 100
+
+class Viewport:
+    def __init__(self, width=600, height=800):
+        self.width = width
+        self.height = height
+        self.drawn = 0
+        self.skipped = 0
+        self.rects = {}  # Screen rect of everything drawn this frame, by entity (or effect)
+    
+    def begin_frame(self):
+        self.drawn = 0
+        self.skipped = 0
+        self.rects = {}
+    
+    def draw_visible(self, screen, entities, camera_y, alpha=1.0):
+        """Draw the entities that are on screen, in order, interpolated by alpha"""
+        height = self.height
+        rects = self.rects
+        drawn = 0
+        for entity in entities:
+            y = entity.y
+            if alpha < 1:
+                entity_camera = camera_y + (y - entity.prev_y) * (1 - alpha)
+            else:
+                entity_camera = camera_y
+            draw_y = y - entity_camera
+            if draw_y + entity.view_bottom > 0 and draw_y + entity.view_top < height:
+                rect = entity.draw(screen, entity_camera)
+                if rect:
+                    rects[entity] = rect
+                drawn += 1
+        self.drawn += drawn
+        self.skipped += len(entities) - drawn
+    
+    def despawn_line(self, camera_y):
+        return camera_y + self.height + VIEW_DESPAWN_MARGIN
+
+viewport = Viewport()
+
+# Simulation timing
+# The game simulates in fixed ticks of 1/SIM_TICK_RATE seconds (BNJ_TICK_RATE, default 60) no matter
+# how fast frames are drawn: main_game feeds real frame time into a FixedTimestep, runs as many
+# whole ticks as have built up, and draws the world interpolated between the last two ticks.
+# Timers are set in seconds and converted to ticks; speeds and accelerations are tuned in pixels
+# per 1/60 s (BASE_TICK_RATE) and scaled by the state's tick_scale, which is exactly 1 at 60 Hz.
+BASE_TICK_RATE = 60
+SIM_TICK_RATE = int(os.environ.get("BNJ_TICK_RATE", BASE_TICK_RATE))
+RENDER_FPS = int(os.environ.get("BNJ_FPS", 60))  # Frame rate cap, 0 for uncapped
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation catches up on, slower machines slow the game down past it
+TIMESTEP_SLACK = 1e-6  # Rounding in summed frame times must not push a tick to the next frame
+
+class FixedTimestep:
+    def __init__(self, tick_rate=SIM_TICK_RATE):
+        self.tick_time = 1.0 / tick_rate
+        self.accumulator = 0.0
+    
+    def add_time(self, elapsed):
+        self.accumulator += min(elapsed, MAX_FRAME_TIME)
+    
+    def ready(self):
+        """Whether a whole tick of time is waiting to be simulated"""
+        return self.accumulator >= self.tick_time - TIMESTEP_SLACK
+    
+    def consume(self):
+        self.accumulator = max(self.accumulator - self.tick_time, 0.0)
+    
+    def alpha(self):
+        """How far the current frame is between the last tick and the next one"""
+        return min(self.accumulator / self.tick_time, 1.0)
+
+class GameState:
+    def __init__(self, hiscore=0, seed=None, arrays=None, tick_rate=None):
+        # Without a seed the run shares the global random module, like the interactive game always has
+        self.rng = random if seed is None else random.Random(seed)
+        rng = self.rng
+        self.tick_rate = tick_rate or SIM_TICK_RATE
+        self.tick_scale = BASE_TICK_RATE / self.tick_rate  # Motion per tick relative to a 60 Hz tick
+        
+        # Game variables
+        self.player = Car(300, 500, RED, "player")
+        self.camera_y = 0
+        self.prev_camera_y = 0
+        self.prev_player_x = self.player.x
+        self.score_clock = 0.0  # 1/60 s frames of driving not yet scored
+        self.player_screen_y = 600  # Fixed screen position for player car
+        
+        if arrays is None:
+            arrays = use_entity_arrays()
+        self.enemy_cars = new_entity_pool(Car, CAR_COLUMNS, arrays)
+        self.obstacles = new_entity_pool(Obstacle, MOVER_COLUMNS, arrays)
+        self.pickups = new_entity_pool(Pickup, MOVER_COLUMNS, arrays)
+        self.fuel_pumps = new_entity_pool(FuelPump, MOVER_COLUMNS, arrays)
+        self.bridges = new_entity_pool(Bridge, MOVER_COLUMNS, arrays)
+        self.scenery = new_entity_pool(Scenery, MOVER_COLUMNS, arrays)
+        
+        self.score = 0
+        self.fuel = 100
+        self.lives = 5
+        self.gameover = False
+        self.gameover_reason = "OUT OF FUEL"
+        self.hiscore = hiscore
+        self.frame = 0
+        
+        # Stage system variables
+        self.current_stage = 1
+        self.stage_message_active = True
+        self.stage_message_timer = 0
+        self.stage_message_duration = self.ticks(2)
+        self.distance_traveled = 0
+        self.stage_distance = 2000  # Distance to complete each stage
+        
+        # Pause system variables
+        self.paused = False
+        
+        # Collision animation variables
+        self.particles = ParticleSystem()
+        # Purely cosmetic effects draw from their own generator so they never change a seeded run
+        self.effects_rng = random.Random(None if seed is None else seed + 1)
+        self.player_invulnerable = False
+        self.invulnerable_timer = 0
+        self.invulnerable_duration = self.ticks(2)
+        self.fuel_burn = 6 / self.tick_rate  # 6 units per second - missing 3 pumps (~10 sec) uses ~60 fuel
+        self.fuel_pump_refill = 60  # Enough for ~10 seconds of driving
+        self.pumps_collected = 0
+        
+        # Jump system variables
+        self.jump_cooldown = 0  # Ticks until next jump is available
+        self.jump_cooldown_max = self.ticks(5)
+        self.jump_duration = self.ticks(3)
+        self.jump_timer = 0
+        
+        # Score display for crushed cars
+        self.score_displays = []  # List of [x, y, score, timer] for floating score text
+        
+        # High score tracking
+        self.hiscore_beaten_this_game = False
         
-        # Handle input
-        keys = pygame.key.get_pressed()
+        # Spawn timers
+        self.enemy_spawn_timer = 0
+        self.obstacle_spawn_timer = 0
+        self.pickup_spawn_timer = 0
+        self.fuel_pump_spawn_timer = 0
+        self.bridge_spawn_timer = 0
+        self.scenery_spawn_timer = 0
+        
+        # Spawn delays in ticks (decrease with stage)
+        self.enemy_spawn_delay = self.ticks(max(1 - (self.current_stage - 1) / 6, 1 / 3))
+        self.obstacle_spawn_delay = self.ticks(max(2 - (self.current_stage - 1) / 4, 2 / 3))
+        self.pickup_spawn_delay = self.ticks(2)
+        self.fuel_pump_spawn_delay = self.ticks(5)  # Fuel pumps spawn every 5 seconds (balanced for new fuel system)
+        self.bridge_spawn_delay = self.ticks(8)  # Bridges spawn every 8 seconds - allows 3 seconds buffer after 5-second jump cooldown
+        self.scenery_spawn_delay = self.ticks(1.5)   # Scenery spawns every 1.5 seconds (more frequent)
+        
+        self.collision_index = CollisionIndex()
+        
+        # Create initial enemy cars
+        for i in range(3):
+            enemy_y = rng.randint(100, 300)
+            road_left, road_right, _ = get_road_bounds(enemy_y, self.current_stage)
+            enemy_x = rng.randint(road_left + 10, road_right - 40)
+            enemy_color = rng.choice(CAR_COLORS)
+            enemy_speed = rng.uniform(1, 3)
+            enemy = self.enemy_cars.spawn(enemy_x, enemy_y, enemy_color, "enemy")
+            enemy.speed = enemy_speed
+        
+        # Create initial bridge for testing
+        self.bridges.spawn(200, self.current_stage, rng)
+    
+    def render_camera_y(self, alpha=1.0):
+        """Camera position alpha of the way from the previous tick to the current one"""
+        if alpha >= 1:
+            return self.camera_y
+        return self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha
+    
+    def render_player_x(self, alpha=1.0):
+        if alpha >= 1:
+            return self.player.x
+        return self.prev_player_x + (self.player.x - self.prev_player_x) * alpha
+    
+    def ticks(self, seconds):
+        """Convert a duration in seconds to simulation ticks"""
+        return int(round(seconds * self.tick_rate))
+    
+    def entity_stats(self):
+        """Live, pooled and allocated counts for each entity pool"""
+        return {
+            "enemies": self.enemy_cars.stats(), "obstacles": self.obstacles.stats(), "pickups": self.pickups.stats(),
+            "fuel_pumps": self.fuel_pumps.stats(), "bridges": self.bridges.stats(), "scenery": self.scenery.stats(),
+        }
+    
+    def add_score(self, points):
+        self.score += points
+        if self.score > self.hiscore:
+            self.hiscore = self.score
+    
+    def result(self):
+        """Return (score, hiscore, reason) the way main_game reports a finished run"""
+        return self.score, self.hiscore, self.gameover_reason
+    
+    def step(self, inputs):
+        """Advance the game by one frame. Returns False while paused, True otherwise"""
+        if not self.handle_inputs(inputs):
+            return False
+        self.update(inputs)
+        self.check_collisions()
+        self.finish_step()
+        return True
+    
+    # step() runs these phases in order; benchmarks call them one by one to time each phase
+    def handle_inputs(self, inputs):
+        """Apply pause and jump presses. Returns False if the game is paused"""
+        if inputs.pause:
+            self.paused = not self.paused
+        if inputs.jump and not self.paused and self.jump_cooldown <= 0:
+            self.player.jump()
+            self.jump_timer = self.jump_duration
+        
+        # If paused, skip game logic
+        if self.paused:
+            return False
+        self.frame += 1
+        self.snapshot()
+        return True
+    
+    def snapshot(self):
+        """Remember positions at the start of a tick so frames can be drawn between ticks"""
+        self.prev_camera_y = self.camera_y
+        self.prev_player_x = self.player.x
+        for pool in (self.enemy_cars, self.obstacles, self.pickups, self.fuel_pumps, self.bridges, self.scenery):
+            pool.snapshot()
+    
+    def update(self, inputs):
+        self.update_player(inputs)
+        self.update_stage()
+        self.spawn_entities()
+        self.move_entities()
+    
+    def finish_step(self):
+        self.update_timers()
+        self.advance_world()
+    
+    def update_player(self, inputs):
+        player = self.player
+        tick_scale = self.tick_scale
         
         # Player movement
-        if keys[K_LEFT]:
-            player.turn_speed = max(player.turn_speed - 0.5, -player.max_turn_speed)
-        elif keys[K_RIGHT]:
-            player.turn_speed = min(player.turn_speed + 0.5, player.max_turn_speed)
+        if inputs.left:
+            player.turn_speed = max(player.turn_speed - 0.5 * tick_scale, -player.max_turn_speed)
+        elif inputs.right:
+            player.turn_speed = min(player.turn_speed + 0.5 * tick_scale, player.max_turn_speed)
         else:
-            player.turn_speed *= 0.8  # Gradual stop
+            player.turn_speed *= 0.8 ** tick_scale  # Gradual stop
         
-        if keys[K_UP]:
-            player.speed = min(player.speed + player.acceleration, player.max_speed)
-        elif keys[K_DOWN]:
-            player.speed = max(player.speed - player.deceleration, 1)
+        if inputs.up:
+            player.speed = min(player.speed + player.acceleration * tick_scale, player.max_speed)
+        elif inputs.down:
+            player.speed = max(player.speed - player.deceleration * tick_scale, 1)
         else:
-            player.speed = max(player.speed - 0.1, 2)  # Minimum speed
+            player.speed = max(player.speed - 0.1 * tick_scale, 2)  # Minimum speed
         
         # Update camera (world moves past player)
-        camera_y += player.speed
-        distance_traveled += player.speed
+        self.camera_y += player.speed * tick_scale
+        self.distance_traveled += player.speed * tick_scale
         
         # Add speed-based scoring (higher speed = more points)
         # Base points = speed, bonus points for high speed
@@ -1340,36 +3233,43 @@ def main_game(hiscore_in):
         elif player.speed >= 4:
             speed_multiplier = 1.5  # 50% bonus at medium-high speed
         
-        points_earned = int(player.speed * speed_multiplier)
-        score += points_earned
-        if score > hiscore:
-            if not hiscore_beaten_this_game:
-                hiscore_beaten_this_game = True
+        # Points are counted per 1/60 s of driving whatever the tick rate
+        self.score_clock += tick_scale
+        while self.score_clock >= 1:
+            self.score_clock -= 1
+            self.score += int(player.speed * speed_multiplier)
+        if self.score > self.hiscore:
+            if not self.hiscore_beaten_this_game:
+                self.hiscore_beaten_this_game = True
                 # Add congratulations message to score displays
-                score_displays.append([250, 300, "NEW HI-SCORE!", 180])
-            hiscore = score
+                self.score_displays.append([250, 300, "NEW HI-SCORE!", self.ticks(3)])
+            self.hiscore = self.score
         
         # Update player (only horizontal movement, not forward)
-        player.x += player.turn_speed
+        player.x += player.turn_speed * tick_scale
         
         # Handle jumping physics for player
         if player.jumping:
             # Calculate jump height based on timer (parabolic arc over 3 seconds)
-            if jump_timer > 0:
-                jump_progress = 1.0 - (jump_timer / jump_duration)  # 0 to 1
+            if self.jump_timer > 0:
+                jump_progress = 1.0 - (self.jump_timer / self.jump_duration)  # 0 to 1
                 # Parabolic jump: height peaks at middle of jump
                 player.jump_height = 40 * math.sin(jump_progress * math.pi)
-                jump_timer -= 1
+                self.jump_timer -= 1
             else:
                 # Player has landed - start the cooldown now
                 player.jump_height = 0
                 player.jumping = False
                 player.jump_velocity = 0
-                jump_cooldown = jump_cooldown_max  # Start cooldown when landing
+                self.jump_cooldown = self.jump_cooldown_max  # Start cooldown when landing
+                
+                # Puff of dust where the car touches down
+                self.particles.emit(player.x + 18, self.player_screen_y + 40, [GRAY, LIGHT_GRAY, BROWN], 16,
+                                    self.effects_rng, spread_x=16, spread_y=3, speed=3, max_size=4)
         
         # Keep player car within road boundaries
-        player_world_y = camera_y + player_screen_y
-        road_left, road_right, _ = get_road_bounds(player_world_y, current_stage)
+        player_world_y = self.camera_y + self.player_screen_y
+        road_left, road_right, _ = get_road_bounds(player_world_y, self.current_stage)
         if player.x < road_left + 10:
             player.x = road_left + 10
         elif player.x > road_right - 36:  # Account for car width
@@ -1378,441 +3278,1195 @@ def main_game(hiscore_in):
         player.shadow_y = player.y
         
         # Update fuel consumption (balanced for fuel pump system)
-        fuel -= 0.1  # 6 units per second at 60 FPS - missing 3 pumps (~10 sec) uses ~60 fuel
+        self.fuel -= self.fuel_burn
         
         # Clamp fuel to prevent floating point precision issues
-        fuel = max(0, fuel)
+        self.fuel = max(0, self.fuel)
         
         # Check for game over when fuel reaches 0 or below
-        if fuel <= 0 and not gameover:
-            gameover = True
-            gameover_reason = "OUT OF FUEL"
-        
+        if self.fuel <= 0 and not self.gameover:
+            self.gameover = True
+            self.gameover_reason = "OUT OF FUEL"
+    
+    def update_stage(self):
         # Stage progression
-        if distance_traveled >= stage_distance:
-            current_stage += 1
-            distance_traveled = 0
-            stage_message_active = True
-            stage_message_timer = 0
+        if self.distance_traveled >= self.stage_distance:
+            self.current_stage += 1
+            self.distance_traveled = 0
+            self.stage_message_active = True
+            self.stage_message_timer = 0
             # No fuel bonus for stage completion - only fuel pumps refill fuel
         
         # Update stage message timer
-        if stage_message_active:
-            stage_message_timer += 1
-            if stage_message_timer >= stage_message_duration:
-                stage_message_active = False
+        if self.stage_message_active:
+            self.stage_message_timer += 1
+            if self.stage_message_timer >= self.stage_message_duration:
+                self.stage_message_active = False
+    
+    def spawn_entities(self):
+        rng = self.rng
+        camera_y = self.camera_y
+        current_stage = self.current_stage
         
         # Spawn timers
-        enemy_spawn_timer += 1
-        obstacle_spawn_timer += 1
-        pickup_spawn_timer += 1
-        fuel_pump_spawn_timer += 1
-        bridge_spawn_timer += 1
-        scenery_spawn_timer += 1
+        self.enemy_spawn_timer += 1
+        self.obstacle_spawn_timer += 1
+        self.pickup_spawn_timer += 1
+        self.fuel_pump_spawn_timer += 1
+        self.bridge_spawn_timer += 1
+        self.scenery_spawn_timer += 1
         
         # Spawn enemies
-        if enemy_spawn_timer >= enemy_spawn_delay:
-            spawn_y = camera_y - random.randint(100, 300)
+        if self.enemy_spawn_timer >= self.enemy_spawn_delay:
+            spawn_y = camera_y - rng.randint(100, 300)
             road_left, road_right, _ = get_road_bounds(spawn_y, current_stage)
-            enemy_x = random.randint(road_left + 10, road_right - 40)
-            enemy_color = random.choice(CAR_COLORS)
-            enemy_speed = random.uniform(1, 4)
-            enemy = Car(enemy_x, spawn_y, enemy_color, "enemy")
+            enemy_x = rng.randint(road_left + 10, road_right - 40)
+            enemy_color = rng.choice(CAR_COLORS)
+            enemy_speed = rng.uniform(1, 4)
+            enemy = self.enemy_cars.spawn(enemy_x, spawn_y, enemy_color, "enemy")
             enemy.speed = enemy_speed
-            enemy_cars.append(enemy)
-            enemy_spawn_timer = 0
+            self.enemy_spawn_timer = 0
         
         # Spawn obstacles
-        if obstacle_spawn_timer >= obstacle_spawn_delay:
-            spawn_y = camera_y - random.randint(200, 400)
+        if self.obstacle_spawn_timer >= self.obstacle_spawn_delay:
+            spawn_y = camera_y - rng.randint(200, 400)
             road_left, road_right, _ = get_road_bounds(spawn_y, current_stage)
-            obstacle_x = random.randint(road_left + 20, road_right - 60)
-            obstacle_type = random.choice(["barrel", "water"])
-            obstacles.append(Obstacle(obstacle_x, spawn_y, obstacle_type))
-            obstacle_spawn_timer = 0
+            obstacle_x = rng.randint(road_left + 20, road_right - 60)
+            obstacle_type = rng.choice(["barrel", "water"])
+            self.obstacles.spawn(obstacle_x, spawn_y, obstacle_type)
+            self.obstacle_spawn_timer = 0
         
         # Spawn pickups
-        if pickup_spawn_timer >= pickup_spawn_delay:
-            spawn_y = camera_y - random.randint(150, 300)
+        if self.pickup_spawn_timer >= self.pickup_spawn_delay:
+            spawn_y = camera_y - rng.randint(150, 300)
             road_left, road_right, _ = get_road_bounds(spawn_y, current_stage)
-            pickup_x = random.randint(road_left + 15, road_right - 35)
-            pickups.append(Pickup(pickup_x, spawn_y, "fuel"))
-            pickup_spawn_timer = 0
+            pickup_x = rng.randint(road_left + 15, road_right - 35)
+            self.pickups.spawn(pickup_x, spawn_y, "fuel")
+            self.pickup_spawn_timer = 0
         
         # Spawn fuel pumps (occasionally instead of enemy cars)
-        if fuel_pump_spawn_timer >= fuel_pump_spawn_delay:
-            spawn_y = camera_y + random.randint(200, 400)  # Spawn behind player, not ahead
+        if self.fuel_pump_spawn_timer >= self.fuel_pump_spawn_delay:
+            spawn_y = camera_y + rng.randint(200, 400)  # Spawn behind player, not ahead
             road_left, road_right, _ = get_road_bounds(spawn_y, current_stage)
-            pump_x = random.randint(road_left + 20, road_right - 45)
-            fuel_pumps.append(FuelPump(pump_x, spawn_y))
-            print(f"DEBUG: Spawned fuel pump at ({pump_x}, {spawn_y}), camera_y: {camera_y}")
-            fuel_pump_spawn_timer = 0
+            pump_x = rng.randint(road_left + 20, road_right - 45)
+            self.fuel_pumps.spawn(pump_x, spawn_y)
+            self.fuel_pump_spawn_timer = 0
         
         # Spawn bridges (dangerous obstacles that require jumping)
-        if bridge_spawn_timer >= bridge_spawn_delay:
-            spawn_y = camera_y - random.randint(300, 500)  # Spawn bridges ahead of player
-            new_bridge = Bridge(spawn_y, current_stage)
-            bridges.append(new_bridge)
-            bridge_spawn_timer = 0
+        if self.bridge_spawn_timer >= self.bridge_spawn_delay:
+            spawn_y = camera_y - rng.randint(300, 500)  # Spawn bridges ahead of player
+            self.bridges.spawn(spawn_y, current_stage, rng)
+            self.bridge_spawn_timer = 0
 
             # Reduce bridge spawn delay slightly each time for increasing difficulty
-            bridge_spawn_delay = max(bridge_spawn_delay - 10, 360)  # Minimum 6 seconds between bridges (5s jump cooldown + 1s buffer)
+            self.bridge_spawn_delay = max(self.bridge_spawn_delay - self.ticks(1 / 6), self.ticks(6))  # Minimum 6 seconds between bridges (5s jump cooldown + 1s buffer)
         
         # Spawn scenery elements (trees, houses, themed elements)
-        if scenery_spawn_timer >= scenery_spawn_delay:
-            spawn_y = camera_y + random.randint(200, 500)  # Spawn behind player
+        if self.scenery_spawn_timer >= self.scenery_spawn_delay:
+            spawn_y = camera_y + rng.randint(200, 500)  # Spawn behind player
             road_left, road_right, _ = get_road_bounds(spawn_y, current_stage)
             
             # Choose scenery type based on stage theme
-            if current_stage == 1:
-                # Green/suburban theme - trees and houses
-                scenery_types = ["tree", "tree", "house"]  # More trees than houses
-            elif current_stage == 2:
-                # Water theme - only water-related scenery
-                scenery_types = ["water_feature", "water_feature", "water_feature"]  # Only water features
-            elif current_stage == 3:
-                # Industrial/water theme - trees and water features
-                scenery_types = ["tree", "water_feature", "house"]
-            else:
-                # Desert theme for higher stages - cacti and rocks
-                scenery_types = ["cactus", "cactus", "rock"]  # More cacti than rocks
-            
-            scenery_type = random.choice(scenery_types)
+            scenery_type = rng.choice(scenery_theme(current_stage))
             
             # Place scenery on the sides of the road (not on the road itself)
-            side = random.choice(["left", "right"])
+            side = rng.choice(["left", "right"])
             scenery_x = None
             
             if side == "left":
                 # Left side of road - ensure minimum distance from road edge
                 max_left_x = max(10, road_left - 50)  # At least 50 pixels from road
                 if max_left_x > 10:
-                    scenery_x = random.randint(10, max_left_x)
+                    scenery_x = rng.randint(10, max_left_x)
             else:
                 # Right side of road - ensure minimum distance from road edge  
                 min_right_x = min(550, road_right + 50)  # At least 50 pixels from road
                 if min_right_x < 550:
-                    scenery_x = random.randint(min_right_x, 550)
+                    scenery_x = rng.randint(min_right_x, 550)
             
             # Only spawn if there's a valid position
             if scenery_x is not None and scenery_x > 0 and scenery_x < 570:
-                scenery.append(Scenery(scenery_x, spawn_y, scenery_type, current_stage))
+                variant = self.effects_rng.randrange(SCENERY_VARIANTS)  # Looks only, keeps the game RNG in step
+                self.scenery.spawn(scenery_x, spawn_y, scenery_type, current_stage, variant)
             
-            scenery_spawn_timer = 0
+            self.scenery_spawn_timer = 0
+    
+    def move_entities(self):
+        player = self.player
+        tick_scale = self.tick_scale
         
         # Update enemy cars
-        for enemy in enemy_cars[:]:
-            # Move enemy cars relative to player speed (they should appear to move toward player)
-            enemy.y += player.speed + enemy.speed
-            enemy.x += enemy.turn_speed
-            
-            # Handle enemy jumping physics
-            if enemy.jumping:
-                enemy.jump_velocity += 0.5
-                enemy.jump_height += enemy.jump_velocity
-                if enemy.jump_height <= 0:
-                    enemy.jump_height = 0
-                    enemy.jumping = False
-                    enemy.jump_velocity = 0
-            
-            # Keep enemy cars within road boundaries
-            road_left, road_right, _ = get_road_bounds(enemy.y, current_stage)
-            if enemy.x < road_left + 10:
-                enemy.x = road_left + 10
-                enemy.turn_speed = abs(enemy.turn_speed)  # Bounce off left edge
-            elif enemy.x > road_right - 36:  # Account for car width
-                enemy.x = road_right - 36
-                enemy.turn_speed = -abs(enemy.turn_speed)  # Bounce off right edge
-            
-            # Remove cars that have passed the player
-            if enemy.y > camera_y + 700:
-                enemy_cars.remove(enemy)
-        
-        # Update fuel pumps (move them toward player)
-        for pump in fuel_pumps[:]:
-            # Move fuel pumps relative to player speed (they should appear to move toward player)
-            pump.y += player.speed
-            
-            # Remove fuel pumps that have passed the player
-            if pump.y > camera_y + 700:
-                fuel_pumps.remove(pump)
-        
-        # Update scenery (move them toward player)
-        for scene in scenery[:]:
-            # Move scenery relative to player speed + base speed (they should appear to move toward player)
-            scene.y += player.speed + 2  # Same as bridges - stationary objects that approach player
-            
-            # Remove scenery that has passed the player
-            if scene.y > camera_y + 800:
-                scenery.remove(scene)
+        if self.enemy_cars.vectorized:
+            self.enemy_cars.drive_cars(player.speed, self.current_stage, tick_scale)
+        else:
+            for enemy in self.enemy_cars:
+                # Move enemy cars relative to player speed (they should appear to move toward player)
+                enemy.y += (player.speed + enemy.speed) * tick_scale
+                enemy.x += enemy.turn_speed * tick_scale
+                
+                # Handle enemy jumping physics
+                if enemy.jumping:
+                    enemy.jump_velocity += 0.5 * tick_scale
+                    enemy.jump_height += enemy.jump_velocity * tick_scale
+                    if enemy.jump_height <= 0:
+                        enemy.jump_height = 0
+                        enemy.jumping = False
+                        enemy.jump_velocity = 0
+                
+                # Keep enemy cars within road boundaries
+                road_left, road_right, _ = get_road_bounds(enemy.y, self.current_stage)
+                if enemy.x < road_left + 10:
+                    enemy.x = road_left + 10
+                    enemy.turn_speed = abs(enemy.turn_speed)  # Bounce off left edge
+                elif enemy.x > road_right - 36:  # Account for car width
+                    enemy.x = road_right - 36
+                    enemy.turn_speed = -abs(enemy.turn_speed)  # Bounce off right edge
+        self.enemy_cars.sort_by_y()  # Cars drive at their own speeds, one may have overtaken another
+        
+        # Move fuel pumps relative to player speed (they should appear to move toward player)
+        self.fuel_pumps.advance(player.speed * tick_scale)
+        
+        # Move scenery relative to player speed + base speed, same as bridges - stationary objects that approach player
+        self.scenery.advance((player.speed + 2) * tick_scale)
+    
+    def check_collisions(self):
+        player = self.player
+        camera_y = self.camera_y
+        player_screen_y = self.player_screen_y
+        index = self.collision_index
+        index.begin_frame()
         
         # Collision detection (use screen position for player)
         player_rect = pygame.Rect(player.x, player_screen_y, player.width, player.height)
         
         # Enemy car collisions
-        for enemy in enemy_cars[:]:
-            # Convert enemy world coordinates to screen coordinates for collision detection
+        for enemy in index.query(self.enemy_cars, player_rect, camera_y):
+            # Convert enemy world coordinates to screen coordinates
             enemy_screen_y = enemy.y - camera_y
-            enemy_rect = pygame.Rect(enemy.x, enemy_screen_y, enemy.width, enemy.height)
-            if player_rect.colliderect(enemy_rect):
-                if player.jumping and player.jump_height > 10:
-                    # Crush the enemy car when jumping on it
-                    score += 200
-                    if score > hiscore:
-                        hiscore = score
-                    
-                    # Add floating score display
-                    score_displays.append([enemy.x + 15, enemy_screen_y, 200, 60])  # x, y, score, timer
-                    
-                    # Remove the crushed enemy
-                    enemy_cars.remove(enemy)
-                    continue
-                elif not player_invulnerable:
-                    # Collision! Lose a life
-                    lives -= 1
-                    player_invulnerable = True
-                    invulnerable_timer = 0
-                    
-                    # Create collision animation
-                    collision_active = True
-                    collision_timer = 0
-                    collision_particles = []
-                    
-                    # Create explosion particles
-                    center_x = (player.x + enemy.x) // 2 + 15
-                    center_y = player_screen_y + 25
-                    explosion_colors = [RED, ORANGE, YELLOW, WHITE, SILVER, player.color, enemy.color]
-                    
-                    for i in range(30):
-                        particle_x = center_x + random.randint(-20, 20)
-                        particle_y = center_y + random.randint(-15, 15)
-                        vel_x = random.randint(-8, 8)
-                        vel_y = random.randint(-8, 8)
-                        color = random.choice(explosion_colors)
-                        size = random.randint(2, 6)
-                        collision_particles.append([particle_x, particle_y, vel_x, vel_y, color, size])
-                    
-                    # Bump enemy off road
-                    if player.x < enemy.x:
-                        enemy.turn_speed = 8
-                    else:
-                        enemy.turn_speed = -8
-                    
-                    # Check game over
-                    if lives <= 0 and not gameover:
-                        gameover = True
-                        gameover_reason = "NO LIVES REMAINING"
+            if player.jumping and player.jump_height > 10:
+                # Crush the enemy car when jumping on it
+                self.add_score(200)
+                
+                # Add floating score display
+                self.score_displays.append([enemy.x + 15, enemy_screen_y, 200, self.ticks(1)])  # x, y, score, timer
+                
+                # Scatter bits of the crushed car
+                self.particles.emit(enemy.x + 18, enemy_screen_y + 21, [enemy.color, SILVER, DARK_GRAY], 20,
+                                    self.effects_rng, spread_y=10, speed=5)
+                
+                # Remove the crushed enemy
+                self.enemy_cars.kill(enemy)
+                continue
+            elif not self.player_invulnerable:
+                # Collision! Lose a life
+                self.lives -= 1
+                self.player_invulnerable = True
+                self.invulnerable_timer = 0
+                
+                # Create explosion particles
+                center_x = (player.x + enemy.x) // 2 + 15
+                center_y = player_screen_y + 25
+                explosion_colors = [RED, ORANGE, YELLOW, WHITE, SILVER, player.color, enemy.color]
+                self.spawn_collision_particles(center_x, center_y, explosion_colors)
+                
+                # Bump enemy off road
+                if player.x < enemy.x:
+                    enemy.turn_speed = 8
+                else:
+                    enemy.turn_speed = -8
+                
+                # Check game over
+                if self.lives <= 0 and not self.gameover:
+                    self.gameover = True
+                    self.gameover_reason = "NO LIVES REMAINING"
+        self.enemy_cars.compact()
         
         # Obstacle collisions
-        for obstacle in obstacles[:]:
-            # Convert obstacle world coordinates to screen coordinates
-            obstacle_screen_y = obstacle.y - camera_y
-            obstacle_rect = pygame.Rect(obstacle.x, obstacle_screen_y, obstacle.width, obstacle.height)
-            if player_rect.colliderect(obstacle_rect) and not player.jumping:
-                if obstacle.type == "barrel" and not gameover:
+        if not player.jumping:
+            for obstacle in index.query(self.obstacles, player_rect, camera_y):
+                if obstacle.type == "barrel" and not self.gameover:
                     # Crash into barrel
-                    gameover = True
-                    gameover_reason = "CRASHED INTO OBSTACLE"
-                elif obstacle.type == "water" and not gameover:
+                    self.gameover = True
+                    self.gameover_reason = "CRASHED INTO OBSTACLE"
+                elif obstacle.type == "water" and not self.gameover:
                     # Fall into water
-                    gameover = True
-                    gameover_reason = "FELL INTO WATER"
+                    self.gameover = True
+                    self.gameover_reason = "FELL INTO WATER"
         
         # Pickup collisions
-        for pickup in pickups[:]:
-            # Convert pickup world coordinates to screen coordinates
-            pickup_screen_y = pickup.y - camera_y
-            pickup_rect = pygame.Rect(pickup.x, pickup_screen_y, pickup.width, pickup.height)
-            if player_rect.colliderect(pickup_rect):
-                if pickup.type == "fuel":
-                    # Fuel pickups no longer refill fuel - only fuel pumps do
-                    score += 25
-                    if score > hiscore:
-                        hiscore = score
-                pickups.remove(pickup)
+        for pickup in index.query(self.pickups, player_rect, camera_y):
+            if pickup.type == "fuel":
+                # Fuel pickups no longer refill fuel - only fuel pumps do
+                self.add_score(25)
+            self.pickups.kill(pickup)
+        self.pickups.compact()
         
         # Fuel pump collisions
-        for pump in fuel_pumps[:]:
-            # Convert fuel pump world coordinates to screen coordinates
-            pump_screen_y = pump.y - camera_y
-            pump_rect = pygame.Rect(pump.x, pump_screen_y, pump.width, pump.height)
-            if player_rect.colliderect(pump_rect):
-                fuel = min(fuel + 60, 100)  # Refill 60 fuel (enough for ~10 seconds of driving)
-                score += 100  # Bonus points for fuel pump
-                if score > hiscore:
-                    hiscore = score
-                fuel_pumps.remove(pump)
+        for pump in index.query(self.fuel_pumps, player_rect, camera_y):
+            self.fuel = min(self.fuel + self.fuel_pump_refill, 100)
+            self.pumps_collected += 1
+            self.add_score(100)  # Bonus points for fuel pump
+            self.fuel_pumps.kill(pump)
+        self.fuel_pumps.compact()
         
         # Bridge collisions (GAME OVER if hit)
-        # Bridge collisions (GAME OVER if hit)
-        for bridge in bridges[:]:
-            # Get current road bounds to follow road curves
-            bridge_left, bridge_right, bridge_width = get_road_bounds(bridge.y, bridge.stage)
-            # Convert bridge world coordinates to screen coordinates
-            bridge_screen_y = bridge.y - camera_y
-            bridge_rect = pygame.Rect(bridge_left, bridge_screen_y, bridge_width, bridge.bridge_clearance)
-            if player_rect.colliderect(bridge_rect):
-                # Check if player is jumping high enough to clear the bridge
-                if not player.jumping or player.jump_height < bridge.bridge_clearance:
-                    gameover = True
-                    gameover_reason = "CRASHED INTO BRIDGE"  # Override any previous reason
-                    break
-        
+        for bridge in index.query(self.bridges, player_rect, camera_y, bridge_box):
+            # Check if player is jumping high enough to clear the bridge
+            if not player.jumping or player.jump_height < bridge.bridge_clearance:
+                self.gameover = True
+                self.gameover_reason = "CRASHED INTO BRIDGE"  # Override any previous reason
+                break
+    
+    def spawn_collision_particles(self, center_x, center_y, colors, count=30):
+        """Add a burst of explosion particles around a screen position"""
+        self.particles.emit(center_x, center_y, colors, count, self.rng)
+    
+    def update_timers(self):
         # Update invulnerability timer
-        if player_invulnerable:
-            invulnerable_timer += 1
-            if invulnerable_timer >= 120:  # 2 seconds of invulnerability
-                player_invulnerable = False
-                invulnerable_timer = 0
+        if self.player_invulnerable:
+            self.invulnerable_timer += 1
+            if self.invulnerable_timer >= self.invulnerable_duration:
+                self.player_invulnerable = False
+                self.invulnerable_timer = 0
         
         # Update jump cooldown
-        if jump_cooldown > 0:
-            jump_cooldown -= 1
+        if self.jump_cooldown > 0:
+            self.jump_cooldown -= 1
         
         # Update score displays
-        for score_display in score_displays[:]:
+        for score_display in self.score_displays[:]:
             score_display[3] -= 1  # Decrease timer
-            score_display[1] -= 1  # Float upward
+            score_display[1] -= self.tick_scale  # Float upward
             if score_display[3] <= 0:
-                score_displays.remove(score_display)
-        
-        # Update collision animation
-        if collision_active:
-            collision_timer += 1
-            # Update particle positions
-            for particle in collision_particles:
-                particle[0] += particle[2]  # x += vel_x
-                particle[1] += particle[3]  # y += vel_y
-                particle[3] += 0.3  # Add gravity to vel_y
-                particle[5] = max(1, particle[5] - 0.1)  # Shrink particle size
-            
-            # Remove particles that are too small or off screen
-            collision_particles = [p for p in collision_particles if p[5] > 1 and p[1] < 750 and p[0] > 0 and p[0] < 800]
-            
-            # End collision animation after 90 frames or no particles left
-            if collision_timer > 90 or len(collision_particles) == 0:
-                collision_active = False
+                self.score_displays.remove(score_display)
         
-        # Update obstacles, pickups, fuel pumps, and bridges to move with player speed
-        for obstacle in obstacles:
-            obstacle.y += player.speed
+        # Update particle effects
+        self.particles.update(self.tick_scale)
+    
+    def advance_world(self):
+        speed = self.player.speed * self.tick_scale
+        limit = viewport.despawn_line(self.camera_y)
         
-        for pickup in pickups:
-            pickup.y += player.speed
-            
-        for pump in fuel_pumps:
-            pump.y += player.speed
-            
-        for bridge in bridges:
-            bridge.y += player.speed + 2  # Bridges approach player like other objects
+        # Update obstacles, pickups, fuel pumps, and bridges to move with player speed
+        self.obstacles.advance(speed)
+        self.pickups.advance(speed)
+        self.fuel_pumps.advance(speed)
+        self.bridges.advance(speed + 2 * self.tick_scale)  # Bridges approach player like other objects
         
         # Remove old objects that have passed the player
-        obstacles = [obs for obs in obstacles if obs.y < camera_y + 900]
-        pickups = [pickup for pickup in pickups if pickup.y < camera_y + 900]
-        fuel_pumps = [pump for pump in fuel_pumps if pump.y < camera_y + 900]
-        bridges = [bridge for bridge in bridges if bridge.y < camera_y + 900]
-        scenery = [scene for scene in scenery if scene.y < camera_y + 900]
-        
-        # Draw everything
-        draw_road(screen, camera_y, current_stage)
-        
-        # Draw scenery (background elements, before other objects)
-        for scene in scenery:
-            scene.draw(screen, camera_y)
-        
-        # Draw game objects (after road and scenery so they appear on top)
-        for enemy in enemy_cars:
-            enemy.draw(screen, camera_y)
-        
+        self.enemy_cars.despawn_beyond(limit, inclusive=True)
+        self.obstacles.despawn_beyond(limit, inclusive=True)
+        self.pickups.despawn_beyond(limit, inclusive=True)
+        self.fuel_pumps.despawn_beyond(limit, inclusive=True)
+        self.bridges.despawn_beyond(limit, inclusive=True)
+        self.scenery.despawn_beyond(limit, inclusive=True)
+
+def draw_game(screen, state, alpha=1.0, mark=None):
+    """Render a GameState, including the stage banner and HUD
+    
+    alpha places the world between the previous tick (0) and the latest one (1). mark, when given,
+    is called after each drawing phase, which is how the frame profiler times them."""
+    draw_world(screen, state, alpha, mark)
+    draw_state_hud(state)
+    if mark:
+        mark()
+
+def draw_world(screen, state, alpha=1.0, mark=None):
+    """Render everything in a GameState except the HUD"""
+    viewport.begin_frame()
+    
+    # Draw everything
+    draw_road(screen, state.render_camera_y(alpha), state.current_stage)
+    if mark:
+        mark()
+    draw_entities(screen, state, alpha)
+    if mark:
+        mark()
+    draw_bridges(screen, state, alpha)
+    if mark:
+        mark()
+    draw_effects(screen, state, alpha)
+    if mark:
+        mark()
+
+def draw_entities(screen, state, alpha=1.0):
+    camera_y = state.render_camera_y(alpha)
+    
+    # Bake the stage's scenery atlas as soon as the stage starts, not when its first scenery shows up
+    get_scenery_atlas(state.current_stage)
+    
+    # Draw scenery (background elements, before other objects). Entities are drawn where they were
+    # alpha of the way through the last tick, off-screen ones are skipped by the viewport
+    viewport.draw_visible(screen, state.scenery, camera_y, alpha)
+    
+    # Draw game objects (after road and scenery so they appear on top)
+    viewport.draw_visible(screen, state.enemy_cars, camera_y, alpha)
+    viewport.draw_visible(screen, state.obstacles, camera_y, alpha)
+    viewport.draw_visible(screen, state.pickups, camera_y, alpha)
+    viewport.draw_visible(screen, state.fuel_pumps, camera_y, alpha)
+
+def draw_bridges(screen, state, alpha=1.0):
+    viewport.draw_visible(screen, state.bridges, state.render_camera_y(alpha), alpha)
+
+def draw_effects(screen, state, alpha=1.0):
+    # Draw floating score displays
+    for i, score_display in enumerate(state.score_displays):
+        if isinstance(score_display[2], str):
+            # Special text message (like "NEW HI-SCORE!")
+            score_text = render_text(score_display[2], CYAN, 16, bold=True)
+        else:
+            # Regular score number
+            score_text = render_text("+" + str(score_display[2]), YELLOW, 16, bold=True)
+        viewport.rects["score", i] = screen.blit(score_text, (score_display[0], score_display[1]))
+    
+    # Draw player car at fixed screen position (with invulnerability flashing)
+    flash_frame = state.invulnerable_timer * BASE_TICK_RATE // state.tick_rate
+    if not state.player_invulnerable or (flash_frame // 5) % 2 == 0:  # Flash every 5 frames of 1/60 s
+        viewport.rects[state.player] = state.player.draw_at_screen_position(
+            screen, state.player_screen_y, state.render_player_x(alpha))
+    
+    # Draw particle effects
+    particles_rect = state.particles.draw(screen)
+    if particles_rect:
+        viewport.rects["particles"] = particles_rect
+    
+    # Draw stage message if active
+    if state.stage_message_active:
+        viewport.rects["banner"] = print_stage_message(state.current_stage)
+
+def mark_game_frame():
+    """Queue the screen areas the last draw_game changed"""
+    dirty_regions.add_frame(road_background.changed, viewport.rects, get_hud_layer().changed)
+
+def draw_state_hud(state):
+    # The HUD counts the jump cooldown in 1/60 s frames whatever the tick rate
+    print_hud(state.score, int(state.fuel), state.current_stage, state.hiscore, state.player.speed, state.lives,
+              state.jump_cooldown * BASE_TICK_RATE // state.tick_rate,
+              state.jump_cooldown_max * BASE_TICK_RATE // state.tick_rate)
+
+def autopilot_inputs(state):
+    """Simple scripted driver for headless runs: hold the throttle, follow the road, jump bridges"""
+    player = state.player
+    road_left, road_right, _ = get_road_bounds(state.camera_y + state.player_screen_y, state.current_stage)
+    target_x = (road_left + road_right) // 2 - player.width // 2
+    inputs = FrameInputs(up=True)
+    inputs.left = player.x > target_x + 8
+    inputs.right = player.x < target_x - 8
+    # Take off when a bridge is about to reach the player
+    for bridge in state.bridges:
+        gap = state.camera_y + state.player_screen_y - bridge.y
+        if 0 < gap < 200:
+            inputs.jump = not player.jumping
+            break
+    return inputs
+
+def run_headless(seed=1, max_steps=100000, policy=autopilot_inputs):
+    """Play one game without rendering, returns the finished GameState"""
+    state = GameState(seed=seed)
+    while not state.gameover and state.frame < max_steps:
+        state.step(policy(state))
+    return state
+
+def benchmark_headless(games=10):
+    """Time headless runs and report steps per second"""
+    steps = 0
+    start = time.perf_counter()
+    for seed in range(1, games + 1):
+        state = run_headless(seed)
+        steps += state.frame
+        print(f"seed {seed}: score {state.score}, stage {state.current_stage}, {state.frame} steps, {state.gameover_reason}")
+    elapsed = time.perf_counter() - start
+    print(f"{games} games, {steps} steps in {elapsed:.2f}s: {steps / elapsed:.0f} steps/s")
+
+# Batch runs
+# For tuning spawn delays and fuel economy, --batch plays many seeded autopilot games without
+# rendering, spread over a process pool (one worker per core unless --jobs says otherwise).
+# The game parameters in BATCH_PARAMETERS can be overridden for every game with --set name=value
+# (delays are in ticks and fuel_burn is per tick, e.g. --set fuel_pump_spawn_delay=240 --set
+# fuel_pump_refill=50). They are set on the fresh GameState, after its tick rate has been applied,
+# so derived and runtime state (tick_rate, tick_scale, score, camera_y...) can't be overridden.
+# Each game returns one row of outcomes, the rows are summarized in a table and --batch-out
+# writes them all as CSV.
+BATCH_PARAMETERS = ["enemy_spawn_delay", "obstacle_spawn_delay", "pickup_spawn_delay", "fuel_pump_spawn_delay",
+                    "bridge_spawn_delay", "scenery_spawn_delay", "fuel", "fuel_burn", "fuel_pump_refill", "lives",
+                    "stage_distance", "jump_cooldown_max", "jump_duration", "invulnerable_duration"]
+BATCH_COLUMNS = ["seed", "score", "stage", "reason", "pumps", "steps"]
+BATCH_MAX_STEPS = 100000
+
+def play_batch_game(job):
+    """Pool worker: play one (seed, overrides) game and return its outcome row"""
+    seed, overrides = job
+    state = GameState(seed=seed)
+    for name, value in overrides.items():
+        setattr(state, name, value)
+    while not state.gameover and state.frame < BATCH_MAX_STEPS:
+        state.step(autopilot_inputs(state))
+    return [seed, state.score, state.current_stage, state.gameover_reason, state.pumps_collected, state.frame]
+
+def run_batch(seeds, overrides=None, workers=None):
+    """Play one game per seed and return their rows in seed order"""
+    jobs = [(seed, overrides or {}) for seed in seeds]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [play_batch_game(job) for job in jobs]
+    with multiprocessing.Pool(workers) as pool:
+        # Several games per task so the pool overhead stays small next to a ~50 ms game
+        return pool.map(play_batch_game, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+
+def batch_summary(rows):
+    """Format the outcome rows as a table of score, stage and pump statistics and game over reasons"""
+    def spread(values):
+        values = sorted(values)
+        return (f"{sum(values) / len(values):10.1f} {percentile(values, 0.5):8} {percentile(values, 0.1):8} "
+                f"{percentile(values, 0.9):8} {values[-1]:8}")
+    
+    lines = [f"{'':8} {'mean':>10} {'median':>8} {'p10':>8} {'p90':>8} {'max':>8}",
+             "score    " + spread([row[1] for row in rows]),
+             "stage    " + spread([row[2] for row in rows]),
+             "pumps    " + spread([row[4] for row in rows]),
+             "steps    " + spread([row[5] for row in rows])]
+    reasons = {}
+    for row in rows:
+        reasons[row[3]] = reasons.get(row[3], 0) + 1
+    for reason, games in sorted(reasons.items(), key=lambda item: -item[1]):
+        lines.append(f"{reason:<24} {games:6} games ({games / len(rows) * 100:.1f}%)")
+    return "\n".join(lines)
+
+def write_batch_csv(path, rows):
+    with open(path, "w") as f:
+        f.write(",".join(BATCH_COLUMNS) + "\n")
+        for row in rows:
+            f.write(",".join(str(value) for value in row) + "\n")
+
+def parse_batch_overrides(settings):
+    """Turn name=value strings into GameState overrides, each value of the type the game uses
+    
+    Exits with the list of tunable names when a name is not in BATCH_PARAMETERS, so a typo can't
+    quietly leave the real parameter at its default for a whole batch."""
+    defaults = GameState(seed=0)
+    overrides = {}
+    for setting in settings:
+        name, _, value = setting.partition("=")
+        if name not in BATCH_PARAMETERS:
+            sys.exit(f"--set {setting}: {name!r} is not a tunable game parameter, valid names are:\n  "
+                     + "\n  ".join(sorted(BATCH_PARAMETERS)))
+        kind = type(getattr(defaults, name))
+        try:
+            overrides[name] = kind(value)
+        except ValueError:
+            sys.exit(f"--set {setting}: {value!r} is not a valid {kind.__name__} for {name}")
+    return overrides
+
+def benchmark_batch(games=1000, overrides=None, workers=None, out_path=None):
+    """Play a batch, print the results table and games per second, optionally save the rows"""
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    rows = run_batch(range(1, games + 1), overrides, workers)
+    elapsed = time.perf_counter() - start
+    steps = sum(row[5] for row in rows)
+    if overrides:
+        print("overrides: " + ", ".join(f"{name}={value}" for name, value in overrides.items()))
+    print(batch_summary(rows))
+    print(f"{games} games on {min(workers, games)} worker(s) in {elapsed:.2f}s: "
+          f"{games / elapsed:.1f} games/s, {steps / elapsed:.0f} steps/s")
+    if out_path:
+        write_batch_csv(out_path, rows)
+    return rows
+
+# Driving environment
+# For training driving agents, DrivingEnv wraps a seeded GameState in the Gymnasium API:
+# reset() returns (observation, info) and step(action) returns (observation, reward, terminated,
+# truncated, info). Nothing is drawn and no window is needed. An action is an index into
+# ENV_ACTIONS (steering x throttle x jump) and the reward is the score gained that step. The
+# observation is a flat float32 vector laid out as ENV_OBSERVATION: the player, the road edges,
+# fuel, jump cooldown and lives, then the nearest enemies, obstacles, bridge and fuel pump
+# relative to the player, with absent slots left at zero.
+# DrivingEnv itself is a plain duck-typed class, so the game never imports Gymnasium (it would add
+# ~30 ms to every launch). make_env() builds the env for training code: when Gymnasium is
+# installed it returns a GymDrivingEnv, a subclass of DrivingEnv and gymnasium.Env with the spaces
+# and np_random seeding, so env_checker and the standard wrappers accept it. The subclass is only
+# created, and Gymnasium only imported, on the first make_env() call. make_vector_env() wraps N of
+# those in gymnasium.vector.SyncVectorEnv, for code written against the gym vector API.
+# VectorDrivingEnv is this game's own batched layout and works without Gymnasium: it steps N
+# environments per call, in this process or split over worker processes, and returns NumPy arrays
+# plus a plain list of per-env info dicts. It is not the gymnasium.vector API (no dict-of-arrays
+# infos, no autoreset modes), see its docstring.
+ENV_ACTIONS = [(steer, throttle, jump) for steer in ("", "left", "right")
+               for throttle in ("", "up", "down") for jump in (False, True)]
+ENV_NEAREST = {"enemy": 3, "obstacle": 2, "bridge": 1, "pump": 1}
+ENV_OBSERVATION = (["player_x", "speed", "turn_speed", "jumping", "jump_height",
+                    "road_left", "road_right", "road_left_ahead", "road_right_ahead",
+                    "fuel", "jump_cooldown", "lives"]
+                   + [f"enemy{i}_{field}" for i in range(ENV_NEAREST["enemy"]) for field in ("dx", "dy", "speed", "present")]
+                   + [f"obstacle{i}_{field}" for i in range(ENV_NEAREST["obstacle"]) for field in ("dx", "dy", "water", "present")]
+                   + [f"bridge{i}_{field}" for i in range(ENV_NEAREST["bridge"]) for field in ("dy", "present")]
+                   + [f"pump{i}_{field}" for i in range(ENV_NEAREST["pump"]) for field in ("dx", "dy", "present")])
+ENV_ROAD_AHEAD = 200  # Pixels above the player where the second pair of road edges is taken
+ENV_MAX_STEPS = 20000  # Episodes are truncated after this many ticks (~5.5 minutes)
+
+def nearest_entities(pool, y, count):
+    """The count live entities of a pool closest to world row y"""
+    if count == 1:
+        return [min(pool, key=lambda entity: abs(entity.y - y))] if len(pool) else []
+    return sorted(pool, key=lambda entity: abs(entity.y - y))[:count]
+
+class DrivingEnv:
+    """One game behind the Gymnasium reset()/step(action) interface"""
+    metadata = {"render_modes": ["rgb_array"], "render_fps": SIM_TICK_RATE}
+    
+    def __init__(self, seed=None, max_steps=ENV_MAX_STEPS, render_mode=None):
+        # Episodes reset without a seed draw theirs from here, so a seeded env replays exactly
+        self.seed_rng = random.Random(seed)
+        self.max_steps = max_steps
+        self.render_mode = render_mode
+        self.state = None
+    
+    def reset(self, *, seed=None, options=None):
+        if seed is not None:
+            self.seed_rng.seed(seed)
+        self.state = GameState(seed=self.seed_rng.getrandbits(32))
+        return self.observe(), self.info()
+    
+    def step(self, action):
+        state = self.state
+        steer, throttle, jump = ENV_ACTIONS[action]
+        score = state.score
+        state.step(FrameInputs(left=steer == "left", right=steer == "right",
+                               up=throttle == "up", down=throttle == "down", jump=jump))
+        truncated = not state.gameover and state.frame >= self.max_steps
+        return self.observe(), state.score - score, state.gameover, truncated, self.info()
+    
+    def info(self):
+        state = self.state
+        return {"score": state.score, "stage": state.current_stage, "reason": state.gameover_reason if state.gameover else ""}
+    
+    def observe(self):
+        """The ENV_OBSERVATION vector for the current tick"""
+        state = self.state
+        player = state.player
+        width, height = SCREEN_SIZE
+        player_y = state.camera_y + state.player_screen_y  # World row the player drives on
+        road_left, road_right, _ = get_road_bounds(player_y, state.current_stage)
+        ahead_left, ahead_right, _ = get_road_bounds(player_y - ENV_ROAD_AHEAD, state.current_stage)
+        obs = [player.x / width, player.speed / player.max_speed, player.turn_speed / player.max_turn_speed,
+               float(player.jumping), player.jump_height / 100,
+               (road_left - player.x) / width, (road_right - player.x) / width,
+               (ahead_left - player.x) / width, (ahead_right - player.x) / width,
+               state.fuel / 100, state.jump_cooldown / state.jump_cooldown_max, state.lives / 5]
+        
+        # Offsets are from the player, dy is negative ahead of it
+        enemies = nearest_entities(state.enemy_cars, player_y, ENV_NEAREST["enemy"])
+        for enemy in enemies:
+            obs += [(enemy.x - player.x) / width, (enemy.y - player_y) / height, enemy.speed / player.max_speed, 1.0]
+        obs += [0.0] * (4 * (ENV_NEAREST["enemy"] - len(enemies)))
+        obstacles = nearest_entities(state.obstacles, player_y, ENV_NEAREST["obstacle"])
         for obstacle in obstacles:
-            obstacle.draw(screen, camera_y)
-        
-        for pickup in pickups:
-            pickup.draw(screen, camera_y)
-        
-        for pump in fuel_pumps:
-            pump.draw(screen, camera_y)
-        
+            obs += [(obstacle.x - player.x) / width, (obstacle.y - player_y) / height, float(obstacle.type == "water"), 1.0]
+        obs += [0.0] * (4 * (ENV_NEAREST["obstacle"] - len(obstacles)))
+        bridges = nearest_entities(state.bridges, player_y, ENV_NEAREST["bridge"])
         for bridge in bridges:
-            bridge.draw(screen, camera_y)
-        
-        # Draw floating score displays
-        font = pygame.font.SysFont("monospace", 16, bold=True)
-        for score_display in score_displays:
-            if isinstance(score_display[2], str):
-                # Special text message (like "NEW HI-SCORE!")
-                score_text = font.render(score_display[2], 1, CYAN)
-            else:
-                # Regular score number
-                score_text = font.render("+" + str(score_display[2]), 1, YELLOW)
-            screen.blit(score_text, (score_display[0], score_display[1]))
-        
-        # Draw player car at fixed screen position (with invulnerability flashing)
-        if not player_invulnerable or (invulnerable_timer // 5) % 2 == 0:  # Flash every 5 frames
-            player.draw_at_screen_position(screen, player_screen_y)
-        
-        # Draw collision particles
-        if collision_active:
-            for particle in collision_particles:
-                pygame.draw.circle(screen, particle[4], (int(particle[0]), int(particle[1])), int(particle[5]))
+            obs += [(bridge.y - player_y) / height, 1.0]
+        obs += [0.0] * (2 * (ENV_NEAREST["bridge"] - len(bridges)))
+        pumps = nearest_entities(state.fuel_pumps, player_y, ENV_NEAREST["pump"])
+        for pump in pumps:
+            obs += [(pump.x - player.x) / width, (pump.y - player_y) / height, 1.0]
+        obs += [0.0] * (3 * (ENV_NEAREST["pump"] - len(pumps)))
+        return obs if np is None else np.array(obs, np.float32)
+    
+    def render(self):
+        """The frame as a height x width x 3 array in "rgb_array" mode, drawn on the (headless) display"""
+        if self.render_mode != "rgb_array":
+            return None
+        screen = get_screen(headless=True)
+        draw_game(screen, self.state)
+        return np.transpose(pygame.surfarray.array3d(screen), (1, 0, 2))
+    
+    def close(self):
+        self.state = None
+
+gym_env_class = None
+
+def get_gym_env_class():
+    """DrivingEnv as a gymnasium.Env subclass, created on first use, or None without Gymnasium"""
+    global gym_env_class
+    if gym_env_class is None:
+        try:
+            import gymnasium
+        except ImportError:
+            return None
+        load_numpy()  # Gymnasium depends on NumPy, the spaces below use it
+        
+        class GymDrivingEnv(DrivingEnv, gymnasium.Env):
+            def __init__(self, seed=None, max_steps=ENV_MAX_STEPS, render_mode=None):
+                DrivingEnv.__init__(self, seed, max_steps, render_mode)
+                self.observation_space = gymnasium.spaces.Box(-math.inf, math.inf, (len(ENV_OBSERVATION),), np.float32)
+                self.action_space = gymnasium.spaces.Discrete(len(ENV_ACTIONS))
+            
+            def reset(self, *, seed=None, options=None):
+                gymnasium.Env.reset(self, seed=seed)  # Seeds self.np_random, the game itself runs on seed_rng
+                return DrivingEnv.reset(self, seed=seed, options=options)
         
-        # Draw stage message if active
-        if stage_message_active:
-            print_stage_message(current_stage)
+        gym_env_class = GymDrivingEnv
+    return gym_env_class
+
+def make_env(seed=None, max_steps=ENV_MAX_STEPS, render_mode=None):
+    """A new driving env, a real gymnasium.Env when Gymnasium is installed"""
+    env_class = get_gym_env_class() or DrivingEnv
+    return env_class(seed, max_steps, render_mode)
+
+def make_vector_env(num_envs, max_steps=ENV_MAX_STEPS):
+    """num_envs driving envs in a gymnasium.vector.SyncVectorEnv, reset(seed=s) seeds env i with s + i"""
+    if get_gym_env_class() is None:
+        raise ImportError("make_vector_env needs Gymnasium, install gymnasium or use VectorDrivingEnv")
+    import gymnasium
+    return gymnasium.vector.SyncVectorEnv([lambda: make_env(max_steps=max_steps) for _ in range(num_envs)])
+
+def driving_env_worker(conn, seeds, max_steps):
+    """Worker process: run an in-process VectorDrivingEnv over seeds and answer commands from conn"""
+    envs = VectorDrivingEnv(len(seeds), seeds=seeds, max_steps=max_steps)
+    while True:
+        command, data = conn.recv()
+        if command == "step":
+            conn.send(envs.step(data))
+        elif command == "reset":
+            conn.send(envs.reset_envs(data))
+        else:
+            break
+    conn.close()
+
+class VectorDrivingEnv:
+    """num_envs DrivingEnvs stepped together, with batched observations, rewards and flags
+    
+    This is a custom layout, not gymnasium.vector (use make_vector_env() for that). Observations,
+    rewards, terminated and truncated are NumPy arrays indexed by env, infos is a list holding each
+    env's own info dict. A finished environment is reset inside the same step(): the observation
+    returned for it is already the first one of its next episode, and its last observation and info
+    are kept in its info dict as "final_observation" and "final_info". With workers > 1 the envs
+    are split into contiguous slices, each stepped in its own process."""
+    def __init__(self, num_envs, seed=None, workers=1, max_steps=ENV_MAX_STEPS, seeds=None):
+        if load_numpy() is None:
+            raise ImportError("VectorDrivingEnv needs NumPy for its batched arrays, install numpy or use DrivingEnv")
+        self.num_envs = num_envs
+        if seeds is None:
+            seeds = [None if seed is None else seed + i for i in range(num_envs)]
+        self.workers = min(workers or os.cpu_count() or 1, num_envs)
+        self.envs = []
+        self.pipes = []
+        self.processes = []
+        if self.workers <= 1:
+            self.envs = [DrivingEnv(env_seed, max_steps) for env_seed in seeds]
+            return
+        bounds = [num_envs * i // self.workers for i in range(self.workers + 1)]
+        for start, end in zip(bounds, bounds[1:]):
+            conn, worker_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=driving_env_worker, args=(worker_conn, seeds[start:end], max_steps),
+                                              daemon=True)
+            process.start()
+            worker_conn.close()
+            self.pipes.append((conn, start, end))
+            self.processes.append(process)
+    
+    def reset(self, seed=None, options=None):
+        """Reset every env, env i with seed + i when a seed is given"""
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        if self.pipes:
+            for conn, start, end in self.pipes:
+                conn.send(("reset", seeds[start:end]))
+            return self.gather([conn.recv() for conn, _, _ in self.pipes])
+        return self.reset_envs(seeds)
+    
+    def reset_envs(self, seeds):
+        results = [env.reset(seed=env_seed) for env, env_seed in zip(self.envs, seeds)]
+        return np.array([obs for obs, _ in results]), [info for _, info in results]
+    
+    def step(self, actions):
+        """Step env i with actions[i], returns (observations, rewards, terminated, truncated, infos)"""
+        if self.pipes:
+            for conn, start, end in self.pipes:
+                conn.send(("step", actions[start:end]))
+            return self.gather([conn.recv() for conn, _, _ in self.pipes])
+        observations, rewards, terminated, truncated, infos = [], [], [], [], []
+        for env, action in zip(self.envs, actions):
+            obs, reward, done, cut, info = env.step(int(action))
+            if done or cut:
+                info["final_info"] = dict(info)
+                info["final_observation"] = obs
+                obs, _ = env.reset()
+            observations.append(obs)
+            rewards.append(reward)
+            terminated.append(done)
+            truncated.append(cut)
+            infos.append(info)
+        return np.array(observations), np.array(rewards), np.array(terminated), np.array(truncated), infos
+    
+    def gather(self, results):
+        """Join the per-worker results of a reset() or step() back into whole batches"""
+        joined = []
+        for part in zip(*results):
+            if isinstance(part[0], list):
+                joined.append([item for items in part for item in items])  # infos
+            else:
+                joined.append(np.concatenate(part))
+        return tuple(joined)
+    
+    def close(self):
+        for conn, _, _ in self.pipes:
+            conn.send(("close", None))
+            conn.close()
+        for process in self.processes:
+            process.join()
+        self.pipes = []
+        self.processes = []
+
+def benchmark_env(num_envs=16, steps=1000, workers=None):
+    """Print environment steps per second for one env, a vector in this process and a worker pool"""
+    rng = random.Random(0)
+    actions = [[rng.randrange(len(ENV_ACTIONS)) for _ in range(num_envs)] for _ in range(steps)]
+    
+    env = DrivingEnv(seed=1)
+    env.reset()
+    start = time.perf_counter()
+    for batch in actions:
+        for action in batch:
+            _, _, terminated, truncated, _ = env.step(action)
+            if terminated or truncated:
+                env.reset()
+    elapsed = time.perf_counter() - start
+    print(f"single env:             {steps * num_envs / elapsed:9.0f} steps/s")
+    
+    workers = workers or os.cpu_count() or 1
+    for pool_size in sorted({1, workers}):
+        label = "vector, 1 process:" if pool_size == 1 else f"vector, {pool_size} workers:"
+        envs = VectorDrivingEnv(num_envs, seed=1, workers=pool_size)
+        envs.reset()
+        start = time.perf_counter()
+        for batch in actions:
+            envs.step(batch)
+        elapsed = time.perf_counter() - start
+        envs.close()
+        print(f"{label:<24}{steps * num_envs / elapsed:9.0f} steps/s ({num_envs} envs, {steps} steps)")
+
+# Benchmark scenarios
+# Each scenario plays a seeded GameState with the autopilot for a fixed number of frames, drawing
+# to the real display surface, and times every phase of the frame separately. Game over is
+# ignored so every scenario runs its full length. setup() tweaks the fresh state and tick() runs
+# before every frame to keep the scenario going (forcing spawns, collisions, etc).
+BENCH_PHASES = ["update", "collision", "warmup", "draw", "hud", "flip"]
+BENCH_FRAMES = 600
+BENCH_WARMUP_FRAMES = 60  # Not timed, lets sprite, text and road caches fill up
+
+def setup_stage_cruise(state):
+    state.stage_distance = float("inf")  # Stay on stage 1
+
+def setup_dense_traffic(state):
+    state.current_stage = 5
+    state.stage_distance = float("inf")
+    state.enemy_spawn_delay = 6
+    for i in range(20):
+        enemy = state.enemy_cars.spawn(300, state.camera_y - i * 40, state.rng.choice(CAR_COLORS), "enemy")
+        enemy.speed = state.rng.uniform(1, 4)
+
+def bridge_convoy(bridge_type):
+    """tick() that keeps a bridge of one type coming up the road every 40 frames"""
+    def tick(state):
+        state.bridge_spawn_timer = 0  # Only the scripted bridges
+        if state.frame % 40 == 0:
+            bridge = state.bridges.spawn(state.camera_y - 100, state.current_stage, state.rng)
+            bridge.bridge_type = bridge_type
+    return tick
+
+def tick_particle_storm(state):
+    # A crash burst ten times the size of a real one every 5 frames, a few thousand particles live
+    if state.frame % 5 == 0:
+        state.spawn_collision_particles(state.player.x + 15, state.player_screen_y + 25,
+                                        [RED, ORANGE, YELLOW, WHITE, SILVER], 300)
+
+def setup_spawn_stress(state):
+    state.enemy_spawn_delay = max(state.enemy_spawn_delay // 10, 1)
+    state.obstacle_spawn_delay = max(state.obstacle_spawn_delay // 10, 1)
+    state.pickup_spawn_delay = max(state.pickup_spawn_delay // 10, 1)
+    state.fuel_pump_spawn_delay = max(state.fuel_pump_spawn_delay // 10, 1)
+    state.scenery_spawn_delay = max(state.scenery_spawn_delay // 10, 1)
+
+def tick_spawn_stress(state):
+    state.bridge_spawn_delay = 48  # The game raises it back to 360 after every bridge
+
+def tick_stage_rush(state):
+    # Finish the stage every 150 frames, shortly after the previous banner goes away, with a bridge
+    # coming every 50 frames so each stage's bridge art is needed right away
+    state.bridge_spawn_delay = 50
+    if state.frame % 150 == 0:
+        state.distance_traveled = state.stage_distance
+
+# name -> (setup, tick)
+BENCH_SCENARIOS = OrderedDict([
+    ("stage1_cruise", (setup_stage_cruise, None)),
+    ("stage5_dense_traffic", (setup_dense_traffic, None)),
+    ("bridges_roman", (setup_stage_cruise, bridge_convoy("roman"))),
+    ("bridges_steel", (setup_stage_cruise, bridge_convoy("steel"))),
+    ("bridges_medieval", (setup_stage_cruise, bridge_convoy("medieval"))),
+    ("particle_storm", (setup_stage_cruise, tick_particle_storm)),
+    ("spawn_stress_10x", (setup_spawn_stress, tick_spawn_stress)),
+    ("stage_transitions", (None, tick_stage_rush)),
+])
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = min(len(sorted_values) - 1, max(0, int(math.ceil(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def run_bench_scenario(name, frames=BENCH_FRAMES, seed=1):
+    """Play one scenario and return its per-phase frame time stats in milliseconds"""
+    setup, tick = BENCH_SCENARIOS[name]
+    screen = get_screen()
+    state = GameState(seed=seed)
+    if setup:
+        setup(state)
+    timings = {phase: [] for phase in BENCH_PHASES}
+    clock = time.perf_counter
+    
+    for frame in range(BENCH_WARMUP_FRAMES + frames):
+        if tick:
+            tick(state)
+        inputs = autopilot_inputs(state)
+        t0 = clock()
+        state.handle_inputs(inputs)
+        state.update(inputs)
+        t1 = clock()
+        state.check_collisions()
+        t2 = clock()
+        state.finish_step()
+        t3 = clock()
+        if state.stage_message_active:
+            stage_warmup.run(state.current_stage)
+        t4 = clock()
+        draw_world(screen, state)
+        t5 = clock()
+        draw_state_hud(state)
+        t6 = clock()
+        pygame.display.update()
+        t7 = clock()
+        if frame >= BENCH_WARMUP_FRAMES:
+            # finish_step (timers, despawn) is counted as update
+            timings["update"].append(t1 - t0 + t3 - t2)
+            timings["collision"].append(t2 - t1)
+            timings["warmup"].append(t4 - t3)
+            timings["draw"].append(t5 - t4)
+            timings["hud"].append(t6 - t5)
+            timings["flip"].append(t7 - t6)
+    
+    result = {"frames": frames, "phases": {}}
+    totals = [sum(values) for values in zip(*timings.values())]
+    for phase, values in list(timings.items()) + [("total", totals)]:
+        values = sorted(value * 1000 for value in values)
+        result["phases"][phase] = {
+            "mean": round(sum(values) / len(values), 4),
+            "p95": round(percentile(values, 0.95), 4),
+            "p99": round(percentile(values, 0.99), 4),
+            "max": round(values[-1], 4),
+        }
+    result["entities"] = state.entity_stats()
+    result["particles"] = len(state.particles)
+    result["culling"] = {"drawn": viewport.drawn, "skipped": viewport.skipped}  # Last frame
+    return result
+
+def benchmark_suite(names=None, frames=BENCH_FRAMES, seed=1, out_path=None):
+    """Run the benchmark scenarios and print (and optionally save) a JSON report"""
+    report = {
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "numpy": load_numpy() and np.__version__,
+        "video_driver": pygame.display.get_driver(),
+        "entity_arrays": use_entity_arrays(),
+        "seed": seed,
+        "scenarios": OrderedDict(),
+    }
+    for name in names or BENCH_SCENARIOS:
+        report["scenarios"][name] = run_bench_scenario(name, frames, seed)
+    report["texture_atlas"] = texture_atlas.stats()
+    report["stage_warmup"] = stage_warmup.stats()
+    text = json.dumps(report, indent=2)
+    print(text)
+    if out_path:
+        with open(out_path, "w") as f:
+            f.write(text + "\n")
+    return report
+
+# Frame profiler
+# Toggled with F3 or enabled from the start with BNJ_PROFILE=1. While it is on, main_game runs the
+# frame through profile_tick() and profile_draw(), which time each phase (simulation phases summed
+# over the frame's ticks, drawing phases marked by draw_game itself), and an overlay shows a frame
+# time graph and the average per phase. The last PROFILER_HISTORY frames are kept in a ring buffer
+# and written as CSV (BNJ_PROFILE_CSV, default bnj_profile.csv) when the profiler is switched off
+# or the game ends. While it is off the loop only checks one flag.
+PROFILER_PHASES = ["player", "spawn", "entities", "collision", "timers", "road", "sprites", "bridges", "effects", "hud", "flip"]
+PROFILER_HISTORY = 600  # 10 seconds at 60 FPS
+PROFILER_GRAPH_FRAMES = 120
+PROFILER_GRAPH_HEIGHT = 60
+PROFILER_GRAPH_MS = 33.3  # Frame time at the top of the graph
+
+class FrameProfiler:
+    def __init__(self):
+        self.enabled = os.environ.get("BNJ_PROFILE", "") not in ("", "0")
+        self.csv_path = os.environ.get("BNJ_PROFILE_CSV", "bnj_profile.csv")
+        self.rows = deque(maxlen=PROFILER_HISTORY)  # (frame, total_ms, ms per phase...)
+        self.overlay = None
+        self.overlay_frame = -1
+    
+    def toggle(self):
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self.write_csv()
+    
+    def record(self, frame, durations):
+        durations = [duration * 1000 for duration in durations]
+        self.rows.append((frame, sum(durations)) + tuple(durations))
+    
+    def write_csv(self):
+        if not self.rows:
+            return
+        with open(self.csv_path, "w") as f:
+            f.write("frame,total_ms," + ",".join(phase + "_ms" for phase in PROFILER_PHASES) + "\n")
+            for row in self.rows:
+                f.write(str(row[0]) + "," + ",".join("%.4f" % value for value in row[1:]) + "\n")
+        self.rows.clear()
+    
+    def draw_overlay(self, screen):
+        # The breakdown text is only rebuilt every 15 frames, the graph every frame
+        if self.overlay is None or not self.rows or self.rows[-1][0] - self.overlay_frame >= 15:
+            self.overlay = self.render_breakdown()
+            self.overlay_frame = self.rows[-1][0] if self.rows else -1
+        x, y = 350, 90
+        screen.blit(self.overlay, (x, y))
+        
+        # Frame time graph, one 2px bar per frame, red when over the 60 FPS budget
+        graph_top = y + self.overlay.get_height() - PROFILER_GRAPH_HEIGHT - 4
+        budget_y = graph_top + PROFILER_GRAPH_HEIGHT - int(PROFILER_GRAPH_HEIGHT * 16.7 / PROFILER_GRAPH_MS)
+        pygame.draw.line(screen, DARK_GRAY, (x + 4, budget_y), (x + 4 + PROFILER_GRAPH_FRAMES * 2, budget_y))
+        rows = list(self.rows)[-PROFILER_GRAPH_FRAMES:]
+        for i, row in enumerate(rows):
+            bar = min(PROFILER_GRAPH_HEIGHT, int(row[1] / PROFILER_GRAPH_MS * PROFILER_GRAPH_HEIGHT))
+            bottom = graph_top + PROFILER_GRAPH_HEIGHT
+            color = GREEN if row[1] < 16.7 else RED
+            pygame.draw.line(screen, color, (x + 4 + i * 2, bottom), (x + 4 + i * 2, bottom - bar))
+    
+    def render_breakdown(self):
+        overlay = pygame.Surface((PROFILER_GRAPH_FRAMES * 2 + 8, 14 * (len(PROFILER_PHASES) + 2) + PROFILER_GRAPH_HEIGHT + 12), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        rows = list(self.rows)[-60:]
+        averages = [sum(row[i] for row in rows) / len(rows) if rows else 0 for i in range(1, len(PROFILER_PHASES) + 2)]
+        lines = [("FRAME", averages[0])] + list(zip(PROFILER_PHASES, averages[1:]))
+        for i, (name, value) in enumerate(lines):
+            color = YELLOW if i == 0 else WHITE
+            overlay.blit(render_text("%-10s%7.2f ms" % (name.upper(), value), color, 12), (4, 2 + i * 14))
+        culled = "DRAWN %d SKIPPED %d" % (viewport.drawn, viewport.skipped)
+        overlay.blit(render_text(culled, CYAN, 12), (4, 2 + len(lines) * 14))
+        return overlay
+
+profiler = None
+
+def get_profiler():
+    global profiler
+    if profiler is None:
+        profiler = FrameProfiler()
+    return profiler
+
+SIM_PHASE_COUNT = 5  # player, spawn, entities, collision, timers
+
+def profile_tick(state, inputs, totals):
+    """Run one simulation tick phase by phase, adding each phase's time to totals"""
+    clock = time.perf_counter
+    if not state.handle_inputs(inputs):
+        return
+    
+    marks = [clock()]
+    state.update_player(inputs)
+    state.update_stage()
+    marks.append(clock())
+    state.spawn_entities()
+    marks.append(clock())
+    state.move_entities()
+    marks.append(clock())
+    state.check_collisions()
+    marks.append(clock())
+    state.finish_step()
+    marks.append(clock())
+    for i, (start, end) in enumerate(zip(marks, marks[1:])):
+        totals[i] += end - start
+
+def profile_draw(screen, state, alpha, totals, profiler):
+    """Draw one frame phase by phase and record it along with the tick time that led up to it"""
+    clock = time.perf_counter
+    marks = [clock()]
+    draw_game(screen, state, alpha, lambda: marks.append(clock()))
+    
+    # The overlay itself is not part of any phase
+    profiler.draw_overlay(screen)
+    flip_start = clock()
+    mark_game_frame()
+    dirty_regions.add_all()  # The overlay sits over the whole window
+    dirty_regions.flush()
+    durations = totals + [end - start for start, end in zip(marks, marks[1:])]
+    durations.append(clock() - flip_start)
+    profiler.record(state.frame, durations)
+
+def main_game(hiscore_in):
+    screen = get_screen()
+    state = GameState(hiscore_in)
+    profiler = get_profiler()
+    timestep = FixedTimestep(state.tick_rate)
+    inputs = FrameInputs()
+    
+    #################################################################################################
+    # Main game loop
+    #################################################################################################
+    clock = pygame.time.Clock()
+    last_time = time.perf_counter()
+    dirty_regions.add_all()  # The first frame replaces whatever was on screen
+    
+    while True:
+        read_frame_inputs(inputs)
+        if inputs.profile:
+            profiler.toggle()
+            inputs.profile = False
+            dirty_regions.add_all()  # Show or clear the overlay
+        now = time.perf_counter()
+        timestep.add_time(now - last_time)
+        last_time = now
+        
+        # Run every whole tick that has built up since the last frame
+        totals = [0.0] * SIM_PHASE_COUNT
+        while timestep.ready():
+            timestep.consume()
+            if profiler.enabled:
+                profile_tick(state, inputs, totals)
+            else:
+                state.step(inputs)
+            inputs.clear_presses()
+            if state.gameover or state.paused:
+                break
+        
+        # Nothing moves while paused: show the pause message over the last frame once and
+        # sleep until P. The P press unpauses right here, the first frame after the wait has not
+        # built up a whole tick that could act on it
+        if state.paused:
+            menu_meter.show(screen.blit(get_pause_panel(), PAUSE_PANEL_RECT))
+            wait_for_key((K_p,))
+            state.paused = False
+            last_time = time.perf_counter()
+            dirty_regions.add_all()  # Clear the pause panel
+            continue
         
-        # Update HUD
-        print_hud(score, int(fuel), current_stage, hiscore, player.speed, lives, jump_cooldown, jump_cooldown_max)
+        # Bake the coming stages' assets while the stage banner is up, outside of drawing
+        if state.stage_message_active:
+            stage_warmup.run(state.current_stage)
         
-        pygame.display.update()
-        clock.tick(60)
+        if profiler.enabled:
+            profile_draw(screen, state, timestep.alpha(), totals, profiler)
+        else:
+            draw_game(screen, state, timestep.alpha())
+            mark_game_frame()
+            dirty_regions.flush()
+        clock.tick(RENDER_FPS)
         
         # Return score and hiscore when game over
-        if gameover:
-            # Save high score if it was beaten
-            is_new_hiscore = False
-            if score > hiscore:
-                hiscore = score
-                is_new_hiscore = True
-            return score, hiscore, gameover_reason
+        if state.gameover:
+            profiler.write_csv()
+            return state.result()
 
 ######################################################################################
 # MAIN GAME LOOP
 ######################################################################################
 
-game_state = "start"  # "start", "playing", "gameover"
-final_score = 0
-final_reason = "OUT OF FUEL"
-hiscore = 0  # High score persists only during runtime
+def play():
+    """Title screen, games and game over screens until the player quits"""
+    screen = get_screen()
+    game_state = "start"  # "start", "playing", "gameover"
+    final_score = 0
+    final_reason = "OUT OF FUEL"
+    hiscore = 0  # High score persists only during runtime
+    
+    # The title and game over screens are drawn once, then the loop sleeps until a key comes in
+    menu_meter.show(screen.blit(get_start_screen(hiscore), (0, 0)))
+    mark_first_frame()
+    
+    # Sprites are baked (or loaded from the disk cache) and NumPy imported while the title screen
+    # is already up, instead of before it or on the first game's first frame
+    prebake_sprites()
+    load_numpy()
+    if os.environ.get("BNJ_STARTUP_STATS"):
+        print(startup_report())
+    while True:
+        key = wait_for_key()
+        if game_state == "start" or key == K_SPACE:
+            # Start (or restart) the game
+            screen.fill(BLACK)
+            game_state = "playing"
+            final_score, hiscore, final_reason = main_game(hiscore)
+            game_state = "gameover"
+            
+            # Game over message over the final frame, only the panel goes to the window
+            menu_meter.show(compose_gameover(screen, final_score, final_reason))
+        elif key == K_ESCAPE:
+            # Quit the game
+            quit_game()
 
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == pygame.KEYDOWN:
-            if game_state == "start":
-                # Start the game
-                screen.fill(BLACK)
-                game_state = "playing"
-                final_score, hiscore, final_reason = main_game(hiscore)
-                game_state = "gameover"
-            elif game_state == "gameover":
-                if event.key == K_SPACE:
-                    # Restart the game
-                    screen.fill(BLACK)
-                    game_state = "playing"
-                    final_score, hiscore, final_reason = main_game(hiscore)
-                    game_state = "gameover"
-                elif event.key == K_ESCAPE:
-                    # Quit the game
-                    pygame.quit()
-                    sys.exit()
-    
-    # Display appropriate screen based on game state
-    if game_state == "start":
-        print_startgame(hiscore)
-    elif game_state == "gameover":
-        print_gameover(final_score, final_reason)
-        pygame.display.update()
+def benchmark_startup():
+    """Open the window, show the title screen, bake the sprites and report how long each step took"""
+    menu_meter.show(get_screen().blit(get_start_screen(0), (0, 0)))
+    mark_first_frame()
+    stats = prebake_sprites()
+    load_numpy()
+    print(startup_report())
+    print(f"sprites: {stats['sprites']} {stats['source']} in {stats['ms']:.1f} ms, cache {stats['cache']}")
+
+def main(argv=None):
+    """Run the benchmark or tool named on the command line, or play the game"""
+    args = sys.argv[1:] if argv is None else argv
+    headless = "--headless" in args or "--bench" in args  # Headless runs never open a window
     
-    time.sleep(0.016)  # Small delay to prevent excessive CPU usage
+    if "--bench-hud-text" in args:
+        benchmark_hud_text()
+    elif "--bench-road" in args:
+        benchmark_road_bounds()
+    elif "--bench-collisions" in args:
+        benchmark_collisions()
+    elif "--bench-blit" in args:
+        benchmark_blit_formats()
+    elif "--bench-menu" in args:
+        benchmark_menu_idle()
+    elif "--bench-startup" in args:
+        benchmark_startup()
+    elif "--headless" in args:
+        benchmark_headless()
+    elif "--bench-env" in args:
+        # --bench-env [num_envs] [--jobs N]
+        after = args[args.index("--bench-env") + 1:]
+        num_envs = int(after[0]) if after and after[0].isdigit() else 16
+        workers = int(args[args.index("--jobs") + 1]) if "--jobs" in args else None
+        benchmark_env(num_envs, workers=workers)
+    elif "--batch" in args:
+        # --batch [games] [--jobs N] [--set name=value ...] [--batch-out results.csv]
+        after = args[args.index("--batch") + 1:]
+        games = int(after[0]) if after and after[0].isdigit() else 1000
+        workers = int(args[args.index("--jobs") + 1]) if "--jobs" in args else None
+        settings = [args[i + 1] for i, arg in enumerate(args) if arg == "--set"]
+        out_path = args[args.index("--batch-out") + 1] if "--batch-out" in args else None
+        benchmark_batch(games, parse_batch_overrides(settings), workers, out_path)
+    elif "--bench" in args:
+        # --bench [scenario ...] [--bench-out report.json]
+        args = args[args.index("--bench") + 1:]
+        out_path = None
+        if "--bench-out" in args:
+            out_path = args[args.index("--bench-out") + 1]
+        names = [arg for arg in args if arg in BENCH_SCENARIOS]
+        get_screen(headless)
+        benchmark_suite(names, out_path=out_path)
+    else:
+        play()
+    pygame.quit()
+
+mark_startup("module")
+
+if __name__ == "__main__":
+    main()